@@ -0,0 +1,108 @@
+"""
+asyncio front end to the solutions, to embed them in an async service without
+blocking its event loop.
+
+The CPU bound parts run in a pool of worker processes which preload every day
+module. The number of requests in flight is bounded: the others wait for a slot
+before anything is sent to the pool, so a caller that goes away while waiting
+costs nothing. A part that is already running in a worker can't be interrupted,
+its slot is only freed once it finishes, even if its caller timed out.
+"""
+
+import asyncio
+import os
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Optional, Union
+
+from advent.server import SolverError, preload_days
+from advent.server import solve as solve_in_worker
+
+
+class Solver:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.max_workers
+        self.timeout = timeout
+        self.executor = ProcessPoolExecutor(self.max_workers, initializer=preload_days)
+        # asyncio primitives belong to a loop, so there's one semaphore per loop
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self) -> "Solver":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def solve(
+        self,
+        day_num: int,
+        part: str,
+        data: Union[bytes, str],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Solve a part of a day for the given input.
+
+        Raises asyncio.TimeoutError if it takes longer than the timeout, which
+        defaults to the one of the solver, and SolverError if the solution fails.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(loop)
+        await semaphore.acquire()
+
+        def release(_: Future) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(semaphore.release)
+
+        # This is what loop.run_in_executor() does, but the slot must be held until
+        # the worker is done rather than until the caller stops waiting
+        try:
+            future = self.executor.submit(solve_in_worker, day_num, part, data)
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(release)
+
+        # Cancelling the wrapper, on a timeout or by the caller, cancels the future
+        # if it hasn't started yet
+        response = await asyncio.wait_for(
+            asyncio.wrap_future(future),
+            self.timeout if timeout is None else timeout,
+        )
+        if "error" in response:
+            raise SolverError(response["error"])
+        return response["result"]
+
+
+_default_solver: Optional[Solver] = None
+
+
+def get_default_solver() -> Solver:
+    global _default_solver  # pylint: disable=global-statement
+    if _default_solver is None:
+        _default_solver = Solver()
+    return _default_solver
+
+
+async def solve(
+    day_num: int, part: str, data: Union[bytes, str], timeout: Optional[float] = None
+) -> Any:
+    """Solve a part of a day with the default solver, see Solver.solve()."""
+    return await get_default_solver().solve(day_num, part, data, timeout)
@@ -0,0 +1,121 @@
+"""
+Run one day over many input files in a pool of worker processes.
+
+The inputs are dispatched in chunks to amortize the inter-process overhead, and each
+worker imports the day module once, in its initializer, so that it stays warm for
+all the chunks it solves.
+"""
+
+import contextlib
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from advent.io import MappedInput
+from advent.limits import STATUS_ERROR, STATUS_OK, run_limited
+from advent.runner import PARTS, get_day_module, get_parse_hook
+
+# The day module of a worker process, set by init_worker
+_day_module: Optional[ModuleType] = None
+
+
+def find_inputs(patterns: Sequence[str]) -> List[Path]:
+    """Expand directories and glob patterns into a sorted list of input files."""
+    paths = set()
+    for pattern in patterns:
+        if Path(pattern).is_dir():
+            paths.update(p for p in Path(pattern).iterdir() if p.is_file())
+        else:
+            paths.update(Path(p) for p in glob.glob(pattern, recursive=True))
+    return sorted(p for p in paths if p.is_file())
+
+
+def init_worker(day_num: int) -> None:
+    global _day_module  # pylint: disable=global-statement
+    _day_module = get_day_module(day_num)
+
+
+def solve_part(day_module: ModuleType, path: Path, part: str) -> Any:
+    with MappedInput.open(path) as reader:
+        return getattr(day_module, part)(reader)
+
+
+def solve_input(
+    day_module: ModuleType,
+    path: Path,
+    parts: Sequence[str] = PARTS,
+    limits: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Solve the parts of a day for one input file, the outcome is a JSON friendly
+    record with the results, or the status and error of the part that failed.
+
+    The limits are the timeout and max_memory arguments of run_limited(), if
+    there are any each part runs in a child process.
+    """
+    record: Dict[str, Any] = {"input": str(path), "status": STATUS_OK}
+    start_t = time.perf_counter()
+    try:
+        # Some solutions print progress, keep stdout for the results
+        with contextlib.redirect_stdout(sys.stderr):
+            parse = get_parse_hook(day_module)
+            if limits:
+                for part in parts:
+                    outcome = run_limited(solve_part, day_module, path, part, **limits)
+                    if not outcome.ok:
+                        record.update(status=outcome.status, error=outcome.error)
+                        break
+                    record[part] = outcome.result
+            elif parse is not None:
+                with MappedInput.open(path) as reader:
+                    parsed = parse(reader)
+                for part in parts:
+                    record[part] = getattr(day_module, f"solve_{part}")(parsed)
+            else:
+                for part in parts:
+                    record[part] = solve_part(day_module, path, part)
+    except Exception as ex:  # pylint: disable=broad-except
+        record.update(status=STATUS_ERROR, error=repr(ex))
+    record["duration"] = time.perf_counter() - start_t
+    return record
+
+
+def solve_chunk(
+    paths: List[Path], parts: Sequence[str], limits: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Solve a chunk of inputs in a worker, with the day module from init_worker."""
+    return [solve_input(_day_module, path, parts, limits) for path in paths]
+
+
+def default_chunksize(n_inputs: int, jobs: int) -> int:
+    """Aim for about 4 chunks per worker, so that the load still balances."""
+    return max(1, min(64, n_inputs // (jobs * 4)))
+
+
+def run_batch(
+    day_num: int,
+    paths: Sequence[Path],
+    parts: Sequence[str] = PARTS,
+    jobs: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    limits: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Solve a day for each input, yielding the records as they complete."""
+    jobs = jobs or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = default_chunksize(len(paths), jobs)
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(day_num,)
+    ) as executor:
+        futures = [
+            executor.submit(solve_chunk, list(paths[i : i + chunksize]), parts, limits)
+            for i in range(0, len(paths), chunksize)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
@@ -0,0 +1,185 @@
+"""
+Benchmark helpers: repeated timing of the day solutions and summary statistics.
+"""
+
+import math
+import re
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+from advent.io import MappedInput
+from advent.runner import get_input_filename_for_day
+
+# The input of a part: the bytes of an input file, or a sequence of values
+InputData = Union[bytes, Sequence[Any]]
+
+
+@dataclass
+class Summary:
+    """Statistics over the timed repeats of one part, in microseconds."""
+
+    day_num: int
+    part: str
+    result: Any
+    min_us: float
+    median_us: float
+    p95_us: float
+    stddev_us: float
+    samples_us: List[float]
+    strategy: str = "default"
+    input_hash: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class ImportTime:
+    """One line of `python -X importtime`, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+R_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def read_input_data(day_num: int) -> bytes:
+    """Read the input for a day once so that I/O stays out of the timings."""
+    return get_input_filename_for_day(day_num).read_bytes()
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Percentile with linear interpolation between the closest ranks."""
+
+    ordered = sorted(samples)
+    if not ordered:
+        raise ValueError("Cannot compute the percentile of an empty sample")
+
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def fresh_input(data: InputData) -> Iterator[Any]:
+    """
+    A new reader over the input: a MappedInput over bytes, like the CLI hands the
+    days, or an iterator over the values of a sequence.
+    """
+    if isinstance(data, bytes):
+        return MappedInput(data)
+    return iter(data)
+
+
+def time_part(
+    part_fn: Callable[[Iterator[Any]], Any], data: InputData, warmup: int, repeat: int
+) -> Tuple[Any, List[float]]:
+    """
+    Run a part `warmup` times untimed, then `repeat` times timed.
+
+    Every run gets a fresh reader over the same input, see fresh_input(). Returns
+    the result and the samples in µs.
+    """
+    result = None
+    for _ in range(warmup):
+        result = part_fn(fresh_input(data))
+
+    samples = []
+    for _ in range(repeat):
+        reader = fresh_input(data)
+        start_t = time.perf_counter()
+        result = part_fn(reader)
+        samples.append((time.perf_counter() - start_t) * 1e6)
+
+    return result, samples
+
+
+def summarize(
+    day_num: int, part: str, result: Any, samples: List[float], **kwargs: Any
+) -> Summary:
+    return Summary(
+        day_num=day_num,
+        part=part,
+        result=result,
+        min_us=min(samples),
+        median_us=statistics.median(samples),
+        p95_us=percentile(samples, 95),
+        stddev_us=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        samples_us=samples,
+        **kwargs,
+    )
+
+
+def fit_power_law(sizes: Sequence[float], timings: Sequence[float]) -> float:
+    """
+    Fit timings = c * size^k with a least squares regression in log-log space,
+    and return the exponent k.
+
+    An exponent close to 1 means the timings scale linearly with the size, close
+    to 2 quadratically, etc.
+    """
+    if len(sizes) < 2:
+        raise ValueError("At least two sizes are needed to fit a power law")
+
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(t) for t in timings]
+    mean_x = statistics.mean(xs)
+    mean_y = statistics.mean(ys)
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum(
+        (x - mean_x) ** 2 for x in xs
+    )
+
+
+def startup_command(args: Sequence[str]) -> List[str]:
+    """The command line to run the CLI with the given arguments in a new interpreter."""
+    return [sys.executable, "-c", "from advent.cli import cli; cli()", *args]
+
+
+def time_startup(args: Sequence[str], repeat: int) -> List[float]:
+    """Run the CLI `repeat` times in a new interpreter, return the wall times in µs."""
+    samples = []
+    for _ in range(repeat):
+        start_t = time.perf_counter()
+        subprocess.run(
+            startup_command(args),
+            cwd=Path(__file__).parent.parent,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        samples.append((time.perf_counter() - start_t) * 1e6)
+    return samples
+
+
+def parse_importtime(output: str) -> List[ImportTime]:
+    """Parse the report of `python -X importtime`, ignoring any other output."""
+    imports = []
+    for line in output.splitlines():
+        m = R_IMPORTTIME.match(line)
+        if m:
+            self_us, cumulative_us, indent, module = m.groups()
+            depth = (len(indent) - 1) // 2
+            imports.append(ImportTime(module, int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def profile_startup(args: Sequence[str]) -> List[ImportTime]:
+    """Run the CLI once under `python -X importtime` and parse its report."""
+    command = startup_command(args)
+    completed = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]],
+        cwd=Path(__file__).parent.parent,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    return parse_importtime(completed.stderr)
@@ -0,0 +1,135 @@
+"""
+On-disk cache for the results of the day solutions.
+
+Results are keyed by a hash of the input file contents and of the source of the
+day module and of the advent modules it uses (advent.io, advent.grid...), so a
+change to any of them invalidates the cached results. The cache
+is bounded in size, the least recently used entries are evicted first.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+# Default cache size, results are tiny so this holds a lot of them
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+# Returned by ResultCache.get() on a cache miss, since None could be a result
+MISSING = object()
+
+
+def default_cache_dir() -> Path:
+    """The cache directory, can be overridden with ADVENT_CACHE_DIR."""
+    if "ADVENT_CACHE_DIR" in os.environ:
+        return Path(os.environ["ADVENT_CACHE_DIR"])
+    return Path(Path.home(), ".cache", "advent2020")
+
+
+def helper_modules(module: ModuleType) -> List[ModuleType]:
+    """
+    The advent modules that a module uses, directly or through other advent modules.
+
+    They are found in the globals of the modules: imported modules, and the modules
+    of the imported functions and classes.
+    """
+    found: Dict[str, ModuleType] = {}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            name = value.__name__ if isinstance(value, ModuleType) else None
+            if name is None:
+                name = getattr(value, "__module__", None)
+            if (
+                not isinstance(name, str)
+                or not name.startswith("advent.")
+                or name == module.__name__
+                or name in found
+            ):
+                continue
+
+            helper = sys.modules.get(name)
+            if helper is not None and getattr(helper, "__file__", None):
+                found[name] = helper
+                pending.append(helper)
+
+    return [found[name] for name in sorted(found)]
+
+
+def make_key(day_module: ModuleType, input_filename: Path) -> str:
+    """Hash the input file bytes and the source of the day module and its helpers."""
+    h = hashlib.sha256()
+    h.update(Path(day_module.__file__).read_bytes())
+    for helper in helper_modules(day_module):
+        h.update(b"\0")
+        h.update(helper.__name__.encode())
+        h.update(b"\0")
+        h.update(Path(helper.__file__).read_bytes())
+    h.update(b"\0")
+    h.update(Path(input_filename).read_bytes())
+    return h.hexdigest()
+
+
+class ResultCache:
+    def __init__(
+        self, directory: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str, part: str) -> Path:
+        return Path(self.directory, f"{key}-{part}.json")
+
+    def get(self, key: str, part: str) -> Any:
+        """Return the cached result for a part, or MISSING."""
+        path = self._path(key, part)
+        try:
+            with open(path) as f:
+                result = json.load(f)["result"]
+            # Bump the modification time, it's what the eviction is based on, the
+            # entry may have been evicted by another process since it was read
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, evicted or not an entry
+            return MISSING
+        return result
+
+    def put(self, key: str, part: str, result: Any) -> None:
+        """Store the result for a part, results that aren't JSON are skipped."""
+        try:
+            data = json.dumps({"result": result})
+        except TypeError:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key, part)
+
+        # Write then rename so a concurrent reader never sees a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(data)
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            total -= size
@@ -1,39 +1,1127 @@
 """
 Command line interface for advent of code 2020.
+
+Most invocations are short, so the commands import what they need when they run
+rather than all of it up front, `advent --list` doesn't even import a day module.
 """
 
-import importlib
+# pylint: disable=import-outside-toplevel
+
 import time
 from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import click
 
+from advent.runner import (
+    PARTS,
+    available_days,
+    get_day_module,
+    get_input_filename_for_day,
+    get_parse_hook,
+)
+
+if TYPE_CHECKING:
+    from advent.bench import Summary
+    from advent.history import History
+
+
+# How long --all-strategies gives each strategy by default, in seconds
+STRATEGY_TIMEOUT = 60.0
+
+
+class AdventGroup(click.Group):
+    """A command group that also accepts a bare day number, e.g. `advent 1`."""
+
+    def resolve_command(self, ctx, args):
+        if args and args[0].isdigit():
+            return "day", self.get_command(ctx, "day"), args
+        return super().resolve_command(ctx, args)
+
 
-def get_input_filename_for_day(day_num: int) -> Path:
-    """Return the Path to the input file for a given day."""
-    return Path(Path(__file__).parent.parent.absolute(), "data", f"day{day_num:02}.txt")
+def list_days(ctx: click.Context, _: click.Parameter, value: bool) -> None:
+    if not value or ctx.resilient_parsing:
+        return
+    for day_num in available_days():
+        click.echo(day_num)
+    ctx.exit()
 
 
-@click.command()
+@click.group(cls=AdventGroup)
+@click.option(
+    "--list",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=list_days,
+    help="List the days that have a solution and exit.",
+)
+def cli() -> None:
+    """Advent of Code 2020 solutions."""
+
+
+@cli.command()
 @click.argument("day_num", type=click.IntRange(min=1, max=25))
-def day(day_num: int) -> None:
-    """Run the first() and second() methods for a given day."""
+@click.option(
+    "--input",
+    "input_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Read this input file rather than data/dayNN.txt.",
+)
+@click.option("--no-cache", is_flag=True, help="Neither read nor write cached results.")
+@click.option("--refresh", is_flag=True, help="Recompute and overwrite cached results.")
+@click.option(
+    "--profile",
+    "profile_dir",
+    type=click.Path(file_okay=False, writable=True),
+    default=None,
+    help="Run under cProfile and write dayNN-<part>.pstats files to this directory.",
+)
+@click.option(
+    "--tracemalloc", "trace_malloc", is_flag=True, help="Report memory usage."
+)
+@click.option("--top", type=click.IntRange(min=1), default=10, show_default=True)
+@click.option(
+    "--stats", is_flag=True, help="Report the operation counts of the solutions."
+)
+@click.option(
+    "--trace",
+    "trace_file",
+    type=click.File("w"),
+    default=None,
+    help="Write a Chrome trace of the open, parse and solve phases to this file.",
+)
+@click.option(
+    "--strategy",
+    "strategy_name",
+    default=None,
+    help="Use this strategy for the parts that implement it.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Kill a part that runs for longer than this many seconds.",
+)
+@click.option(
+    "--max-memory",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Limit the memory of a part to this many MiB.",
+)
+def day(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
+    day_num: int,
+    input_path: Optional[str],
+    no_cache: bool,
+    refresh: bool,
+    profile_dir: Optional[str],
+    trace_malloc: bool,
+    top: int,
+    stats: bool,
+    trace_file,
+    strategy_name: Optional[str],
+    timeout: Optional[float],
+    max_memory: Optional[int],
+) -> None:
+    """
+    Run the first() and second() methods for a given day.
+
+    With --timeout or --max-memory each part runs in its own child process, and
+    the command fails if a part goes over a limit.
+    """
+    import contextlib
+
+    from advent.io import MappedInput
+
+    # The other helpers are only imported by the options that need them, a plain
+    # run only needs the cache
+    limited = timeout is not None or max_memory is not None
+    if limited and trace_file is not None:
+        raise click.UsageError(
+            "--trace can't be combined with --timeout or --max-memory"
+        )
 
     click.echo(f"🎄 Running Advent of Code for day {day_num} 🎄\n")
 
-    day_module = importlib.import_module(f"advent.days.day{day_num:02}")
+    if profile_dir is not None:
+        Path(profile_dir).mkdir(parents=True, exist_ok=True)
+
+    def call(name: str, fn: Callable[..., Any], arg: Any) -> Any:
+        """Call fn(arg), under the profilers that were asked for."""
+        reports = []
+
+        def profiled(arg: Any) -> Any:
+            if profile_dir is None:
+                return fn(arg)
+            from advent.profiling import profile_call
+
+            pstats_path = Path(profile_dir, f"day{day_num:02}-{name}.pstats")
+            result, report = profile_call(fn, arg, pstats_path=pstats_path, top=top)
+            reports.append(f"{pstats_path}\n{report}")
+            return result
+
+        def traced(arg: Any) -> Any:
+            if not trace_malloc:
+                return profiled(arg)
+            from advent.profiling import trace_memory
+
+            result, report = trace_memory(profiled, arg, top=top)
+            reports.append(report)
+            return result
+
+        with span(f"day{day_num:02}.{name}"):
+            if stats:
+                from advent import metrics
+
+                with metrics.collect() as counters:
+                    result = traced(arg)
+                if counters:
+                    reports.append(f"Operations:\n{metrics.format_counters(counters)}")
+            else:
+                result = traced(arg)
+
+        for report in reports:
+            click.echo(f"[{name}] {report}")
+        return result
+
+    def span(name: str, **args: Any) -> ContextManager[None]:
+        if trace_file is None:
+            return contextlib.nullcontext()
+        from advent import trace
+
+        return trace.span(name, **args)
+
+    def read_input(name: str) -> "MappedInput":
+        # The input is mapped, the lines are only read as the solutions go
+        # through them, so that is part of their spans
+        with span(f"day{day_num:02}.open", part=name):
+            return MappedInput.open(input_filename)
+
+    def call_with_input(name: str, fn: Callable[..., Any]) -> Any:
+        with read_input(name) as reader:
+            return call(name, fn, reader)
+
+    # Profiling is pointless on a cached result
+    if profile_dir is not None or trace_malloc or stats:
+        refresh = True
+
+    day_module = get_day_module(day_num)
+
+    overrides = {}
+    if strategy_name is not None:
+        from advent.strategies import get_strategies
+
+        for part in PARTS:
+            strategies = get_strategies(day_module, part)
+            if strategy_name in strategies:
+                overrides[part] = strategies[strategy_name]
+        if not overrides:
+            raise click.BadParameter(
+                f"No part of day {day_num} implements '{strategy_name}'",
+                param_hint="--strategy",
+            )
+
+    if input_path is not None:
+        input_filename = Path(input_path)
+    else:
+        input_filename = get_input_filename_for_day(day_num)
+    parse = get_parse_hook(day_module)
+    parsed = None
+
+    cache = cache_key = None
+    if not no_cache:
+        from advent.cache import ResultCache, make_key
+
+        cache = ResultCache()
+        cache_key = make_key(day_module, input_filename)
+
+    failures = 0
+
+    with contextlib.ExitStack() as stack:
+        if trace_file is not None:
+            from advent import trace
+
+            trace_events = stack.enter_context(trace.collect())
+        start_t = time.perf_counter()
+        part_t = start_t
+        for part in PARTS:
+            label = part.capitalize()
+            override = overrides.get(part)
+            if override is not None:
+                # Strategies agree on the answer, the point is to run this one
+                label = f"{label} [{strategy_name}]"
+            elif cache is not None and not refresh:
+                from advent.cache import MISSING
+
+                result = cache.get(cache_key, part)
+                if result is not MISSING:
+                    click.echo(f"{label}: {result} (cached)")
+                    continue
+
+            if limited:
+                from advent.limits import run_limited
+
+                # The parsed input can't be shared between the child processes
+                outcome = run_limited(
+                    call_with_input,
+                    part,
+                    override or getattr(day_module, part),
+                    timeout=timeout,
+                    max_memory=max_memory * 2**20 if max_memory else None,
+                )
+                if not outcome.ok:
+                    failures += 1
+                    click.echo(
+                        f"{label}: {outcome.status.upper()}, {outcome.error}"
+                        f" ({outcome.duration:.2f}s)"
+                    )
+                    part_t = time.perf_counter()
+                    continue
+                result = outcome.result
+            elif parse is not None and override is None:
+                if parsed is None:
+                    # Parse once and share the parsed input between both parts
+                    parsed = call_with_input("parse", parse)
+                    parse_t = time.perf_counter()
+                    click.echo(f"Parse: ({parse_t - part_t:.2f}s)")
+                    part_t = parse_t
+
+                result = call(part, getattr(day_module, f"solve_{part}"), parsed)
+            else:
+                result = call_with_input(part, override or getattr(day_module, part))
+
+            end_t = time.perf_counter()
+            click.echo(f"{label}: {result} ({end_t - part_t:.2f}s)")
+            part_t = end_t
+
+            if cache is not None and override is None:
+                cache.put(cache_key, part, result)
+
+        click.echo(f"\n✨ Done ({time.perf_counter() - start_t:.2f}s) ✨")
+
+    if trace_file is not None:
+        trace.write_trace(trace_file, trace_events, f"advent {day_num}")
+        click.echo(f"Trace written to {trace_file.name}")
+
+    if failures:
+        raise SystemExit(1)
+
+
+@cli.command(name="all")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes, defaults to the number of CPUs.",
+)
+def all_days(jobs: Optional[int]) -> None:
+    """Run every part of every day in a pool of worker processes."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    from advent.runner import PartResult, run_part
+
+    click.echo("🎄 Running Advent of Code for all days 🎄\n")
+
+    start_t = time.perf_counter()
+    results: List[PartResult] = []
+    errors = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(run_part, day_num, part): (day_num, part)
+            for day_num in available_days()
+            for part in PARTS
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as ex:  # pylint: disable=broad-except
+                errors[futures[future]] = ex
+    wall_t = time.perf_counter() - start_t
+
+    click.echo(f"{'Day':>3}  {'Part':<6}  {'Time':>8}  Result")
+    for r in sorted(results, key=lambda r: (r.day_num, PARTS.index(r.part))):
+        click.echo(f"{r.day_num:>3}  {r.part:<6}  {r.duration:>7.2f}s  {r.result}")
+    for (day_num, part), ex in sorted(errors.items()):
+        click.echo(f"{day_num:>3}  {part:<6}  {'-':>8}  Error: {ex!r}")
+
+    total_t = sum(r.duration for r in results)
+    click.echo(f"\n✨ Done ({wall_t:.2f}s, {total_t:.2f}s of work) ✨")
+
+    if errors:
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.argument("day_num", type=click.IntRange(min=1, max=25))
+@click.argument("inputs", nargs=-1, required=True)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes, defaults to the number of CPUs.",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of inputs sent to a worker at once.",
+)
+@click.option(
+    "--part", "parts", type=click.Choice(PARTS), multiple=True, help="Defaults to both."
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w"),
+    default="-",
+    help="Write the JSON lines to this file, defaults to stdout.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Kill a part that runs for longer than this many seconds.",
+)
+@click.option(
+    "--max-memory",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Limit the memory of a part to this many MiB.",
+)
+def batch(  # pylint: disable=too-many-arguments,too-many-locals
+    day_num: int,
+    inputs: Tuple[str, ...],
+    jobs: Optional[int],
+    chunksize: Optional[int],
+    parts: Tuple[str, ...],
+    output,
+    timeout: Optional[float],
+    max_memory: Optional[int],
+) -> None:
+    """
+    Solve a day for many inputs, given as files, directories or glob patterns.
+
+    Each result is written as a JSON line as soon as it completes, so the order
+    of the lines is not the order of the inputs.
+    """
+    import json
+
+    from advent.batch import find_inputs, run_batch
+    from advent.limits import STATUS_OK
+
+    paths = find_inputs(inputs)
+    if not paths:
+        raise click.BadParameter("No input files found", param_hint="INPUTS")
+
+    limits = {}
+    if timeout is not None:
+        limits["timeout"] = timeout
+    if max_memory is not None:
+        limits["max_memory"] = max_memory * 2**20
+
+    start_t = time.perf_counter()
+    errors = 0
+    for record in run_batch(day_num, paths, parts or PARTS, jobs, chunksize, limits):
+        errors += record["status"] != STATUS_OK
+        output.write(json.dumps(record, default=str) + "\n")
+        output.flush()
+
+    click.echo(
+        f"Solved {len(paths) - errors}/{len(paths)} inputs"
+        f" in {time.perf_counter() - start_t:.2f}s",
+        err=True,
+    )
+    if errors:
+        raise SystemExit(1)
+
 
-    input_filename = get_input_filename_for_day(day_num)
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Unix socket to listen on, defaults to $ADVENT_SOCKET.",
+)
+@click.option(
+    "--port", type=click.IntRange(min=1, max=65535), help="Listen on localhost instead."
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes, defaults to the number of CPUs.",
+)
+def serve(socket_path: Optional[str], port: Optional[int], jobs: Optional[int]) -> None:
+    """Solve requests from 'advent client' with the day modules kept warm."""
+    import functools
+    import signal
+    import sys
+
+    from advent.server import (
+        TCPSolverServer,
+        UnixSolverServer,
+        default_socket_path,
+        make_pool,
+    )
+
+    # The pool is replaced if one of its workers dies
+    make_executor = functools.partial(make_pool, jobs)
+    if port is not None:
+        server = TCPSolverServer(port, make_executor(), make_executor)
+    else:
+        path = Path(socket_path) if socket_path else default_socket_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        server = UnixSolverServer(path, make_executor(), make_executor)
+
+    click.echo(f"Listening on {server.server_address}", err=True)
+    # Shut down cleanly when stopped as a daemon too
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.executor.shutdown()
+
+
+@cli.command()
+@click.argument("day_num", type=click.IntRange(min=1, max=25))
+@click.argument(
+    "input_file", type=click.Path(exists=True, dir_okay=False), required=False
+)
+@click.option(
+    "--part", "parts", type=click.Choice(PARTS), multiple=True, help="Defaults to both."
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Unix socket of the server, defaults to $ADVENT_SOCKET.",
+)
+@click.option("--port", type=click.IntRange(min=1, max=65535))
+def client(
+    day_num: int,
+    input_file: Optional[str],
+    parts: Tuple[str, ...],
+    socket_path: Optional[str],
+    port: Optional[int],
+) -> None:
+    """Solve a day with 'advent serve', defaults to the day's puzzle input."""
+    from advent.server import Client
+
+    data = Path(input_file or get_input_filename_for_day(day_num)).read_bytes()
+    with Client(socket_path, port) as conn:
+        for part in parts or PARTS:
+            response = conn.request(day_num, part, data)
+            if "error" in response:
+                raise click.ClickException(f"{part}: {response['error']}")
+            click.echo(
+                f"{part.capitalize()}: {response['result']}"
+                f" ({response['duration']:.4f}s)"
+            )
+
+
+@cli.command()
+@click.argument("day_nums", nargs=-1, required=True, type=click.IntRange(min=1, max=25))
+@click.option("--warmup", type=click.IntRange(min=0), default=1, show_default=True)
+@click.option("--repeat", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option(
+    "--part", "parts", type=click.Choice(PARTS), multiple=True, help="Defaults to both."
+)
+@click.option(
+    "--json",
+    "json_output",
+    type=click.File("w"),
+    default=None,
+    help="Write the results as JSON to this file ('-' for stdout).",
+)
+@click.option(
+    "--size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Run on a generated input of this size instead of the puzzle input.",
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--strategy",
+    "strategy_names",
+    multiple=True,
+    help="Benchmark these strategies instead of the default ones.",
+)
+@click.option(
+    "--all-strategies",
+    is_flag=True,
+    help="Benchmark every strategy, check their answers agree and rank them.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0),
+    default=None,
+    help=(
+        "Run each strategy in a child process and give up on it after this many"
+        f" seconds, defaults to {STRATEGY_TIMEOUT:g} with --all-strategies."
+    ),
+)
+@click.option(
+    "--parse-only",
+    is_flag=True,
+    help="Only benchmark the parsing of the input, for the days that parse once.",
+)
+@click.option(
+    "--record/--no-record",
+    default=True,
+    show_default=True,
+    help="Store the results in the benchmark history.",
+)
+@click.option(
+    "--db",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Benchmark history database, defaults to $ADVENT_HISTORY_DB.",
+)
+@click.option(
+    "--compare",
+    "compare_rev",
+    default=None,
+    help="Compare with the results recorded for this git revision.",
+)
+@click.option("--alpha", type=float, default=0.05, show_default=True)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.05,
+    show_default=True,
+    help="Ignore slowdowns of the median smaller than this fraction.",
+)
+def bench(  # pylint: disable=too-many-arguments,too-many-locals
+    day_nums: Tuple[int, ...],
+    warmup: int,
+    repeat: int,
+    parts: Tuple[str, ...],
+    json_output,
+    size: Optional[int],
+    seed: int,
+    strategy_names: Tuple[str, ...],
+    all_strategies: bool,
+    timeout: Optional[float],
+    parse_only: bool,
+    record: bool,
+    db: Optional[str],
+    compare_rev: Optional[str],
+    alpha: float,
+    threshold: float,
+) -> None:
+    """Benchmark the parts of the given days, timings are in µs."""
+    import json
+    import platform
+
+    from advent.bench import read_input_data, summarize, time_part
+    from advent.gen import generate
+    from advent.history import hash_input
+    from advent.strategies import default_strategy_name, get_strategies
+
+    if timeout is None and all_strategies:
+        # Some strategies are only there for comparison on small inputs
+        timeout = STRATEGY_TIMEOUT
+    if timeout is not None:
+        from advent.limits import STATUS_TIMEOUT, run_limited
+
+    summaries = []
+    rankings = []
+    # day, part, strategy and outcome of the strategies that didn't finish
+    failures = []
+    errors = 0
+    for day_num in day_nums:
+        day_module = get_day_module(day_num)
+        if size is None:
+            data = read_input_data(day_num)
+        else:
+            data = "".join(generate(day_num, size, seed)).encode()
+        input_hash = hash_input(data)
+
+        parse = get_parse_hook(day_module)
+        if parse_only and parse is None:
+            raise click.BadParameter(
+                f"Day {day_num} doesn't parse its input once for both parts",
+                param_hint="--parse-only",
+            )
+        if parse is not None and (parse_only or not parts):
+            result, samples = time_part(parse, data, warmup, repeat)
+            summaries.append(
+                summarize(day_num, "parse", None, samples, input_hash=input_hash)
+            )
+        if parse_only:
+            continue
+
+        selected = 0
+        for part in parts or PARTS:
+            strategies = get_strategies(day_module, part)
+            if all_strategies:
+                names = list(strategies)
+            elif strategy_names:
+                names = [name for name in strategy_names if name in strategies]
+            else:
+                names = [default_strategy_name(day_module, part)]
+            selected += len(names)
+
+            part_summaries = []
+            for name in names:
+                if timeout is None:
+                    result, samples = time_part(strategies[name], data, warmup, repeat)
+                else:
+                    outcome = run_limited(
+                        time_part,
+                        strategies[name],
+                        data,
+                        warmup,
+                        repeat,
+                        timeout=timeout,
+                    )
+                    if not outcome.ok:
+                        failures.append((day_num, part, name, outcome))
+                        # Timing out is expected of the strategies only meant
+                        # for small inputs, failing isn't
+                        errors += outcome.status != STATUS_TIMEOUT
+                        continue
+                    result, samples = outcome.result
+                part_summaries.append(
+                    summarize(
+                        day_num,
+                        part,
+                        result,
+                        samples,
+                        strategy=name,
+                        input_hash=input_hash,
+                    )
+                )
+            summaries.extend(part_summaries)
+            if len(part_summaries) > 1:
+                rankings.append(part_summaries)
+
+        if not selected:
+            raise click.BadParameter(
+                f"No part of day {day_num} implements {', '.join(strategy_names)}",
+                param_hint="--strategy",
+            )
+
+    if json_output is not None:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "warmup": warmup,
+                "repeat": repeat,
+                "size": size,
+                "seed": seed,
+                "results": [s.to_dict() for s in summaries],
+                "failures": [
+                    {
+                        "day_num": day_num,
+                        "part": part,
+                        "strategy": name,
+                        "status": outcome.status,
+                        "error": outcome.error,
+                    }
+                    for day_num, part, name, outcome in failures
+                ],
+            },
+            json_output,
+            indent=2,
+            default=str,
+        )
+    else:
+        click.echo(
+            f"{'Day':>3}  {'Part':<6}  {'Strategy':<14}  {'min':>12}  {'median':>12}"
+            f"  {'p95':>12}  {'stddev':>12}"
+        )
+        for s in summaries:
+            click.echo(
+                f"{s.day_num:>3}  {s.part:<6}  {s.strategy:<14}  {s.min_us:>12.1f}"
+                f"  {s.median_us:>12.1f}  {s.p95_us:>12.1f}  {s.stddev_us:>12.1f}"
+            )
+        for day_num, part, name, outcome in failures:
+            click.echo(
+                f"{day_num:>3}  {part:<6}  {name:<14}  {outcome.status.upper()},"
+                f" {outcome.error}"
+            )
+
+    disagreements = 0
+    for part_summaries in rankings:
+        disagreements += rank_strategies(part_summaries)
+
+    regressions = record_and_compare(
+        summaries, record, db, compare_rev, alpha, threshold
+    )
+    if regressions or disagreements or errors:
+        raise SystemExit(1)
+
+
+def rank_strategies(summaries: List["Summary"]) -> int:
+    """
+    Rank the strategies of a part by their median time, and check that they all
+    give the same answer. Return the number of strategies that disagree.
+    """
+
+    reference = summaries[0]
+    disagreements = 0
+    ranked = sorted(summaries, key=lambda s: s.median_us)
+    click.echo(f"\nDay {reference.day_num} {reference.part}:", err=True)
+    for rank, s in enumerate(ranked, start=1):
+        agrees = s.result == reference.result
+        disagreements += not agrees
+        click.echo(
+            f"{rank:>3}. {s.strategy:<14}  {s.median_us / ranked[0].median_us:>8.2f}x"
+            + ("" if agrees else f"  MISMATCH: {s.result!r} != {reference.result!r}"),
+            err=True,
+        )
+    return disagreements
+
+
+def record_and_compare(  # pylint: disable=too-many-arguments
+    summaries: List["Summary"],
+    record: bool,
+    db: Optional[str],
+    compare_rev: Optional[str],
+    alpha: float,
+    threshold: float,
+) -> int:
+    """
+    Record benchmark results in the history and compare them with a revision,
+    return the number of regressions.
+    """
+    from advent.history import History, git_revision
+
+    if not record and compare_rev is None:
+        return 0
+
+    history = History(db)
+    regressions = 0
+    if compare_rev is not None:
+        # Compare before recording so the baseline is never the run just made.
+        regressions = compare_with_revision(
+            history, summaries, compare_rev, alpha, threshold
+        )
+
+    if record:
+        try:
+            revision = git_revision()
+        except ValueError:
+            revision = "unknown"
+        for s in summaries:
+            history.record(s, s.strategy, s.input_hash, revision)
+
+    return regressions
+
+
+def compare_with_revision(
+    history: "History",
+    summaries: List["Summary"],
+    compare_rev: str,
+    alpha: float,
+    threshold: float,
+) -> int:
+    """Compare benchmark results with a revision, return the number of regressions."""
+    import statistics
+
+    from advent.history import git_revision, mann_whitney_u
+
+    try:
+        baseline_rev = git_revision(compare_rev)
+    except ValueError as ex:
+        raise click.BadParameter(str(ex), param_hint="--compare")
+
+    click.echo(f"\nCompared with {baseline_rev[:12]}", err=True)
+    regressions = 0
+    for s in summaries:
+        label = f"{s.day_num:>3}  {s.part:<6}"
+        baseline = history.samples(
+            s.day_num, s.part, s.strategy, s.input_hash, baseline_rev
+        )
+        if not baseline:
+            click.echo(f"{label}  no baseline", err=True)
+            continue
+
+        _, p_value = mann_whitney_u(baseline, s.samples_us)
+        change = s.median_us / statistics.median(baseline) - 1
+        if p_value < alpha and change > threshold:
+            regressions += 1
+            status = "SLOWER"
+        else:
+            status = "ok"
+        click.echo(f"{label}  {status:<6}  {change:+7.1%}  p={p_value:.4f}", err=True)
+
+    return regressions
+
+
+@cli.command()
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+@click.option("--repeat", type=click.IntRange(min=1), default=10, show_default=True)
+@click.option(
+    "--top",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+    help="Number of slowest imports to report.",
+)
+@click.option(
+    "--record/--no-record",
+    default=True,
+    show_default=True,
+    help="Store the results in the benchmark history.",
+)
+@click.option(
+    "--db",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Benchmark history database, defaults to $ADVENT_HISTORY_DB.",
+)
+@click.option(
+    "--compare",
+    "compare_rev",
+    default=None,
+    help="Compare with the results recorded for this git revision.",
+)
+@click.option("--alpha", type=float, default=0.05, show_default=True)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.05,
+    show_default=True,
+    help="Ignore slowdowns of the median smaller than this fraction.",
+)
+def startup(  # pylint: disable=too-many-arguments
+    args: Tuple[str, ...],
+    repeat: int,
+    top: int,
+    record: bool,
+    db: Optional[str],
+    compare_rev: Optional[str],
+    alpha: float,
+    threshold: float,
+) -> None:
+    """
+    Benchmark the startup of the CLI, running it with ARGS (defaults to --list)
+    in a new interpreter, and report the slowest imports. Timings are in µs.
+
+    The results are recorded in the benchmark history as day 0, so that startup
+    regressions can be caught with --compare like the ones of the solutions.
+    """
+    from advent.bench import profile_startup, summarize, time_startup
+    from advent.history import hash_input
+
+    args = args or ("--list",)
+    samples = time_startup(args, repeat)
+    summary = summarize(0, "startup", None, samples, input_hash=hash_input(args))
+
+    click.echo(f"advent {' '.join(args)}")
+    click.echo(f"{'min':>12}  {'median':>12}  {'p95':>12}  {'stddev':>12}")
+    click.echo(
+        f"{summary.min_us:>12.1f}  {summary.median_us:>12.1f}"
+        f"  {summary.p95_us:>12.1f}  {summary.stddev_us:>12.1f}"
+    )
+
+    if top:
+        imports = profile_startup(args)
+        click.echo(f"\n{'self':>10}  {'cumulative':>10}  Import")
+        for imp in sorted(imports, key=lambda imp: imp.self_us, reverse=True)[:top]:
+            click.echo(
+                f"{imp.self_us:>10}  {imp.cumulative_us:>10}  {'  ' * imp.depth}"
+                f"{imp.module}"
+            )
+        total_us = sum(imp.cumulative_us for imp in imports if imp.depth == 0)
+        click.echo(f"{total_us:>10}  {'':>10}  Total")
+
+    if record_and_compare([summary], record, db, compare_rev, alpha, threshold):
+        raise SystemExit(1)
+
+
+@cli.command(name="day1-queries")
+@click.option(
+    "--targets",
+    "target_count",
+    type=click.IntRange(min=1),
+    default=100_000,
+    show_default=True,
+    help="Number of random targets to query.",
+)
+@click.option("-k", type=click.IntRange(min=1), default=2, show_default=True)
+@click.option(
+    "--size",
+    type=click.IntRange(min=5),
+    default=None,
+    help="Index a generated report of this size instead of the puzzle input.",
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--repeat", type=click.IntRange(min=1), default=5, show_default=True)
+def day1_queries(
+    target_count: int, k: int, size: Optional[int], seed: int, repeat: int
+) -> None:
+    """
+    Benchmark the day 1 expense index answering a batch of targets, every
+    combination of k expenses is found for each target. Timings are in µs.
+    """
+    import random
+
+    from advent.bench import summarize, time_part
+    from advent.days.day01 import ExpenseIndex
+    from advent.gen import generate
+    from advent.io import ints
+
+    if size is None:
+        with open(get_input_filename_for_day(1)) as reader:
+            expenses = ints(reader)
+    else:
+        expenses = ints(generate(1, size, seed))
 
     start_t = time.perf_counter()
-    with open(input_filename) as reader:
-        first_result = day_module.first(reader)
-    first_t = time.perf_counter()
-    click.echo(f"First: {first_result} ({first_t - start_t:.2f}s)")
+    index = ExpenseIndex(expenses)
+    index_us = (time.perf_counter() - start_t) * 1e6
+
+    # Targets in the range of the possible sums, most of them have no combination
+    rng = random.Random(seed)
+    low, high = k * index.values[0], k * index.values[-1]
+    targets = [rng.randint(low, high) for _ in range(target_count)]
+
+    def count_combinations(batch: Iterator[int]) -> int:
+        return sum(1 for _ in index.query(batch, k))
+
+    found, samples = time_part(count_combinations, targets, 0, repeat)
+    summary = summarize(1, "queries", found, samples)
+
+    click.echo(
+        f"{len(expenses)} expenses, {len(index.values)} distinct,"
+        f" indexed in {index_us:.1f}µs"
+    )
+    click.echo(f"{target_count} targets, {found} combinations of {k}")
+    click.echo(f"{'min':>12}  {'median':>12}  {'p95':>12}  {'stddev':>12}")
+    click.echo(
+        f"{summary.min_us:>12.1f}  {summary.median_us:>12.1f}"
+        f"  {summary.p95_us:>12.1f}  {summary.stddev_us:>12.1f}"
+    )
+
+
+@cli.command(name="gen")
+@click.argument("day_num", type=click.IntRange(min=1, max=25))
+@click.option("--size", type=click.IntRange(min=1), required=True)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--output", "-o", type=click.File("w"), default="-", show_default=True)
+def gen(day_num: int, size: int, seed: int, output) -> None:
+    """Generate a synthetic input for a given day."""
+    from advent.gen import generate
+
+    output.writelines(generate(day_num, size, seed))
+
+
+@cli.command()
+@click.argument("day_num", type=click.IntRange(min=1, max=25))
+@click.option("--start", type=click.IntRange(min=1), default=None, help="First size.")
+@click.option("--factor", type=click.FloatRange(min=1.1), default=2, show_default=True)
+@click.option("--steps", type=click.IntRange(min=2), default=6, show_default=True)
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option(
+    "--max-time",
+    type=float,
+    default=5,
+    show_default=True,
+    help="Stop growing the input once a run takes longer than this, in seconds.",
+)
+@click.option(
+    "--part", "parts", type=click.Choice(PARTS), multiple=True, help="Defaults to both."
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--strategy",
+    "strategy_name",
+    default=None,
+    help="Use this strategy for the parts that implement it.",
+)
+@click.option(
+    "--fail-above",
+    type=float,
+    default=None,
+    help="Exit with an error if an exponent is larger than this.",
+)
+def scale(  # pylint: disable=too-many-arguments,too-many-locals
+    day_num: int,
+    start: Optional[int],
+    factor: float,
+    steps: int,
+    repeat: int,
+    max_time: float,
+    parts: Tuple[str, ...],
+    seed: int,
+    strategy_name: Optional[str],
+    fail_above: Optional[float],
+) -> None:
+    """Time a day on growing generated inputs and fit the scaling exponent."""
+    from advent.bench import fit_power_law, time_part
+    from advent.gen import generate, get_scale_start
+    from advent.strategies import get_strategies
+
+    day_module = get_day_module(day_num)
+    start = start or get_scale_start(day_num)
+    sizes = sorted({round(start * factor**i) for i in range(steps)})
+
+    solvers = {part: getattr(day_module, part) for part in PARTS}
+    labels = dict.fromkeys(PARTS, "")
+    if strategy_name is not None:
+        for part in PARTS:
+            strategies = get_strategies(day_module, part)
+            if strategy_name in strategies:
+                solvers[part] = strategies[strategy_name]
+                labels[part] = f" [{strategy_name}]"
+        if not any(labels.values()):
+            raise click.BadParameter(
+                f"No part of day {day_num} implements '{strategy_name}'",
+                param_hint="--strategy",
+            )
+
+    too_steep = False
+    for part in parts or PARTS:
+        click.echo(f"Day {day_num} {part}{labels[part]}")
+        click.echo(f"{'size':>10}  {'min (µs)':>14}")
+
+        timed_sizes: List[int] = []
+        timings: List[float] = []
+        for size in sizes:
+            try:
+                data = "".join(generate(day_num, size, seed)).encode()
+            except ValueError as ex:
+                click.echo(f"{size:>10}  skipped: {ex}")
+                break
+
+            _, samples = time_part(solvers[part], data, 0, repeat)
+            timed_sizes.append(size)
+            timings.append(min(samples))
+            click.echo(f"{size:>10}  {min(samples):>14.1f}")
+
+            if min(samples) > max_time * 1e6:
+                break
+
+        if len(timed_sizes) < 2:
+            click.echo("Not enough sizes to fit an exponent\n")
+            continue
+
+        exponent = fit_power_law(timed_sizes, timings)
+        click.echo(f"Exponent: {exponent:.2f} (~O(n^{exponent:.1f}))\n")
 
-    with open(input_filename) as reader:
-        second_result = day_module.second(reader)
-    second_t = time.perf_counter()
-    click.echo(f"Second: {second_result} ({second_t - first_t:.2f}s)")
+        if fail_above is not None and exponent > fail_above:
+            too_steep = True
 
-    click.echo(f"\n✨ Done ({second_t - start_t:.2f}s) ✨")
+    if too_steep:
+        raise SystemExit(1)
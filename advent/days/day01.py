@@ -1,24 +1,226 @@
 import itertools as its
-from typing import Iterator
+import math
+from collections import Counter
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
+from advent.io import ints
+from advent.strategies import strategy
 
-def first_combinations(expense_input: Iterator[str]) -> int:
+TARGET = 2020
+
+
+class ExpenseIndex:
     """
-    The laziest approach.
+    An index of the expenses, built once to answer any number of queries: the
+    distinct values in ascending order, and how many times each value appears.
+
+    A value is used at most as many times as it appears, and duplicates don't
+    multiply the work. Pairs are looked up in the counts, and for k >= 3 the
+    smallest value is fixed in turn down to a pair, found with two pointers over the
+    sorted values.
+
+    Combinations are tuples of values in ascending order, each combination of values
+    is found once however many times its values appear in the expenses.
+    """
+
+    def __init__(self, expenses: Iterable[int]):
+        self.counts = Counter(expenses)
+        self.values = sorted(self.counts)
+
+    def find(self, target: int = TARGET, k: int = 2) -> Optional[Tuple[int, ...]]:
+        """The first combination of k expenses that add up to target, or None."""
+        return next(self.combinations(target, k), None)
+
+    def combinations(
+        self, target: int = TARGET, k: int = 2
+    ) -> Iterator[Tuple[int, ...]]:
+        """All the combinations of k expenses that add up to target, lazily."""
+        if k < 1:
+            raise ValueError(f"Expected at least one expense, got k={k}")
+
+        if k == 1:
+            return iter([(target,)] if self.counts[target] else [])
+        if k == 2:
+            return self._pairs(target)
+        return self._combinations(0, 0, target, k)
+
+    def query(
+        self, targets: Iterable[int], k: int = 2
+    ) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+        """Answer a batch of targets, yields each target with each of its combinations."""
+        for target in targets:
+            for combination in self.combinations(target, k):
+                yield target, combination
+
+    def _pairs(self, target: int) -> Iterator[Tuple[int, ...]]:
+        for value in self.values:
+            complement = target - value
+            if complement < value:
+                break
+            if complement == value:
+                if self.counts[value] >= 2:
+                    yield value, value
+            elif complement in self.counts:
+                yield value, complement
+
+    def _available(self, i: int, start: int, used: int) -> int:
+        """How many times values[i] can still be used, `used` applies to values[start]."""
+        return self.counts[self.values[i]] - (used if i == start else 0)
+
+    def _combinations(
+        self, start: int, used: int, target: int, k: int
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        The combinations of k of values[start:], where values[start] is already
+        used `used` times by the smaller values of the combination.
+        """
+        if k == 2:
+            yield from self._pairs_sorted(start, used, target)
+            return
+
+        if not self.values:
+            return
+
+        largest = self.values[-1]
+        for i in range(start, len(self.values)):
+            value = self.values[i]
+            if value * k > target:
+                # The other values of the combination are at least as large
+                break
+            if value + (k - 1) * largest < target:
+                continue
+
+            if self._available(i, start, used) > 1:
+                rest = self._combinations(
+                    i, (used if i == start else 0) + 1, target - value, k - 1
+                )
+            else:
+                rest = self._combinations(i + 1, 0, target - value, k - 1)
+            for combination in rest:
+                yield (value,) + combination
+
+    def _pairs_sorted(
+        self, start: int, used: int, target: int
+    ) -> Iterator[Tuple[int, ...]]:
+        values = self.values
+        low, high = start, len(values) - 1
+        while low <= high:
+            pair_sum = values[low] + values[high]
+            if pair_sum == target:
+                if low < high or self._available(low, start, used) >= 2:
+                    yield values[low], values[high]
+                low += 1
+                high -= 1
+            elif pair_sum < target:
+                low += 1
+            else:
+                high -= 1
+
+
+def find_sum(
+    expenses: Iterable[int], target: int = TARGET, k: int = 2
+) -> Optional[Tuple[int, ...]]:
+    """
+    Find k expenses that add up to target, in ascending order, or None if there is
+    no such combination.
+    """
+    return ExpenseIndex(expenses).find(target, k)
 
-    A smarter approach would be to keep track of the counts of each expense, and then
-    for each value look for the complement to add up to 2020.
 
-    This can be applied to the combination of 3 expenses by looking at an expense and
-    then finding a 2-combination that adds to the complement for this first expense.
+@strategy("first", "ksum")
+def first_ksum(expense_input: Iterator[str]) -> int:
+    found = find_sum(ints(expense_input), TARGET, 2)
+    if found is None:
+        raise ValueError("No combination of two expenses adds up to 2020")
+    return math.prod(found)
+
+
+@strategy("second", "ksum")
+def second_ksum(expense_input: Iterator[str]) -> int:
+    found = find_sum(ints(expense_input), TARGET, 3)
+    if found is None:
+        raise ValueError("No combination of three expenses adds up to 2020")
+    return math.prod(found)
+
+
+def read_expenses(expense_input: Iterable[str]) -> Iterator[int]:
+    """The expenses one at a time, as they are read."""
+    for line in expense_input:
+        if line.strip():
+            yield int(line)
+
+
+def find_pair_streaming(
+    expenses: Iterable[int], target: int = TARGET
+) -> Optional[Tuple[int, int]]:
+    """
+    Find the first pair of expenses that add up to target, stopping at the expense
+    that completes it. Only the distinct values seen so far are kept, the
+    complements of the expenses to come.
+    """
+    seen = set()
+    for expense in expenses:
+        if target - expense in seen:
+            return target - expense, expense
+        seen.add(expense)
+    return None
+
+
+def find_triple_streaming(
+    expenses: Iterable[int], target: int = TARGET
+) -> Optional[Tuple[int, int, int]]:
+    """
+    Find the first triple of expenses that add up to target, stopping at the expense
+    that completes it.
+
+    The sums of the pairs of expenses seen so far are kept in an index, so each new
+    expense is checked with a single lookup, and then paired with the distinct
+    values seen. The index grows with the square of the number of distinct values.
+    """
+    seen = set()
+    pair_sums: Dict[int, Tuple[int, int]] = {}
+    for expense in expenses:
+        pair = pair_sums.get(target - expense)
+        if pair is not None:
+            return pair + (expense,)
+
+        if expense in seen:
+            # A value pairs with itself once it's been seen twice
+            pair_sums.setdefault(2 * expense, (expense, expense))
+        else:
+            for value in seen:
+                pair_sums.setdefault(value + expense, (value, expense))
+            seen.add(expense)
+    return None
+
+
+@strategy("first", "streaming")
+def first_streaming(expense_input: Iterator[str]) -> int:
+    found = find_pair_streaming(read_expenses(expense_input), TARGET)
+    if found is None:
+        raise ValueError("No combination of two expenses adds up to 2020")
+    return math.prod(found)
+
+
+@strategy("second", "streaming")
+def second_streaming(expense_input: Iterator[str]) -> int:
+    found = find_triple_streaming(read_expenses(expense_input), TARGET)
+    if found is None:
+        raise ValueError("No combination of three expenses adds up to 2020")
+    return math.prod(found)
+
+
+@strategy("first", "combinations")
+def first_combinations(expense_input: Iterator[str]) -> int:
+    """
+    The laziest approach.
 
-    The input is small enough that it's not worth the data structure gymnastics, but
-    the complexity of looking at all the combinations would not be good for larger
-    data sets.
+    The input is small enough for this, but the complexity of looking at all the
+    combinations is not good for larger data sets, see `find_sum` for that.
 
     """
 
-    expenses = [int(line) for line in expense_input]
+    expenses = ints(expense_input)
 
     for c in its.combinations(expenses, 2):
         if sum(c) == 2020:
@@ -27,10 +229,11 @@ def first_combinations(expense_input: Iterator[str]) -> int:
     raise ValueError("No combination of two expenses adds up to 2020")
 
 
+@strategy("second", "combinations")
 def second_combinations(expense_input: Iterator[str]) -> int:
     """Same approach, but this looks at 3-combinations."""
 
-    expenses = [int(line) for line in expense_input]
+    expenses = ints(expense_input)
 
     for c in its.combinations(expenses, 3):
         if sum(c) == 2020:
@@ -38,5 +241,5 @@ def second_combinations(expense_input: Iterator[str]) -> int:
     raise ValueError("No combination of three expenses adds up to 2020")
 
 
-first = first_combinations
-second = second_combinations
+first = first_ksum
+second = second_ksum
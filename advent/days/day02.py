@@ -1,26 +1,11 @@
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
-
-def first(entries: Iterator[str]) -> int:
-    """Count the number of valid entries."""
-    count = 0
-    for entry in entries:
-        if is_entry_valid_first(entry):
-            count += 1
-
-    return count
-
-
-def second(entries: Iterator[str]) -> int:
-    """Count the number of valid entries."""
-    count = 0
-    for entry in entries:
-        if is_entry_valid_second(entry):
-            count += 1
-
-    return count
+from advent.io import MappedInput, map_range, split_lines
+from advent.strategies import strategy
 
 
 @dataclass
@@ -32,6 +17,203 @@ class PasswordPolicy:
     letter: str
 
 
+# <first value>-<second value> <letter>: <password>, the password runs to the end of
+# the line, blanks around the entry are ignored
+R_ENTRY = re.compile(
+    r"[ \t]*(?P<first_value>\d+)-(?P<second_value>\d+) (?P<letter>[a-z]): "
+    r"(?P<password>\S*)[ \t]*\r?$"
+)
+R_POLICY = re.compile(r"(?P<first_value>\d+)-(?P<second_value>\d+) (?P<letter>[a-z])")
+
+# The same, on a whole line, anything else that isn't blank is invalid
+R_LINE = re.compile(
+    r"^[ \t]*(?:(\d+)-(\d+) ([a-z]): (\S*)[ \t]*|(.*?\S.*?))\r?$", re.MULTILINE
+)
+R_LINE_BYTES = re.compile(R_LINE.pattern.encode(), re.MULTILINE)
+
+Entry = Tuple[PasswordPolicy, str]
+
+# The first value, the second value, the letter and the password of an entry
+Fields = Tuple[int, int, str, str]
+
+# The number of valid entries with the first and the second policy
+Counts = Tuple[int, int]
+
+# Below this size, starting the worker processes costs more than scanning the file
+PARALLEL_MIN_SIZE = 2**20
+
+# Chunks per worker, so that a worker that is done early can pick up another one
+CHUNKS_PER_JOB = 4
+
+
+def parse(entries: Iterator[str]) -> List[Fields]:
+    """
+    Parse the fields of the entries, for both parts.
+
+    A mapped input is decoded and matched as a whole, other readers are matched a
+    line at a time.
+    """
+    if isinstance(entries, MappedInput):
+        matches = R_LINE.finditer(entries.read_bytes().decode())
+    else:
+        matches = (m for m in map(R_LINE.match, entries) if m is not None)
+    return list(entry_fields(matches))
+
+
+def first(entries: Iterator[str]) -> int:
+    return solve_first(parse(entries))
+
+
+def second(entries: Iterator[str]) -> int:
+    return solve_second(parse(entries))
+
+
+def solve_first(entries: List[Fields]) -> int:
+    return sum(
+        1
+        for low, high, letter, password in entries
+        if low <= password.count(letter) <= high
+    )
+
+
+def solve_second(entries: List[Fields]) -> int:
+    # Slices are empty for positions outside of the password
+    return sum(
+        1
+        for low, high, letter, password in entries
+        if (password[low - 1 : low] == letter) != (password[high - 1 : high] == letter)
+    )
+
+
+def entry_fields(matches: Iterable[re.Match]) -> Iterator[Fields]:
+    """The fields of the entries matched by R_LINE or R_LINE_BYTES."""
+    for m in matches:
+        first_value, second_value, letter, password, invalid = m.groups()
+        if invalid is not None:
+            raise ValueError(f"Unable to parse entry {invalid!r}")
+        yield int(first_value), int(second_value), letter, password
+
+
+@strategy("first", "single-pass")
+def first_single_pass(entries: Iterator[str]) -> int:
+    return count_valid(entries)[0]
+
+
+@strategy("second", "single-pass")
+def second_single_pass(entries: Iterator[str]) -> int:
+    return count_valid(entries)[1]
+
+
+def count_valid(entries: Iterable[str]) -> Counts:
+    """
+    Count the valid entries with both policies, in a single pass.
+
+    A mapped input is matched as a whole, without decoding it into lines, other
+    readers are matched a line at a time.
+    """
+    if isinstance(entries, MappedInput):
+        return count_matches(R_LINE_BYTES.finditer(entries.read_bytes()))
+    return count_matches(m for m in map(R_LINE.match, entries) if m is not None)
+
+
+def count_valid_range(path: str, start: int, end: int) -> Counts:
+    """Count the valid entries of the lines from byte start to end of a file."""
+    with open(path, "rb") as f:
+        data, offset = map_range(f, start, end)
+    with data:
+        try:
+            return count_matches(
+                R_LINE_BYTES.finditer(data, offset, offset + end - start)
+            )
+        except ValueError as ex:
+            # Raised once the with block is left, the traceback refers to the
+            # matches, and a mapping can't be closed while they use it
+            error = str(ex)
+    raise ValueError(error)
+
+
+def count_valid_parallel(
+    path: Union[str, "os.PathLike[str]"],
+    jobs: Optional[int] = None,
+    chunks: Optional[int] = None,
+    start: int = 0,
+) -> Counts:
+    """
+    Count the valid entries of a file, from the line at offset `start`, with both
+    policies. The file is split in chunks of lines that are validated by a pool of
+    `jobs` processes (one per CPU by default).
+
+    The workers only get the offsets of their chunk, and map that part of the file
+    themselves, so there are no lines to send them, only their counts to add up.
+    """
+    path = os.fspath(path)
+    jobs = jobs or os.cpu_count() or 1
+    ranges = split_lines(path, chunks or jobs * CHUNKS_PER_JOB, start)
+    if len(ranges) <= 1 or jobs == 1:
+        counts = [count_valid_range(path, start, end) for start, end in ranges]
+    else:
+        with ProcessPoolExecutor(min(jobs, len(ranges))) as pool:
+            starts, ends = zip(*ranges)
+            counts = list(
+                pool.map(count_valid_range, [path] * len(ranges), starts, ends)
+            )
+
+    return sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+
+def count_valid_chunked(entries: Iterable[str]) -> Counts:
+    """
+    Count the valid entries in parallel when they are mapped from a file large
+    enough for it, with count_valid() otherwise. Like count_valid(), this starts
+    from the current line of the reader.
+    """
+    if not isinstance(entries, MappedInput) or entries.path is None:
+        return count_valid(entries)
+
+    start = entries.tell()
+    if os.path.getsize(entries.path) - start < PARALLEL_MIN_SIZE:
+        return count_valid(entries)
+    return count_valid_parallel(entries.path, start=start)
+
+
+@strategy("first", "parallel")
+def first_parallel(entries: Iterator[str]) -> int:
+    return count_valid_chunked(entries)[0]
+
+
+@strategy("second", "parallel")
+def second_parallel(entries: Iterator[str]) -> int:
+    return count_valid_chunked(entries)[1]
+
+
+def count_matches(matches: Iterable[re.Match]) -> Counts:
+    """
+    Count the valid entries matched by R_LINE or R_LINE_BYTES with both policies,
+    checked as the entries are read, without keeping them.
+    """
+    first_count = second_count = 0
+    for low, high, letter, password in entry_fields(matches):
+        if low <= password.count(letter) <= high:
+            first_count += 1
+        # Slices are empty for positions outside of the password
+        if (password[low - 1 : low] == letter) != (password[high - 1 : high] == letter):
+            second_count += 1
+
+    return first_count, second_count
+
+
+def parse_entry(entry: str) -> Entry:
+    """Parse an entry with a single match for both the policy and the password."""
+    m = R_ENTRY.match(entry)
+    if not m:
+        raise ValueError(f"Unable to parse entry '{entry.strip()}'")
+
+    policy = PasswordPolicy(
+        int(m.group("first_value")), int(m.group("second_value")), m.group("letter")
+    )
+    return policy, m.group("password")
+
+
 def parse_policy(policy_str: str) -> PasswordPolicy:
     """
     Parse the policy from a policy string.
@@ -41,9 +223,7 @@ def parse_policy(policy_str: str) -> PasswordPolicy:
     <min count>-<max count> <letter>
 
     """
-    m = re.match(
-        r"(?P<first_value>\d+)-(?P<second_value>\d+) (?P<letter>[a-z])", policy_str
-    )
+    m = R_POLICY.match(policy_str)
     groups = m.groupdict()
     return PasswordPolicy(
         int(groups["first_value"]), int(groups["second_value"]), groups["letter"]
@@ -52,10 +232,10 @@ def parse_policy(policy_str: str) -> PasswordPolicy:
 
 def is_entry_valid_first(entry: str) -> bool:
     """Tests whether an entry is valid."""
+    return is_password_valid_first(*parse_entry(entry))
 
-    policy_str, password = entry.strip().split(": ")
-    policy = parse_policy(policy_str)
 
+def is_password_valid_first(policy: PasswordPolicy, password: str) -> bool:
     count = 0
     for letter in password:
         if letter == policy.letter:
@@ -66,10 +246,10 @@ def is_entry_valid_first(entry: str) -> bool:
 
 def is_entry_valid_second(entry: str) -> bool:
     """Tests whether an entry is valid with the second password policy logic."""
+    return is_password_valid_second(*parse_entry(entry))
 
-    policy_str, password = entry.strip().split(": ")
-    policy = parse_policy(policy_str)
 
+def is_password_valid_second(policy: PasswordPolicy, password: str) -> bool:
     count_valid = 0
     if get_password_letter_safe(password, policy.first_value - 1) == policy.letter:
         count_valid += 1
@@ -1,5 +1,11 @@
 from dataclasses import dataclass
-from typing import Iterator, List
+from typing import Iterator
+
+import numpy as np
+
+from advent.grid import Grid
+
+TREE = ord("#")
 
 
 @dataclass
@@ -8,18 +14,6 @@ class Position:
     column: int
 
 
-@dataclass
-class Grid:
-    """
-    I'm going with a more functional representation as opposed to making the grid an object,
-    although in this case it would work well with an OO approach too 🤷‍♂️.
-    """
-
-    data: List[str]
-    width: int
-    height: int
-
-
 def first(grid_str: Iterator[str]) -> int:
     return count_trees_in_slope(get_grid(grid_str), 3, 1)
 
@@ -36,37 +30,27 @@ def second(grid_str: Iterator[str]) -> int:
 
 
 def count_trees_in_slope(g: Grid, right: int, down: int) -> int:
-    """Count the number of trees encountered with a given slope."""
-
-    p = Position(0, 0)
+    """
+    Count the number of trees encountered with a given slope.
 
-    def is_tree(pt):
-        return get_cell(g, pt) == "#"
+    The grid repeats itself to the right, so all the positions on the slope can be
+    looked up at once.
+    """
 
-    tree_count = 0
-    while p.row < g.height:
-        if is_tree(p):
-            tree_count += 1
-        p.column += right
-        p.row += down
+    rows = np.arange(0, g.height, down)
+    columns = np.arange(len(rows)) * right
 
-    return tree_count
+    return int(np.count_nonzero(g.wrap(rows, columns) == TREE))
 
 
 def get_grid(grid_str: Iterator[str]) -> Grid:
-    """Get a grid from a grid representation."""
-
-    data = []
-    width = None
-    height = 0
-    for row in grid_str:
-        row = row.strip()
-        if width is None:
-            width = len(row)
-        data.extend(row)
-        height += 1
-
-    return Grid(data, width, height)
+    """
+    Get a grid from a grid representation, as wide as its first row, the cells
+    past that width are left out.
+    """
+    rows = [line.strip() for line in grid_str]
+    width = len(rows[0]) if rows else 0
+    return Grid.from_lines(row[:width] for row in rows)
 
 
 def get_cell(grid: Grid, p: Position) -> str:
@@ -79,8 +63,4 @@ def get_cell(grid: Grid, p: Position) -> str:
     if p.row >= grid.height:
         raise ValueError("Row outside of the grid")
 
-    row = p.row
-    col = p.column % grid.width
-
-    index = row * grid.width + col
-    return grid.data[index]
+    return chr(grid.wrap(p.row, p.column))
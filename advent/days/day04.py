@@ -1,5 +1,7 @@
 import re
-from typing import Any, Iterator, List, Tuple
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from advent.io import records
 
 REQUIRED_FIELDS = set(
     [
@@ -15,13 +17,19 @@ REQUIRED_FIELDS = set(
 )
 
 
+R_HGT = re.compile(r"^(?P<measure>\d+)(?P<unit>cm|in)$")
+R_HCL = re.compile(r"^#[0-9a-f]{6}$")
+R_ECL = re.compile(r"^(amb|blu|brn|gry|grn|hzl|oth)$")
+R_PID = re.compile(r"^[0-9]{9}$")
+
+
 def valid_hgt(value: str) -> bool:
     """
     hgt (Height) - a number followed by either cm or in:
     If cm, the number must be at least 150 and at most 193.
     If in, the number must be at least 59 and at most 76.
     """
-    m = re.match(r"^(?P<measure>\d+)(?P<unit>cm|in)$", value)
+    m = R_HGT.match(value)
     if not m:
         return False
 
@@ -38,9 +46,9 @@ RULES = {
     "iyr": lambda value: 2010 <= int(value) <= 2020,
     "eyr": lambda value: 2020 <= int(value) <= 2030,
     "hgt": valid_hgt,
-    "hcl": lambda value: re.match(r"^#[0-9a-f]{6}$", value),
-    "ecl": lambda value: re.match(r"^(amb|blu|brn|gry|grn|hzl|oth)$", value),
-    "pid": lambda value: re.match(r"^[0-9]{9}$", value),
+    "hcl": R_HCL.match,
+    "ecl": R_ECL.match,
+    "pid": R_PID.match,
 }
 
 
@@ -93,27 +101,13 @@ def is_valid_second(passport: str) -> bool:
     return True
 
 
-def get_passports_from_input(passports_dirty: List[str]) -> List[str]:
+def get_passports_from_input(passports_dirty: Iterable[str]) -> Iterator[str]:
     """
-    The input data is separated by empty lines, this method returns a list
-    of passports represented as single line strings.
+    The input data is separated by empty lines, this method yields the
+    passports represented as single line strings.
     """
-    passports = []
-    passport = ""
-    for line in passports_dirty:
-        line = line.strip()
-        if not line:
-            if passport:
-                passports.append(passport.strip())
-                passport = ""
-        else:
-            passport += " " + line
-
-    # Add the last one
-    if passport:
-        passports.append(passport.strip())
-
-    return passports
+    for record in records(passports_dirty):
+        yield " ".join(record)
 
 
 def get_fields(passport: str) -> List[Tuple[str, str]]:
@@ -1,6 +1,8 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Iterator, List
+from typing import Dict, Iterator
+
+from advent.io import records
 
 
 @dataclass
@@ -9,32 +11,16 @@ class Group:
     people_count: int
 
 
-def parse_input(puzzle_input: Iterator[str]) -> List[Group]:
+def parse_input(puzzle_input: Iterator[str]) -> Iterator[Group]:
     """Get the count of answers per group."""
 
-    groups = []
-
-    people_count = 0
-    answers = defaultdict(lambda: 0)
-    for line in puzzle_input:
-        line = line.strip()
-
-        if not line:
-            groups.append(Group(answers, people_count))
-            # Reset
-            answers = defaultdict(lambda: 0)
-            people_count = 0
-            continue
-
-        people_count += 1
-        for question in line:
-            answers[question] += 1
-
-    # Add the last group if needed
-    if people_count:
-        groups.append(Group(answers, people_count))
+    for record in records(puzzle_input):
+        answers = defaultdict(lambda: 0)
+        for line in record:
+            for question in line:
+                answers[question] += 1
 
-    return groups
+        yield Group(answers, len(record))
 
 
 def first(puzzle_input: Iterator[str]) -> int:
@@ -5,6 +5,11 @@ from typing import Dict, Iterator, List, Tuple
 
 ParsedInput = List[Tuple[str, List[Tuple[int, str]]]]
 
+# shiny gold bags contain 1 dark olive bag, 2 vibrant plum bags.
+R_RULE = re.compile(r"^(?P<container>.*?) bags contain (?P<contained>.*?)\.$")
+# 1 dark olive bag
+R_BAG = re.compile(r"(?P<count>\d+) (?P<color>.+?) bags?")
+
 
 @dataclass
 class BagRule:
@@ -13,11 +18,20 @@ class BagRule:
     must_contain: List[Tuple[int, str]]
 
 
+def parse(puzzle_input: Iterator[str]) -> Dict[str, BagRule]:
+    """Parse the input into the set of bag rules shared by both parts."""
+    return make_rules(parse_input(puzzle_input))
+
+
 def first(puzzle_input: Iterator[str]) -> int:
+    return solve_first(parse(puzzle_input))
+
+
+def second(puzzle_input: Iterator[str]) -> int:
+    return solve_second(parse(puzzle_input))
 
-    parsed_input = parse_input(puzzle_input)
-    rules = make_rules(parsed_input)
 
+def solve_first(rules: Dict[str, BagRule]) -> int:
     target_color = "shiny gold"
 
     # Find all possible colors that can contain a shiny gold bag
@@ -47,10 +61,7 @@ def first(puzzle_input: Iterator[str]) -> int:
     return len(found)
 
 
-def second(puzzle_input: Iterator[str]) -> int:
-    parsed_input = parse_input(puzzle_input)
-    rules = make_rules(parsed_input)
-
+def solve_second(rules: Dict[str, BagRule]) -> int:
     @lru_cache
     def total_contained(color: str) -> int:
         return sum(
@@ -93,14 +104,16 @@ def parse_input(puzzle_input: Iterator[str]) -> ParsedInput:
         if not line:
             continue
         # shiny gold bags contain 1 dark olive bag, 2 vibrant plum bags
-        m = re.match(r"^(?P<container>.*?) bags contain (?P<contained>.*?)\.$", line)
+        m = R_RULE.match(line)
 
         if not m:
             raise ValueError(f"Unable to parse line '{line}'")
 
         # 1 dark olive bag, 2 vibrant plum bags
-        bag_counts = re.findall(r"\d.*?bag", m.group("contained"))
-        contained_bags = [get_count_and_color(bag_match) for bag_match in bag_counts]
+        contained_bags = [
+            (int(bag.group("count")), bag.group("color"))
+            for bag in R_BAG.finditer(m.group("contained"))
+        ]
 
         parsed.append((m.group("container"), contained_bags))
     return parsed
@@ -108,7 +121,7 @@ def parse_input(puzzle_input: Iterator[str]) -> ParsedInput:
 
 def get_count_and_color(bag_match: str) -> Tuple[int, str]:
     # 5 faded blue bag
-    m = re.match(r"^(?P<count>\d+) (?P<color>.*) bags?$", bag_match)
+    m = R_BAG.fullmatch(bag_match)
     if not m:
         raise ValueError(f"Unable to parse bag '{bag_match}'")
     return (int(m.group("count")), m.group("color"))
@@ -2,6 +2,10 @@ import re
 from dataclasses import dataclass
 from typing import Iterator, List
 
+from advent import metrics
+
+R_INSTRUCTION = re.compile(r"(?P<operation>\w{3}) (?P<argument>[+-]\d+)")
+
 
 @dataclass
 class Instruction:
@@ -39,6 +43,9 @@ class Runner:
         return self.accumulator
 
     def _next(self) -> None:
+        if metrics.ENABLED:
+            metrics.incr("day08.instructions")
+
         instruction = self.instructions[self.position]
         op = instruction.operation
         arg = instruction.argument
@@ -56,13 +63,28 @@ class Runner:
         self.position += arg
 
 
+def parse(puzzle_input: Iterator[str]) -> List[Instruction]:
+    return parse_instructions(puzzle_input)
+
+
 def first(puzzle_input: Iterator[str]) -> int:
-    runner = Runner(parse_instructions(puzzle_input))
-    return runner.run_until_loop()
+    return solve_first(parse(puzzle_input))
 
 
 def second(puzzle_input: Iterator[str]) -> int:
-    for program in possible_programs(parse_instructions(puzzle_input)):
+    return solve_second(parse(puzzle_input))
+
+
+def solve_first(instructions: List[Instruction]) -> int:
+    runner = Runner(instructions)
+    return runner.run_until_loop()
+
+
+def solve_second(instructions: List[Instruction]) -> int:
+    for program in possible_programs(instructions):
+        if metrics.ENABLED:
+            metrics.incr("day08.programs")
+
         runner = Runner(program)
         runner.run_until_loop()
 
@@ -91,7 +113,7 @@ def parse_instructions(instructions: Iterator[str]) -> List[Instruction]:
     for line in instructions:
         line = line.strip()
 
-        m = re.match(r"(?P<operation>\w{3}) (?P<argument>[+-]\d+)", line)
+        m = R_INSTRUCTION.match(line)
 
         if not m:
             raise ValueError(f"Unable to parse instruction '{line}'")
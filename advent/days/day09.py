@@ -1,14 +1,26 @@
 from itertools import combinations
 from typing import Iterator, List
 
+from advent.io import ints
+
+
+def parse(puzzle_input: Iterator[str]) -> List[int]:
+    return ints(puzzle_input)
+
 
 def first(puzzle_input: Iterator[str]) -> int:
-    numbers = [int(line.strip()) for line in puzzle_input]
-    return find_first_invalid_num(numbers, 25)
+    return solve_first(parse(puzzle_input))
 
 
 def second(puzzle_input: Iterator[str]) -> int:
-    numbers = [int(line.strip()) for line in puzzle_input]
+    return solve_second(parse(puzzle_input))
+
+
+def solve_first(numbers: List[int]) -> int:
+    return find_first_invalid_num(numbers, 25)
+
+
+def solve_second(numbers: List[int]) -> int:
     first_invalid_num = find_first_invalid_num(numbers, 25)
     contiguous_numbers = find_contiguous_sum_to(numbers, first_invalid_num)
     return min(contiguous_numbers) + max(contiguous_numbers)
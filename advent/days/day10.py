@@ -1,13 +1,15 @@
 from typing import Iterator, List
 
+from advent.io import ints
+
 
 def first(puzzle_input: Iterator[str]) -> int:
-    counts = find_jolt_diff_counts(int(n.strip()) for n in puzzle_input)
+    counts = find_jolt_diff_counts(ints(puzzle_input))
     return counts[0] * counts[2]
 
 
 def second(puzzle_input: Iterator[str]) -> int:
-    return count_arrangements(int(n.strip()) for n in puzzle_input)
+    return count_arrangements(ints(puzzle_input))
 
 
 def find_jolt_diff_counts(adapters: List[int]) -> List[int]:
@@ -1,6 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterator, List, Optional
+from typing import Iterator, Optional
+
+import numpy as np
+
+from advent import metrics
+from advent.grid import Grid
 
 
 class Cell(Enum):
@@ -24,110 +29,122 @@ class Cell(Enum):
         return "#"
 
 
+CODES = {"L": Cell.EMPTY.value, "#": Cell.OCCUPIED.value, ".": Cell.FLOOR.value}
+
+DIRECTIONS = [
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+]
+
+
 @dataclass
 class WaitingArea:
-    width: int
-    height: int
-    grid: List[Cell]
+    grid: Grid
 
     # Question specific parameters
     see_only_immediate: bool
     busy_count: int
 
-    def step(self) -> None:
-        """Update the waiting area after applying the rules once"""
-
-        changes = []
+    # For each direction and each cell, the index of the neighbor of the cell
+    neighbors: np.ndarray = field(init=False, repr=False)
 
-        for n, cell in enumerate(self.grid):
-            occupied_neighbors = self.count_occupied_neighbors(n)
-            if cell == Cell.EMPTY and occupied_neighbors == 0:
-                changes.append((n, Cell.OCCUPIED))
-            elif cell == Cell.OCCUPIED and occupied_neighbors >= self.busy_count:
-                changes.append((n, Cell.EMPTY))
+    def __post_init__(self):
+        self.neighbors = self.find_neighbors()
 
-        # Apply the changes
-        for n, cell in changes:
-            self.grid[n] = cell
+    @property
+    def width(self) -> int:
+        return self.grid.width
 
-        return len(changes)
+    @property
+    def height(self) -> int:
+        return self.grid.height
 
-    def get_cell(self, row: int, column: int) -> Optional[Cell]:
-        """Get the content of a cell at a given row and column"""
-
-        if 0 <= row < self.height and 0 <= column < self.width:
-            return self.grid[row * self.width + column]
-
-        return None
+    def find_neighbors(self) -> np.ndarray:
+        """
+        Find the neighbor of every cell in every direction, which is the first seat
+        seen or the next cell, depending on see_only_immediate.
 
-    def get_first_seat_in_direction(
-        self, n: int, row_delta: int, column_delta: int
-    ) -> Optional[Cell]:
-        """Get the first seat seen in a given direction
+        The seats never move, so this is done once, and the rules can then be applied
+        to all the cells at once. Cells without a neighbor in a direction point past
+        the last cell, to a slot that is never occupied.
+        """
 
-        A direction is represented by row_delta, column_delta.
+        rows, columns = np.indices(self.grid.shape).reshape(2, -1)
+        is_seat = self.grid.cells != Cell.FLOOR.value
+        missing = self.grid.cells.size
+
+        neighbors = np.full((len(DIRECTIONS), missing), missing, dtype=np.intp)
+        for d, (row_delta, column_delta) in enumerate(DIRECTIONS):
+            looking = np.arange(missing)
+            distance = 1
+            while looking.size:
+                row = rows[looking] + distance * row_delta
+                column = columns[looking] + distance * column_delta
+                inside = (
+                    (0 <= row)
+                    & (row < self.height)
+                    & (0 <= column)
+                    & (column < self.width)
+                )
+                looking, row, column = looking[inside], row[inside], column[inside]
+
+                found = is_seat[row, column] | self.see_only_immediate
+                neighbors[d, looking[found]] = row[found] * self.width + column[found]
+
+                looking = looking[~found]
+                distance += 1
+
+        return neighbors
+
+    def step(self) -> int:
+        """Update the waiting area after applying the rules once"""
 
-        For example the "top left" direction is:
-            - row_delta = -1
-            - column_delta = -1
+        cells = self.grid.cells.reshape(-1)
 
-        """
+        if metrics.ENABLED:
+            metrics.incr("day11.steps")
+            metrics.incr("day11.cells", cells.size)
 
-        row = n // self.width
-        column = n % self.width
+        occupied = np.append(cells == Cell.OCCUPIED.value, False)
+        occupied_neighbors = occupied[self.neighbors].sum(axis=0)
 
-        row += row_delta
-        column += column_delta
-        cell = self.get_cell(row, column)
+        to_occupy = (cells == Cell.EMPTY.value) & (occupied_neighbors == 0)
+        to_empty = (cells == Cell.OCCUPIED.value) & (
+            occupied_neighbors >= self.busy_count
+        )
 
-        while not self.see_only_immediate and cell is not None:
-            if cell != Cell.FLOOR:
-                break
+        # Apply the changes
+        cells[to_occupy] = Cell.OCCUPIED.value
+        cells[to_empty] = Cell.EMPTY.value
 
-            # If the cell is floor, we keep looking
-            row += row_delta
-            column += column_delta
-            cell = self.get_cell(row, column)
+        return int(np.count_nonzero(to_occupy) + np.count_nonzero(to_empty))
 
-        return cell
+    def get_cell(self, row: int, column: int) -> Optional[Cell]:
+        """Get the content of a cell at a given row and column"""
 
-    def count_occupied_neighbors(self, n: int) -> int:
-        neighbors = [
-            self.get_first_seat_in_direction(n, -1, -1),
-            self.get_first_seat_in_direction(n, -1, 0),
-            self.get_first_seat_in_direction(n, -1, 1),
-            self.get_first_seat_in_direction(n, 0, -1),
-            self.get_first_seat_in_direction(n, 0, 1),
-            self.get_first_seat_in_direction(n, 1, -1),
-            self.get_first_seat_in_direction(n, 1, 0),
-            self.get_first_seat_in_direction(n, 1, 1),
-        ]
+        if 0 <= row < self.height and 0 <= column < self.width:
+            return Cell(self.grid[row, column])
 
-        return sum(1 for c in neighbors if c == Cell.OCCUPIED)
+        return None
 
     @classmethod
     def from_input(
         cls, waiting_area_str: Iterator[str], see_only_immediate: bool, busy_count: int
     ):
-        height = 0
-        grid = []
-
-        for line in waiting_area_str:
-            line = line.strip()
-            height += 1
-            width = len(line)
-            grid += [Cell.from_str(position) for position in line]
-
-        return cls(width, height, grid, see_only_immediate, busy_count)
+        grid = Grid.from_lines(
+            (line.strip() for line in waiting_area_str), CODES, strict=True
+        )
+        return cls(grid, see_only_immediate, busy_count)
 
     def __repr__(self):
         """Return a printable string representing the status of the waiting area"""
-        grid_s = [str(c) for c in self.grid]
-
-        return "\n".join(
-            "".join(grid_s[self.width * row : self.width * row + self.width])
-            for row in range(self.height)
-        )
+        return "\n".join(self.grid.to_lines(CODES))
 
 
 def first(puzzle_input: Iterator[str]) -> int:
@@ -138,7 +155,7 @@ def first(puzzle_input: Iterator[str]) -> int:
         has_changes = waiting_area.step() > 0
 
     # Count the number of occupied seats
-    return sum(1 for cell in waiting_area.grid if cell == Cell.OCCUPIED)
+    return waiting_area.grid.count(Cell.OCCUPIED.value)
 
 
 def second(puzzle_input: Iterator[str]) -> int:
@@ -149,4 +166,4 @@ def second(puzzle_input: Iterator[str]) -> int:
         has_changes = waiting_area.step() > 0
 
     # Count the number of occupied seats
-    return sum(1 for cell in waiting_area.grid if cell == Cell.OCCUPIED)
+    return waiting_area.grid.count(Cell.OCCUPIED.value)
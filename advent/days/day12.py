@@ -12,6 +12,8 @@ import re
 from dataclasses import dataclass
 from typing import Iterator, List, Tuple
 
+R_INSTRUCTION = re.compile(r"^(?P<instr>[NSEWLRF])(?P<value>\d+)$")
+
 
 @dataclass
 class Ship:
@@ -79,8 +81,19 @@ class Waypoint:
 Instruction = Tuple[str, int]
 
 
+def parse(puzzle_input: Iterator[str]) -> List[Instruction]:
+    return parse_input(puzzle_input)
+
+
 def first(puzzle_input: Iterator[str]) -> int:
-    instructions = parse_input(puzzle_input)
+    return solve_first(parse(puzzle_input))
+
+
+def second(puzzle_input: Iterator[str]) -> int:
+    return solve_second(parse(puzzle_input))
+
+
+def solve_first(instructions: List[Instruction]) -> int:
     s = Ship()
 
     for instr, value in instructions:
@@ -100,8 +113,7 @@ def first(puzzle_input: Iterator[str]) -> int:
     return abs(s.lon) + abs(s.lat)
 
 
-def second(puzzle_input: Iterator[str]) -> int:
-    instructions = parse_input(puzzle_input)
+def solve_second(instructions: List[Instruction]) -> int:
     s = Ship()
     wp = Waypoint()
 
@@ -130,7 +142,7 @@ def parse_input(puzzle_input: Iterator[str]) -> List[Instruction]:
 
     for line in puzzle_input:
         line = line.strip()
-        m = re.match(r"^(?P<instr>[NSEWLRF])(?P<value>\d+)$", line)
+        m = R_INSTRUCTION.match(line)
         instructions.append((m.group("instr"), int(m.group("value"))))
 
     return instructions
@@ -1,5 +1,7 @@
 from typing import Iterator, List, Tuple
 
+from advent.strategies import strategy
+
 
 def first(puzzle_input: Iterator[str]) -> int:
     arrival_t, frequencies = parse_input(puzzle_input)
@@ -18,6 +20,7 @@ def first(puzzle_input: Iterator[str]) -> int:
     return (departure_t - arrival_t) * bus_id
 
 
+@strategy("second", "brute")
 def second_brute(puzzle_input: Iterator[str]) -> int:
 
     _, frequencies = parse_input(puzzle_input)
@@ -41,15 +44,13 @@ def second_brute(puzzle_input: Iterator[str]) -> int:
     n = 1
     to_test = sorted_fdelta[1:]
     while True:
-        if n % 1000000 == 0:
-            print(n * sorted_fdelta[0][0])
         t = n * sorted_fdelta[0][0]
         if all((t + delta) % f == 0 for f, delta in to_test):
             break
         n += 1
 
     # The t we have includes the time delta to the largest (for ex. 4 minutes for 59)
-    return t + frequencies_with_delta[0][1]
+    return t - largest_index
 
 
 def crt_progression(x, p) -> int:
@@ -59,6 +60,7 @@ def crt_progression(x, p) -> int:
         n += 1
 
 
+@strategy("second", "crt")
 def second_crt(puzzle_input: Iterator[str]) -> int:
 
     _, frequencies = parse_input(puzzle_input)
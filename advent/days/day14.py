@@ -1,11 +1,22 @@
 import itertools as its
 import math
 import re
-from typing import Generator, Iterator
+from typing import Generator, Iterator, List, Tuple, Union
 
 PROGRAM_INT_BIT_SIZE = 36
 ALL_ONES = (1 << PROGRAM_INT_BIT_SIZE) - 1
 
+# Both instructions with a single pattern, mem[8] = 11 or mask = XXXXXXXXXXXX1XXXX0X
+R_INSTRUCTION = re.compile(
+    r"^(?:mem\[(?P<address>\d+)\] = (?P<value>\d+)|mask = (?P<mask>[X01]+))$"
+)
+
+CMD_MEM = "mem"
+CMD_MASK = "mask"
+
+# ("mem", address, value) or ("mask", mask)
+Instruction = Union[Tuple[str, int, int], Tuple[str, str]]
+
 
 def binstr_to_int(binstr: str) -> int:
     return sum(int(j) << i for i, j in enumerate(reversed(binstr)))
@@ -31,7 +42,7 @@ def overwrite_bit(value: int, bit_value: int, bit_position: int) -> int:
 
 
 class DockingProgramRunner:
-    def __init__(self, program: Iterator[str], version: int = 1):
+    def __init__(self, instructions: List[Instruction], version: int = 1):
         self.memory = {}
         self.version = version
 
@@ -44,46 +55,19 @@ class DockingProgramRunner:
         self.mask_0s = int(math.pow(2, PROGRAM_INT_BIT_SIZE)) - 1
         self.mask = ""
 
-        self.parse_program(program)
+        self.instructions = instructions
 
     def run(self):
         # Run all the things
-        for cmd_fn, args in self.instructions:
-            cmd_fn(*args)
+        for command, *args in self.instructions:
+            if command == CMD_MEM:
+                self.instr_write(*args)
+            else:
+                self.instr_update_mask(*args)
 
     def get_sum(self):
         return sum(v for v in self.memory.values())
 
-    def parse_program(self, program):
-        self.instructions = []
-
-        for line in program:
-            line = line.strip()
-            m = re.match(r"^(?P<command>[a-z]+)", line)
-
-            if not m:
-                raise ValueError(f"Unable to parse line `{line}`")
-
-            command = m.group("command")
-
-            if command == "mem":
-                m = re.match(r"^mem\[(?P<address>\d+)\] = (?P<value>\d+)$", line)
-                if not m:
-                    raise ValueError(f"Unable to parse line `{line}`")
-
-                address = m.group("address")
-                value = m.group("value")
-
-                self.instructions.append((self.instr_write, [int(address), int(value)]))
-
-            elif command == "mask":
-                m = re.match(r"^mask = (?P<value>[X01]+)$", line)
-                if not m:
-                    raise ValueError(f"Unable to parse line `{line}`")
-
-                value = m.group("value")
-                self.instructions.append((self.instr_update_mask, [value]))
-
     def instr_write(self, address: int, value: int) -> None:
 
         if self.version == 1:
@@ -131,15 +115,47 @@ class DockingProgramRunner:
             yield new_value
 
 
+def parse_program(program: Iterator[str]) -> List[Instruction]:
+    instructions = []
+
+    for line in program:
+        line = line.strip()
+        m = R_INSTRUCTION.match(line)
+
+        if not m:
+            raise ValueError(f"Unable to parse line `{line}`")
+
+        if m.lastgroup == "mask":
+            instructions.append((CMD_MASK, m.group("mask")))
+        else:
+            instructions.append(
+                (CMD_MEM, int(m.group("address")), int(m.group("value")))
+            )
+
+    return instructions
+
+
+def parse(puzzle_input: Iterator[str]) -> List[Instruction]:
+    return parse_program(puzzle_input)
+
+
 def first(puzzle_input: Iterator[str]) -> int:
-    runner = DockingProgramRunner(puzzle_input)
+    return solve_first(parse(puzzle_input))
+
+
+def second(puzzle_input: Iterator[str]) -> int:
+    return solve_second(parse(puzzle_input))
+
+
+def solve_first(instructions: List[Instruction]) -> int:
+    runner = DockingProgramRunner(instructions)
     runner.run()
 
     return runner.get_sum()
 
 
-def second(puzzle_input: Iterator[str]) -> int:
-    runner = DockingProgramRunner(puzzle_input, version=2)
+def solve_second(instructions: List[Instruction]) -> int:
+    runner = DockingProgramRunner(instructions, version=2)
     runner.run()
 
     return runner.get_sum()
@@ -3,6 +3,8 @@ import re
 from dataclasses import dataclass
 from typing import Iterator, List, Tuple
 
+from advent import trace
+
 
 @dataclass(eq=True, frozen=True)
 class FieldRule:
@@ -52,6 +54,7 @@ def parse_ticket(ticket_str: str) -> Ticket:
     return [int(n) for n in ticket_str.split(",")]
 
 
+@trace.traced("day16.parse_input")
 def parse_input(
     puzzle_input: Iterator[str],
 ) -> Tuple[List[FieldRule], Ticket, List[Ticket]]:
@@ -132,8 +135,23 @@ def find_rules_for_tickets(
     return [next(iter(candidates)) for candidates in candidate_rules]
 
 
+ParsedInput = Tuple[List[FieldRule], Ticket, List[Ticket]]
+
+
+def parse(puzzle_input: Iterator[str]) -> ParsedInput:
+    return parse_input(puzzle_input)
+
+
 def first(puzzle_input: Iterator[str]) -> int:
-    rules, _, nearby_tickets = parse_input(puzzle_input)
+    return solve_first(parse(puzzle_input))
+
+
+def second(puzzle_input: Iterator[str]) -> int:
+    return solve_second(parse(puzzle_input))
+
+
+def solve_first(parsed_input: ParsedInput) -> int:
+    rules, _, nearby_tickets = parsed_input
 
     # Flatten all the ticket fields since we're considering them individually
     flattened_ticket_values: List[int] = []
@@ -145,8 +163,8 @@ def first(puzzle_input: Iterator[str]) -> int:
     )
 
 
-def second(puzzle_input: Iterator[str]) -> int:
-    rules, my_ticket, nearby_tickets = parse_input(puzzle_input)
+def solve_second(parsed_input: ParsedInput) -> int:
+    rules, my_ticket, nearby_tickets = parsed_input
 
     def is_valid_ticket(ticket):
         return all(any(r.validate(num) for r in rules) for num in ticket)
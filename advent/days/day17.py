@@ -5,10 +5,13 @@ AOC Day 17
 Multidimensional Conway!
 
 """
-import itertools as its
-from typing import Dict, Generator, Iterator, List
 
-Pos = List[int]
+from typing import Iterator
+
+import numpy as np
+
+from advent import metrics
+from advent.grid import Grid, count_neighbors
 
 ACTIVE = "#"
 
@@ -17,88 +20,41 @@ class World:
     """
     Represents a conway world with a set number of dimensions.
 
-    Only active cells are stored in the state.
-
-    This class keeps track of the minimum value for each dimension to optimize the
-    space to look for neighbors in.
+    The state is an array of cubes, 1 for the active ones, cropped to the bounding
+    box of the active cubes to optimize the space to look for neighbors in.
 
     """
 
-    state: Dict[Pos, int]
+    cubes: np.ndarray
 
-    min_dims: List[int]
-    max_dims: List[int]
-    dimensions: int
+    def __init__(self, cubes: np.ndarray):
+        self.cubes = cubes
 
-    def __init__(self, dimensions=3):
-        self.state = {}
-        self.active_count = 0
-        self.dimensions = dimensions
-        self.min_dims = [None for _ in range(dimensions)]
-        self.max_dims = [None for _ in range(dimensions)]
+    @property
+    def dimensions(self) -> int:
+        return self.cubes.ndim
 
-    @staticmethod
-    def from_world(world):
-        """Create a new empty world from an existing world."""
-
-        new_world = World(dimensions=world.dimensions)
-        new_world.dimensions = world.dimensions
-        return new_world
+    @property
+    def active_count(self) -> int:
+        return int(np.count_nonzero(self.cubes))
 
     @staticmethod
     def from_puzzle_input(initial_state: Iterator[str], dimensions: int = 3):
         """Create a world from a puzzle input."""
 
-        world = World(dimensions=dimensions)
-        pos = [0 for _ in range(dimensions)]
-        for line in initial_state:
-            line = line.strip()
-
-            for x, letter in enumerate(line):
-                pos[0] = x
-                if letter == ACTIVE:
-                    world.set_cube(pos, 1)
-
-            pos[1] += 1
-
-        return world
-
-    def set_cube(self, pos, value):
-        # We're not storing inactive cubes
-        if not value:
-            return
-
-        # We could also sum() the values of state to get this count
-        self.active_count += 1
-
-        # Keep track of the bounds of the space
-        for i in range(self.dimensions):
-            if self.min_dims[i] is None or pos[i] < self.min_dims[i]:
-                self.min_dims[i] = pos[i]
-            if self.max_dims[i] is None or pos[i] > self.max_dims[i]:
-                self.max_dims[i] = pos[i]
-
-        self.state[tuple(pos)] = value
-
-    def get_cube(self, pos: Pos) -> int:
-        return self.state.get(tuple(pos), 0)
-
-    def count_active_neighbors(self, pos: Pos) -> int:
-        ranges = (range(dim - 1, dim + 2) for dim in pos)
+        grid = Grid.from_lines((line.strip() for line in initial_state), {ACTIVE: 1})
+        return World(grid.cells.reshape(grid.shape + (1,) * (dimensions - 2)))
 
-        # All the possible neighbors including the current cube
-        neighbor_pos = its.product(*ranges)
 
-        # We need to subtract the current cube since it's included in neighbors
-        return sum(self.state.get(p, 0) for p in neighbor_pos) - self.state.get(pos, 0)
+def crop(cubes: np.ndarray) -> np.ndarray:
+    """Crop the cubes to the bounding box of the active ones."""
 
-    def possible_active_cubes(self) -> Generator[Pos, None, None]:
-        ranges = (
-            range(min_dim - 1, max_dim + 2)
-            for min_dim, max_dim in zip(self.min_dims, self.max_dims)
-        )
+    active = np.nonzero(cubes)
+    if not active[0].size:
+        # Nothing can become active in an empty world
+        return np.zeros((0,) * cubes.ndim, dtype=cubes.dtype)
 
-        return its.product(*ranges)
+    return cubes[tuple(slice(a.min(), a.max() + 1) for a in active)]
 
 
 def step(world: World) -> World:
@@ -111,15 +67,16 @@ def step(world: World) -> World:
         - otherwise the cube is not active
     """
 
-    new_world = World.from_world(world)
+    cubes = np.pad(world.cubes, 1)
 
-    for cube_pos in world.possible_active_cubes():
-        active_neighbors = world.count_active_neighbors(cube_pos)
+    if metrics.ENABLED:
+        metrics.incr("day17.cubes", cubes.size)
+        metrics.incr("day17.neighbor_lookups", cubes.size * 3**cubes.ndim)
 
-        if active_neighbors == 3 or world.get_cube(cube_pos) and active_neighbors == 2:
-            new_world.set_cube(cube_pos, 1)
+    active_neighbors = count_neighbors(cubes)
+    active = (active_neighbors == 3) | ((cubes == 1) & (active_neighbors == 2))
 
-    return new_world
+    return World(crop(active.astype(np.uint8)))
 
 
 def first(puzzle_input: Iterator[str], cycles=6):
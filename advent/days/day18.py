@@ -13,7 +13,7 @@ because the grammar is simple.
 
 import re
 from dataclasses import dataclass
-from typing import Iterator
+from typing import Iterator, List
 
 OP_PLUS = "+"
 OP_MUL = "*"
@@ -25,13 +25,16 @@ R_OPERATOR = fr"[{OP_PLUS}{OP_MUL}]"
 R_LITERAL = r"[0-9]+"
 R_SEPARATOR = fr"[{SEP_OPENP}{SEP_CLOSEP}]"
 
-R_TOKEN = fr"{R_OPERATOR}|{R_LITERAL}|{R_SEPARATOR}"
-
-
 OPERATOR = "OPERATOR"
 LITERAL = "LITERAL"
 SEPARATOR = "SEPARATOR"
 
+# A single pass over the expression, the name of the group that matched is the type
+R_TOKEN = re.compile(
+    fr"(?P<{OPERATOR}>{R_OPERATOR})|(?P<{LITERAL}>{R_LITERAL})"
+    fr"|(?P<{SEPARATOR}>{R_SEPARATOR})"
+)
+
 
 @dataclass
 class Token:
@@ -39,22 +42,8 @@ class Token:
     value: str
 
 
-def tokenize(expr: str):
-    raw_tokens = re.findall(R_TOKEN, expr)
-
-    tokens = []
-    for raw_token in raw_tokens:
-        if re.match(fr"^{R_OPERATOR}$", raw_token):
-            ttype = OPERATOR
-        elif re.match(fr"^{R_LITERAL}$", raw_token):
-            ttype = LITERAL
-        elif re.match(fr"^{R_SEPARATOR}$", raw_token):
-            ttype = SEPARATOR
-        else:
-            raise ValueError("Unable to parse token")
-        tokens.append(Token(type=ttype, value=raw_token))
-
-    return tokens
+def tokenize(expr: str) -> List[Token]:
+    return [Token(type=m.lastgroup, value=m.group()) for m in R_TOKEN.finditer(expr)]
 
 
 def evaluate(expr: str, eval_fn) -> int:
@@ -154,9 +143,21 @@ def eval_tokens2(tokens: Iterator[Token]) -> int:
     return left
 
 
+def parse(puzzle_input: Iterator[str]) -> List[List[Token]]:
+    return [tokenize(line.strip()) for line in puzzle_input]
+
+
 def first(puzzle_input: Iterator[str]) -> int:
-    return sum(evaluate(line.strip(), eval_tokens) for line in puzzle_input)
+    return solve_first(parse(puzzle_input))
 
 
 def second(puzzle_input: Iterator[str]) -> int:
-    return sum(evaluate(line.strip(), eval_tokens2) for line in puzzle_input)
+    return solve_second(parse(puzzle_input))
+
+
+def solve_first(expressions: List[List[Token]]) -> int:
+    return sum(eval_tokens(iter(tokens)) for tokens in expressions)
+
+
+def solve_second(expressions: List[List[Token]]) -> int:
+    return sum(eval_tokens2(iter(tokens)) for tokens in expressions)
@@ -1,53 +1,35 @@
-import itertools as its
 import math
-import re
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+import numpy as np
+
+from advent import metrics, trace
+from advent.grid import Grid
+from advent.io import records
+
 # Edges are represented with an integer since they are '....##..' we can turn those into 0s and 1s
 # This will speed up comparing if two edges are identical, and make it smaller in memory than a
 # string
 Edge = int
 Edges = Dict[str, Edge]
 
+PIXELS = {".": 0, "#": 1}
+
 # pylint: disable=trailing-whitespace
 MONSTER = """                  # 
 #    ##    ##    ###
  #  #  #  #  #  #   """
 
-# Will be used to identify a monster
-MONSTER_REGEXES = [
-    re.compile("^" + line.replace(" ", ".")) for line in MONSTER.splitlines()
-]
-MONSTER_HEIGHT = len(MONSTER_REGEXES)
-
-
-def get_row(data: List[str], num: int) -> int:
-    return int("".join("0" if c == "." else "1" for c in data[num]), 2)
-
-
-def get_column(data: List[str], num: int) -> int:
-    return int(
-        "".join("0" if data[y][num] == "." else "1" for y in range(len(data))), 2
-    )
-
-
-def rotate(data: List[str]) -> List[str]:
-    """Return the result of rotating the image once clockwise."""
+# Will be used to identify a monster, as the offsets of its pixels
+MONSTER_GRID = Grid.from_lines(MONSTER.splitlines(), PIXELS)
+MONSTER_PIXELS = list(zip(*np.nonzero(MONSTER_GRID.cells)))
 
-    width = len(data)
 
-    new_data = [[None for _ in range(width)] for _ in range(width)]
-    for y in range(width):
-        for x in range(width):
-            new_data[x][-1 - y] = data[y][x]
-    return ["".join(row) for row in new_data]
-
-
-def flip(data: List[str]) -> List[str]:
-    """Return the result of flipping the image."""
-    return [line[::-1] for line in data]
+def edge_value(pixels: np.ndarray) -> Edge:
+    """Read the pixels of an edge as the bits of an integer."""
+    return int("".join(map(str, pixels)), 2)
 
 
 @dataclass(eq=True, frozen=True)
@@ -66,19 +48,15 @@ class TileState:
     def __repr__(self):
         s = f"{self.tile.id} {self.state} top={self.top} right={self.right}"
         s += f" bottom={self.bottom} left={self.left}\n"
-        s += "\n".join(self.data)
+        s += "\n".join(self.data.to_lines(PIXELS))
         return s
 
     @property
-    def data(self):
-        flip_count = int(self.state[1])
-        rot_count = int(self.state[3])
-        d = self.tile.data[:]
-        for _ in range(flip_count):
-            d = flip(d)
-        for _ in range(rot_count):
-            d = rotate(d)
-        return d
+    def data(self) -> Grid:
+        d = self.tile.data
+        if self.state[1] == "1":
+            d = d.flip()
+        return d.rotate(int(self.state[3]))
 
 
 class Tile:
@@ -89,41 +67,34 @@ class Tile:
     """
 
     id: str
-    data: List[str]
+    data: Grid
     states: Dict[str, TileState]
 
     def __init__(self, tile_id: str, data: List[str]):
         self.id = tile_id
-        self.data = data
+        self.data = Grid.from_lines(data, PIXELS)
 
-        self.store_all_states(data)
+        self.store_all_states(self.data)
 
-    def store_all_states(self, data: List[str]):
+    def store_all_states(self, data: Grid):
         self.states = {}
-        d = data[:]
-        rotated = 0
 
         for flipped in (False, True):
+            d = data.flip() if flipped else data
             for rotated in range(4):
-                if rotated > 0:
-                    d = rotate(d)
+                cells = d.rotate(rotated).cells
                 state_name = f"f{1 if flipped else 0}r{rotated}"
                 edges = {
-                    "top": get_row(d, 0),
-                    "right": get_column(d, -1),
-                    "bottom": get_row(d, -1),
-                    "left": get_column(d, 0),
+                    "top": edge_value(cells[0]),
+                    "right": edge_value(cells[:, -1]),
+                    "bottom": edge_value(cells[-1]),
+                    "left": edge_value(cells[:, 0]),
                 }
 
                 self.states[state_name] = TileState(
                     tile=self, state=state_name, **edges
                 )
 
-            # Rotate one last time to go back to the initial state, but it's not really necessary
-            # just easier to reason about if the flipped states start from the same state
-            d = rotate(d)
-            d = flip(d)
-
 
 class CandidateArrangement:
     """A candidate for an arrangement of tile states."""
@@ -149,7 +120,7 @@ class CandidateArrangement:
                     outside_edges.add(tile.right)
                 if tile_i < self.width:
                     outside_edges.add(tile.top)
-                if (tile_i + self.width) >= self.width ** 2:
+                if (tile_i + self.width) >= self.width**2:
                     outside_edges.add(tile.bottom)
 
         self.outside_edges = outside_edges
@@ -168,7 +139,7 @@ class CandidateArrangement:
             outside_edges.add(tile.right)
         if tile_i < self.width:
             outside_edges.add(tile.top)
-        if (tile_i + self.width) >= self.width ** 2:
+        if (tile_i + self.width) >= self.width**2:
             outside_edges.add(tile.bottom)
 
         candidate = CandidateArrangement(
@@ -219,7 +190,16 @@ def find_corners(tiles: List[Tile]) -> Tuple[int, int, int, int]:
     return corners
 
 
+def parse(puzzle_input: Iterator[str]) -> List[Tile]:
+    """Parse the tiles, this also computes the edges of all their states."""
+    return parse_input(puzzle_input)
+
+
 def first(puzzle_input: Iterator[str]) -> int:
+    return solve_first(parse(puzzle_input))
+
+
+def solve_first(tiles: List[Tile]) -> int:
     """
     Solve the image and return the product of the ids of the corner tiles
 
@@ -228,7 +208,6 @@ def first(puzzle_input: Iterator[str]) -> int:
     2 anyway.
 
     """
-    tiles = parse_input(puzzle_input)
     width = int(len(tiles) ** 0.5)
 
     image = solve_image(tiles)
@@ -242,6 +221,7 @@ def first(puzzle_input: Iterator[str]) -> int:
     return math.prod(t.id for t in (top_left, top_right, bottom_left, bottom_right))
 
 
+@trace.traced("day20.solve_image")
 def solve_image(tiles: List[Tile]) -> List[TileState]:
     """
     Solve the image by finding a valid corner, and then going through all
@@ -282,6 +262,9 @@ def solve_image(tiles: List[Tile]) -> List[TileState]:
     while candidates:
         candidate = candidates.pop()
 
+        if metrics.ENABLED:
+            metrics.incr("day20.candidates")
+
         if len(candidate.used) == len(tiles):
             return candidate.tiles
 
@@ -319,106 +302,91 @@ def solve_image(tiles: List[Tile]) -> List[TileState]:
             candidates.append(candidate.with_tile(tilestate))
 
 
-def make_image(tilestates: List[TileState]) -> List[str]:
+def make_image(tilestates: List[TileState]) -> Grid:
     """
     Return an image based on a solution to the tile puzzle.
 
     The tile states have to be trimmed and concatenated.
     """
-    data = []
-
     width = int(len(tilestates) ** 0.5)
-    tile_width = len(tilestates[0].data[0])
+    trimmed = [t.data.cells[1:-1, 1:-1] for t in tilestates]
+
+    return Grid(
+        np.block(
+            [
+                trimmed[tile_row * width : tile_row * width + width]
+                for tile_row in range(width)
+            ]
+        )
+    )
+
+
+def find_monsters(image: Grid) -> np.ndarray:
+    """
+    Look for a monster at every position of the image at once.
 
-    for tile_row in range(0, width):
-        tile_data = [
-            t.data for t in tilestates[tile_row * width : tile_row * width + width]
-        ]
+    Returns an array with the positions where a monster fits, a position matches if
+    the image has a pixel under every pixel of the monster shifted to it.
+    """
+    monster_height, monster_width = MONSTER_GRID.shape
+    height = image.height - monster_height + 1
+    width = image.width - monster_width + 1
 
-        for i in range(1, tile_width - 1):
-            row = ""
-            for td in tile_data:
-                row += td[i][1:-1]
-            data.append(row)
+    found = np.ones((height, width), dtype=bool)
+    for row, column in MONSTER_PIXELS:
+        found &= image.cells[row : row + height, column : column + width] == 1
 
-    return data
+    return found
 
 
-def is_there_a_monster(data: List[str], row: int, column: int) -> bool:
+def is_there_a_monster(image: Grid, row: int, column: int) -> bool:
     """
-    This methods tries to match all the monster regexes at the given position.
+    This methods checks all the pixels of the monster at the given position.
 
     It does not verify the boundaries and will raise an error if the monster
     cannot fit in data for the given position.
     """
 
-    for row_i, regex in enumerate(MONSTER_REGEXES):
-        if not regex.match(data[row + row_i][column:]):
-            return False
-
-    return True
+    return all(
+        image[row + row_i, column + column_i] == 1 for row_i, column_i in MONSTER_PIXELS
+    )
 
 
 def second(puzzle_input: Iterator[str]) -> int:
+    return solve_second(parse(puzzle_input))
+
+
+def solve_second(tiles: List[Tile]) -> int:
     """
     Look for monsters through the solved and trimmed image.
 
-    This method computes all 8 possible images (flips/rotations) and
-    looks for a monster at every single position. We could optimize by
-    looking for some rare pattersn, but the data set is small enough that
-    it does not matter.
+    This method goes through all 8 possible images (flips/rotations) and
+    looks for a monster at every single position, one whole image at a time.
 
     """
 
-    tiles = parse_input(puzzle_input)
     solution = solve_image(tiles)
 
     # Remove the borders for each tile
     image = make_image(solution)
 
-    # The image is a square
-    image_width = len(image[0])
-
-    monster_coordinates = []
-
-    # Now we don't really need to optimize since the space is small:
-    # 8*8*144*8 = 73728 (144 tiles, 8*8 characters in a trimmed tile, 8 flip/rotations)
-    for flip_count in (False, True):
-        if flip_count:
-            image = flip(image)
-
-        for rotate_count in range(4):
-            if rotate_count:
-                image = rotate(image)
-
-                for row, column in its.product(
-                    range(image_width - MONSTER_HEIGHT), range(image_width)
-                ):
-                    if is_there_a_monster(image, row, column):
-                        monster_coordinates.append((row, column))
-
-            if monster_coordinates:
-                break
+    monster_count = 0
+    for oriented in image.orientations():
+        monster_count = int(np.count_nonzero(find_monsters(oriented)))
+        if monster_count:
+            break
 
     # Now count the #s without the monster's #
 
     # The monster weight is the number of pounds in the monster
-    monster_weight = sum(1 for char in MONSTER if char == "#")
-    monster_count = len(monster_coordinates)
+    monster_weight = len(MONSTER_PIXELS)
 
-    # Number of pound signs in the image
-    pounds_in_image = sum(1 for line in image for char in line if char == "#")
-
-    return pounds_in_image - (monster_weight * monster_count)
+    return image.count(1) - (monster_weight * monster_count)
 
 
+@trace.traced("day20.parse_input")
 def parse_input(puzzle_input: Iterator[str]) -> List[Tile]:
-    # Chomp through the input
-    tiles_str = "".join(puzzle_input).split("\n\n")
-
-    tiles = []
-    for tile_str in tiles_str:
-        t = tile_str.splitlines()
-        tiles.append(Tile(tile_id=int(t[0][5:-1]), data=t[1:]))
-
-    return tiles
+    return [
+        Tile(tile_id=int(record[0][5:-1]), data=record[1:])
+        for record in records(puzzle_input)
+    ]
@@ -1,17 +1,14 @@
 from typing import Iterator, Deque, Tuple, Set, Optional
 from collections import deque
 
+from advent import metrics, trace
+from advent.io import records
+
 Deck = Deque[int]
 
 
 def parse_input(puzzle_input: Iterator[str]) -> Tuple[Deck, Deck]:
-    lines = "".join(list(puzzle_input))
-    player_lines = lines.split("\n\n")
-
-    players = []
-    for cards in player_lines:
-        cards = deque([int(c) for c in cards.splitlines()[1:]])
-        players.append(cards)
+    players = [deque(int(c) for c in record[1:]) for record in records(puzzle_input)]
 
     return players[0], players[1]
 
@@ -44,10 +41,23 @@ def score(deck: Deck) -> int:
     return sum((i + 1) * card_value for i, card_value in enumerate(deck))
 
 
+def parse(puzzle_input: Iterator[str]) -> Tuple[Deck, Deck]:
+    return parse_input(puzzle_input)
+
+
 def first(puzzle_input: Iterator[str]) -> int:
+    return solve_first(parse(puzzle_input))
+
+
+def second(puzzle_input: Iterator[str]) -> int:
+    return solve_second(parse(puzzle_input))
+
+
+def solve_first(decks: Tuple[Deck, Deck]) -> int:
     """Play the game of Combat and calculate the score of the winning player."""
 
-    p1_deck, p2_deck = parse_input(puzzle_input)
+    # The decks are shared with the other part, play with copies
+    p1_deck, p2_deck = (deque(deck) for deck in decks)
 
     while p1_deck and p2_deck:
         play_round(p1_deck, p2_deck)
@@ -105,6 +115,7 @@ def can_recurse(p1_deck: Deck, p2_deck: Deck) -> bool:
     return min(p1_deck) + min(p2_deck) <= len(p1_deck) + len(p2_deck)
 
 
+@trace.traced("day22.play_recursive_combat")
 def play_recursive_combat(
     p1_deck: Deck, p2_deck: Deck, previous_rounds: Optional[Set[str]] = None, fast=False
 ) -> Tuple[bool, Deck]:
@@ -120,6 +131,9 @@ def play_recursive_combat(
     """
     previous_rounds: Set[str] = previous_rounds if previous_rounds else set()
 
+    if metrics.ENABLED:
+        metrics.incr("day22.games")
+
     if fast:
         # Play the fast version because we don't need the resulting deck
         cant_recurse = not can_recurse(p1_deck, p2_deck)
@@ -133,6 +147,9 @@ def play_recursive_combat(
             return True, p1_deck
 
     while p1_deck and p2_deck:
+        if metrics.ENABLED:
+            metrics.incr("day22.rounds")
+
         round_hash = hash_round(p1_deck, p2_deck)
 
         # This round has already been played, player 1 wins
@@ -148,9 +165,8 @@ def play_recursive_combat(
     return False, p2_deck
 
 
-def second(puzzle_input: Iterator[str]) -> int:
-
-    p1_deck, p2_deck = parse_input(puzzle_input)
+def solve_second(decks: Tuple[Deck, Deck]) -> int:
+    p1_deck, p2_deck = (deque(deck) for deck in decks)
     _, winning_deck = play_recursive_combat(p1_deck, p2_deck)
 
     return score(winning_deck)
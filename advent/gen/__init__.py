@@ -0,0 +1,47 @@
+"""
+Synthetic input generators, to run the days on inputs much larger than the
+puzzle inputs.
+
+There is one module per day, named like the day modules, which implements:
+
+    generate(size: int, rng: random.Random) -> Iterator[str]
+
+and yields the lines of a valid input (with their line endings). What `size`
+means depends on the day (number of entries, side of a grid, etc.), it is
+documented in every module.
+
+A module can also set SCALE_START, the smallest size worth timing when looking
+at how a day scales, when the default of 100 is too large or too small.
+"""
+
+import importlib
+import random
+from typing import Iterator
+
+# Consonants only, so generated words can't spell anything meaningful to the
+# parsers, e.g. 'bag' for day 7
+ALPHABET = "cdfhjklmnprstvwxz"
+
+DEFAULT_SCALE_START = 100
+
+
+def get_generator_module(day_num: int):
+    return importlib.import_module(f"advent.gen.day{day_num:02}")
+
+
+def generate(day_num: int, size: int, seed: int = 0) -> Iterator[str]:
+    """Generate an input for a given day, the same seed yields the same input."""
+    return get_generator_module(day_num).generate(size, random.Random(seed))
+
+
+def get_scale_start(day_num: int) -> int:
+    return getattr(get_generator_module(day_num), "SCALE_START", DEFAULT_SCALE_START)
+
+
+def make_word(n: int, alphabet: str = ALPHABET, length: int = 3) -> str:
+    """Return a unique word for every n, at least `length` letters long."""
+    letters = []
+    while n or len(letters) < length:
+        n, letter = divmod(n, len(alphabet))
+        letters.append(alphabet[letter])
+    return "".join(reversed(letters))
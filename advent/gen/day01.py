@@ -0,0 +1,43 @@
+"""
+`size` expenses, with exactly one pair and one triple that add up to 2020.
+
+The other expenses are all larger than 1010 so that no other pair or triple can
+add up to 2020, which makes both the answer unique and the lookups exhaustive.
+"""
+
+import random
+from typing import Iterator
+
+TARGET = 2020
+SCALE_START = 1000
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    if size < 5:
+        raise ValueError("Day 1 needs at least 5 expenses")
+
+    while True:
+        small = rng.sample(range(1, TARGET // 2), 4)
+        pair_low, x, y, z = small[0], small[1], small[2], TARGET - small[1] - small[2]
+        if (
+            0 < z < TARGET // 2
+            and z not in (pair_low, x, y)
+            and pair_low + x + y != TARGET
+            and pair_low + x + z != TARGET
+            and pair_low + y + z != TARGET
+        ):
+            break
+    small = [pair_low, x, y, z]
+    pair_high = TARGET - pair_low
+
+    # Large expenses that would make a pair with a small one or a triple with two
+    excluded = {TARGET - a for a in small} | {
+        TARGET - a - b for i, a in enumerate(small) for b in small[i + 1 :]
+    }
+    large = [n for n in range(TARGET // 2 + 1, TARGET) if n not in excluded]
+
+    expenses = small + [pair_high] + rng.choices(large, k=size - 5)
+    rng.shuffle(expenses)
+
+    for expense in expenses:
+        yield f"{expense}\n"
@@ -0,0 +1,21 @@
+"""`size` password database entries."""
+
+import random
+from typing import Iterator
+
+LETTERS = "abcdefghij"
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        low = rng.randint(1, 8)
+        high = rng.randint(low + 1, low + 10)
+        letter = rng.choice(LETTERS)
+
+        # Skew the password towards the policy letter so that entries are valid
+        # often enough to matter
+        length = rng.randint(1, high + 4)
+        password = "".join(
+            letter if rng.random() < 0.3 else rng.choice(LETTERS) for _ in range(length)
+        )
+        yield f"{low}-{high} {letter}: {password}\n"
@@ -0,0 +1,13 @@
+"""A map `size` rows high, and 31 columns wide like the puzzle input."""
+
+import random
+from typing import Iterator
+
+WIDTH = 31
+TREE_DENSITY = 0.25
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        row = "".join("#" if rng.random() < TREE_DENSITY else "." for _ in range(WIDTH))
+        yield f"{row}\n"
@@ -0,0 +1,56 @@
+"""`size` passports, some with missing fields and some with invalid values."""
+
+import random
+from typing import Callable, Dict, Iterator, Tuple
+
+EYE_COLORS = ("amb", "blu", "brn", "gry", "grn", "hzl", "oth")
+
+Values = Tuple[Callable[[random.Random], str], Callable[[random.Random], str]]
+
+
+def _hgt(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return f"{rng.randint(150, 193)}cm"
+    return f"{rng.randint(59, 76)}in"
+
+
+def _hex(rng: random.Random) -> str:
+    return "".join(rng.choice("0123456789abcdef") for _ in range(6))
+
+
+def _digits(rng: random.Random, count: int) -> str:
+    return "".join(rng.choice("0123456789") for _ in range(count))
+
+
+# A generator for a valid value and one for an invalid value, for every field
+FIELDS: Dict[str, Values] = {
+    "byr": (lambda r: str(r.randint(1920, 2002)), lambda r: str(r.randint(2003, 2030))),
+    "iyr": (lambda r: str(r.randint(2010, 2020)), lambda r: str(r.randint(1990, 2009))),
+    "eyr": (lambda r: str(r.randint(2020, 2030)), lambda r: str(r.randint(2000, 2019))),
+    "hgt": (_hgt, lambda r: str(r.randint(50, 200))),
+    "hcl": (lambda r: f"#{_hex(r)}", _hex),
+    "ecl": (lambda r: r.choice(EYE_COLORS), lambda r: r.choice(("xry", "zzz", "#abc"))),
+    "pid": (lambda r: _digits(r, 9), lambda r: _digits(r, 10)),
+    "cid": (lambda r: str(r.randint(50, 350)), lambda r: str(r.randint(50, 350))),
+}
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for i in range(size):
+        fields = []
+        for name, (valid, invalid) in FIELDS.items():
+            if rng.random() < 0.05:
+                # Missing field
+                continue
+            value = valid(rng) if rng.random() < 0.95 else invalid(rng)
+            fields.append(f"{name}:{value}")
+        rng.shuffle(fields)
+
+        # Spread the fields over a few lines
+        while fields:
+            count = rng.randint(1, 4)
+            yield " ".join(fields[:count]) + "\n"
+            fields = fields[count:]
+
+        if i < size - 1:
+            yield "\n"
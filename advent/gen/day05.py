@@ -0,0 +1,33 @@
+"""
+`size` boarding passes for a contiguous block of seats, but one.
+
+The plane only has 1024 seats, so size is at most 1022.
+"""
+
+import random
+from typing import Iterator
+
+SEAT_COUNT = 1024
+SCALE_START = 50
+
+
+def encode(seat_id: int) -> str:
+    row, column = divmod(seat_id, 8)
+    row_str = "".join("B" if row & (1 << bit) else "F" for bit in range(6, -1, -1))
+    col_str = "".join("R" if column & (1 << bit) else "L" for bit in range(2, -1, -1))
+    return row_str + col_str
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    if not 2 <= size <= SEAT_COUNT - 2:
+        raise ValueError(f"Day 5 supports between 2 and {SEAT_COUNT - 2} seats")
+
+    start = rng.randint(0, SEAT_COUNT - size - 1)
+    seat_ids = list(range(start, start + size + 1))
+
+    # Our seat is the missing one, its neighbors are taken
+    seat_ids.pop(rng.randint(1, size - 1))
+    rng.shuffle(seat_ids)
+
+    for seat_id in seat_ids:
+        yield encode(seat_id) + "\n"
@@ -0,0 +1,21 @@
+"""`size` groups of 1 to 5 people."""
+
+import random
+import string
+from typing import Iterator
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for i in range(size):
+        # Questions everybody in the group answers to, so part 2 isn't always 0
+        common = set(rng.sample(string.ascii_lowercase, rng.randint(0, 4)))
+
+        for _ in range(rng.randint(1, 5)):
+            answers = sorted(
+                common | set(rng.sample(string.ascii_lowercase, rng.randint(1, 10)))
+            )
+            rng.shuffle(answers)
+            yield "".join(answers) + "\n"
+
+        if i < size - 1:
+            yield "\n"
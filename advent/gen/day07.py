@@ -0,0 +1,47 @@
+"""
+Rules for `size` bag colors, including shiny gold.
+
+The bags are arranged in layers, bags only contain bags from the next layer so
+the rules are acyclic and the nesting depth stays bounded.
+"""
+
+import random
+from typing import Iterator
+
+from advent.gen import make_word
+
+COLORS = ("red", "orange", "yellow", "green", "blue", "violet", "white", "black")
+LAYERS = 6
+TARGET_LAYER = 3
+TARGET = "shiny gold"
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    if size < LAYERS:
+        raise ValueError(f"Day 7 needs at least {LAYERS} bag colors")
+
+    names = [f"{make_word(i)} {COLORS[i % len(COLORS)]}" for i in range(size)]
+
+    layers = [[] for _ in range(LAYERS)]
+    for i, name in enumerate(names):
+        layers[i * LAYERS // size].append(name)
+
+    layers[TARGET_LAYER][0] = TARGET
+
+    rules = []
+    for layer, next_layer in zip(layers, layers[1:] + [[]]):
+        for name in layer:
+            if not next_layer:
+                rules.append(f"{name} bags contain no other bags.")
+                continue
+
+            contained = rng.sample(next_layer, min(len(next_layer), rng.randint(1, 4)))
+            contents = []
+            for containee in contained:
+                count = rng.randint(1, 5)
+                contents.append(f"{count} {containee} bag{'s' if count > 1 else ''}")
+            rules.append(f"{name} bags contain {', '.join(contents)}.")
+
+    rng.shuffle(rules)
+    for rule in rules:
+        yield rule + "\n"
@@ -0,0 +1,37 @@
+"""
+A program of `size` instructions, which loops forever unless its very last
+instruction is patched from jmp to nop.
+
+Execution goes forward from the first instruction, skipping over some, until the
+last instruction which jumps back. Instructions that are skipped are all acc, so
+patching a forward jmp still ends up in the loop, and nop arguments point inside
+the program so patching a nop does too.
+"""
+
+import random
+from typing import Iterator
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    if size < 2:
+        raise ValueError("Day 8 needs at least 2 instructions")
+
+    instructions = []
+    while len(instructions) < size - 1:
+        i = len(instructions)
+        kind = rng.random()
+
+        if kind < 0.15 and i + 2 < size:
+            # Jump over a few instructions that will never run
+            skipped = rng.randint(1, min(4, size - 2 - i))
+            instructions.append(f"jmp +{skipped + 1}")
+            instructions += [f"acc {rng.randint(-99, 99):+}" for _ in range(skipped)]
+        elif kind < 0.3:
+            instructions.append(f"nop {rng.randint(-i, size - 1 - i):+}")
+        else:
+            instructions.append(f"acc {rng.randint(-99, 99):+}")
+
+    instructions.append(f"jmp {-rng.randint(1, size - 1):+}")
+
+    for instruction in instructions:
+        yield instruction + "\n"
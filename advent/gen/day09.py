@@ -0,0 +1,40 @@
+"""
+`size` numbers with a 25 number preamble, all valid but the last one.
+
+Every number is the sum of two of the smallest numbers in the previous 25, but
+with positive numbers they still double every few dozen numbers, so large sizes
+make for very large integers. The last number is the sum of a contiguous range
+around the middle, so finding that range is quadratic like with the puzzle input.
+"""
+
+import random
+from typing import Iterator
+
+PREAMBLE = 25
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    if size < PREAMBLE + 2:
+        raise ValueError(f"Day 9 needs at least {PREAMBLE + 2} numbers")
+
+    numbers = rng.sample(range(1, 100), PREAMBLE)
+    while len(numbers) < size - 1:
+        smallest = sorted(numbers[-PREAMBLE:])[:8]
+        a, b = rng.sample(smallest, 2)
+        numbers.append(a + b)
+
+    window = numbers[-PREAMBLE:]
+    pair_sums = {a + b for i, a in enumerate(window) for b in window[i + 1 :]}
+
+    for _ in range(1000):
+        start = rng.randint((size - 1) // 4, (size - 1) // 2)
+        length = rng.randint(2, PREAMBLE)
+        invalid = sum(numbers[start : start + length])
+        if invalid not in pair_sums:
+            break
+    else:
+        raise ValueError("Unable to find an invalid number, try another seed")
+
+    numbers.append(invalid)
+    for n in numbers:
+        yield f"{n}\n"
@@ -0,0 +1,16 @@
+"""`size` adapters, with joltage differences of 1, 2 or 3."""
+
+import random
+from typing import Iterator
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    adapters = []
+    joltage = 0
+    for _ in range(size):
+        joltage += rng.choices((1, 2, 3), weights=(6, 1, 3))[0]
+        adapters.append(joltage)
+
+    rng.shuffle(adapters)
+    for adapter in adapters:
+        yield f"{adapter}\n"
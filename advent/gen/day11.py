@@ -0,0 +1,13 @@
+"""A `size` x `size` seat layout."""
+
+import random
+from typing import Iterator
+
+FLOOR_DENSITY = 0.15
+SCALE_START = 8
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        row = "".join("." if rng.random() < FLOOR_DENSITY else "L" for _ in range(size))
+        yield f"{row}\n"
@@ -0,0 +1,14 @@
+"""`size` navigation instructions."""
+
+import random
+from typing import Iterator
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        action = rng.choices("NSEWLRF", weights=(1, 1, 1, 1, 1, 1, 3))[0]
+        if action in ("L", "R"):
+            value = rng.choice((90, 180, 270))
+        else:
+            value = rng.randint(1, 100)
+        yield f"{action}{value}\n"
@@ -0,0 +1,34 @@
+"""
+`size` buses, their ids are distinct primes so that part 2 has a solution.
+"""
+
+import random
+from typing import Iterator, List
+
+SCALE_START = 4
+
+
+def primes(count: int, start: int) -> Iterator[int]:
+    """Yield `count` primes, starting from `start`."""
+    found: List[int] = []
+    n = 2
+    while count:
+        if all(n % p for p in found if p * p <= n):
+            found.append(n)
+            if n >= start:
+                yield n
+                count -= 1
+        n += 1
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    bus_ids = list(primes(size, 13))
+    rng.shuffle(bus_ids)
+
+    schedule = []
+    for bus_id in bus_ids:
+        schedule += ["x"] * rng.randint(0, 8)
+        schedule.append(str(bus_id))
+
+    yield f"{rng.randint(100000, 10000000)}\n"
+    yield ",".join(schedule) + "\n"
@@ -0,0 +1,23 @@
+"""
+A program of `size` lines.
+
+Masks have at most 9 floating bits like the puzzle input, each write in
+version 2 touches up to 512 addresses.
+"""
+
+import random
+from typing import Iterator
+
+BITS = 36
+MAX_FLOATING = 9
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for i in range(size):
+        if i == 0 or rng.random() < 0.2:
+            mask = [rng.choice("01") for _ in range(BITS)]
+            for pos in rng.sample(range(BITS), rng.randint(0, MAX_FLOATING)):
+                mask[pos] = "X"
+            yield f"mask = {''.join(mask)}\n"
+        else:
+            yield f"mem[{rng.randint(0, 65535)}] = {rng.randint(0, 1 << 30)}\n"
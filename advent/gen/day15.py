@@ -0,0 +1,13 @@
+"""
+`size` distinct starting numbers.
+
+The number of turns is part of the puzzle, so this only changes the game a bit.
+"""
+
+import random
+from typing import Iterator
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    numbers = rng.sample(range(size * 10), size)
+    yield ",".join(str(n) for n in numbers) + "\n"
@@ -0,0 +1,64 @@
+"""
+Rules for 20 fields, your ticket and `size` nearby tickets.
+
+The low ranges of the rules are nested: rule k accepts 1 to 50 * (k + 1). Every
+field has a value that only its rule and the ones with a wider range accept,
+which is enough to find a single rule per field by elimination. The high ranges
+are disjoint and above every low range, and about 1 in 5 nearby tickets has a
+value no rule accepts.
+"""
+
+import random
+from typing import Iterator, List
+
+from advent.gen import make_word
+
+FIELD_COUNT = 20
+DEPARTURE_COUNT = 6
+STEP = 50
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    # The rule with index k has the k-th narrowest low range
+    names = [
+        f"departure {make_word(k)}" if k < DEPARTURE_COUNT else f"field {make_word(k)}"
+        for k in range(FIELD_COUNT)
+    ]
+    rng.shuffle(names)
+
+    low_max = [STEP * (k + 1) for k in range(FIELD_COUNT)]
+    high_start = low_max[-1] + STEP
+    high_ranges = [
+        (high_start + 10 * k, high_start + 10 * k + 4) for k in range(FIELD_COUNT)
+    ]
+    invalid_start = high_ranges[-1][1] + 1
+
+    for k, name in enumerate(names):
+        low, high = (1, low_max[k]), high_ranges[k]
+        yield f"{name}: {low[0]}-{low[1]} or {high[0]}-{high[1]}\n"
+
+    # The rule that applies to every position of the tickets
+    rule_for_position = list(range(FIELD_COUNT))
+    rng.shuffle(rule_for_position)
+
+    def make_ticket(distinctive: bool) -> List[int]:
+        ticket = []
+        for k in rule_for_position:
+            if distinctive:
+                # Only valid for rules k and up
+                ticket.append(rng.randint(low_max[k] - STEP + 1, low_max[k]))
+            else:
+                ticket.append(rng.randint(1, low_max[k]))
+        return ticket
+
+    yield "\n"
+    yield "your ticket:\n"
+    yield ",".join(str(v) for v in make_ticket(False)) + "\n"
+    yield "\n"
+    yield "nearby tickets:\n"
+
+    for i in range(size):
+        ticket = make_ticket(i == 0)
+        if i > 0 and rng.random() < 0.2:
+            ticket[rng.randrange(FIELD_COUNT)] = rng.randint(invalid_start, 1000000)
+        yield ",".join(str(v) for v in ticket) + "\n"
@@ -0,0 +1,15 @@
+"""A `size` x `size` initial slice of cubes."""
+
+import random
+from typing import Iterator
+
+ACTIVE_DENSITY = 0.4
+SCALE_START = 3
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        row = "".join(
+            "#" if rng.random() < ACTIVE_DENSITY else "." for _ in range(size)
+        )
+        yield f"{row}\n"
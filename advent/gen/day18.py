@@ -0,0 +1,25 @@
+"""`size` expressions, with up to 3 levels of parentheses."""
+
+import random
+from typing import Iterator
+
+MAX_DEPTH = 3
+
+
+def expression(rng: random.Random, depth: int = 0) -> str:
+    operands = []
+    for _ in range(rng.randint(2, 6)):
+        if depth < MAX_DEPTH and rng.random() < 0.25:
+            operands.append(f"({expression(rng, depth + 1)})")
+        else:
+            operands.append(str(rng.randint(1, 9)))
+
+    expr = operands[0]
+    for operand in operands[1:]:
+        expr += f" {rng.choice('+*')} {operand}"
+    return expr
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(size):
+        yield expression(rng) + "\n"
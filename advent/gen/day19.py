@@ -0,0 +1,57 @@
+"""
+The same rule structure as the puzzle (0: 8 11, 8: 42, 11: 42 31) and `size`
+messages.
+
+Rule 42 matches 'a' followed by any 4 letters, and rule 31 matches 'b' followed
+by any 4 letters. Messages are a mix of valid messages for part 1, valid
+messages for part 2 only, and invalid messages.
+"""
+
+import random
+from typing import Iterator
+
+RULES = (
+    "0: 8 11",
+    "8: 42",
+    "11: 42 31",
+    "42: 1 3",
+    "31: 14 3",
+    "3: 2 2 2 2",
+    "2: 1 | 14",
+    '1: "a"',
+    '14: "b"',
+)
+
+# Part 2 only supports nesting rule 11 up to 4 times
+MAX_NESTING = 4
+
+
+def chunk(rng: random.Random, first_letter: str) -> str:
+    return first_letter + "".join(rng.choice("ab") for _ in range(4))
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    rules = list(RULES)
+    rng.shuffle(rules)
+    for rule in rules:
+        yield rule + "\n"
+    yield "\n"
+
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.3:
+            count_42, count_31 = 2, 1
+        elif kind < 0.6:
+            count_31 = rng.randint(1, MAX_NESTING)
+            count_42 = count_31 + rng.randint(1, 3)
+        else:
+            # 31s are never allowed before 42s
+            count_42, count_31 = rng.randint(0, 3), rng.randint(1, 3)
+            yield "".join(chunk(rng, "b") for _ in range(count_31)) + "".join(
+                chunk(rng, "a") for _ in range(count_42)
+            ) + "\n"
+            continue
+
+        yield "".join(chunk(rng, "a") for _ in range(count_42)) + "".join(
+            chunk(rng, "b") for _ in range(count_31)
+        ) + "\n"
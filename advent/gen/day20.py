@@ -0,0 +1,84 @@
+"""
+`size` x `size` tiles from a random image, flipped and rotated at random.
+
+Neighbor tiles share their border, and every edge is unique (even reversed)
+like in the puzzle input. To keep them unique the tiles are wider than 10
+pixels for large sizes.
+"""
+
+import math
+import random
+from typing import Iterator, Set
+
+from advent.grid import Grid
+
+SCALE_START = 2
+
+
+def tile_width_for(size: int) -> int:
+    edge_count = 2 * size * (size + 1)
+
+    # The edge values, and their reverse, use at most a quarter of the values
+    # that the free pixels of an edge (all but the corners) can take
+    return max(10, math.ceil(math.log2(8 * edge_count)) + 2)
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    width = tile_width_for(size)
+    step = width - 1
+    side = size * step + 1
+
+    # Neighbor tiles overlap by one row/column of this grid
+    grid = [[rng.choice(".#") for _ in range(side)] for _ in range(side)]
+
+    used: Set[str] = set()
+
+    def make_unique(get_edge, set_pixel) -> None:
+        while True:
+            edge = get_edge()
+            if edge != edge[::-1] and edge not in used and edge[::-1] not in used:
+                used.update((edge, edge[::-1]))
+                return
+            for i in range(1, width - 1):
+                set_pixel(i, rng.choice(".#"))
+
+    for i in range(size + 1):
+        for j in range(size):
+            row, col = i * step, j * step
+
+            def get_row(row=row, col=col):
+                return "".join(grid[row][col : col + width])
+
+            def set_row(k, pixel, row=row, col=col):
+                grid[row][col + k] = pixel
+
+            def get_col(row=col, col=row):
+                return "".join(grid[row + k][col] for k in range(width))
+
+            def set_col(k, pixel, row=col, col=row):
+                grid[row + k][col] = pixel
+
+            make_unique(get_row, set_row)
+            make_unique(get_col, set_col)
+
+    tile_ids = rng.sample(range(1000, 1000 + 10 * size * size), size * size)
+
+    tiles = []
+    for i in range(size):
+        for j in range(size):
+            data = Grid.from_lines(
+                "".join(grid[i * step + y][j * step : j * step + width])
+                for y in range(width)
+            )
+            if rng.random() < 0.5:
+                data = data.flip()
+            data = data.rotate(rng.randrange(4))
+            tiles.append(data.to_lines())
+
+    rng.shuffle(tiles)
+    for n, (tile_id, data) in enumerate(zip(tile_ids, tiles)):
+        if n:
+            yield "\n"
+        yield f"Tile {tile_id}:\n"
+        for line in data:
+            yield line + "\n"
@@ -0,0 +1,40 @@
+"""
+`size` foods, with 8 allergens and their ingredients.
+
+Every allergen is listed alone in a few foods, so that the intersection of the
+ingredients of the foods it's listed in leads to a single ingredient.
+"""
+
+import random
+from typing import Iterator
+
+from advent.gen import make_word
+
+ALLERGENS = ("dairy", "eggs", "fish", "nuts", "peanuts", "sesame", "soy", "wheat")
+INGREDIENT_COUNT = 500
+FOODS_PER_ALLERGEN = 3
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    if size < FOODS_PER_ALLERGEN * len(ALLERGENS):
+        raise ValueError(
+            f"Day 21 needs at least {FOODS_PER_ALLERGEN * len(ALLERGENS)} foods"
+        )
+
+    ingredients = [make_word(n, length=4) for n in range(INGREDIENT_COUNT)]
+    rng.shuffle(ingredients)
+
+    # The first ingredients contain an allergen, the others are safe
+    allergen_ingredients = dict(zip(ALLERGENS, ingredients))
+    safe_ingredients = ingredients[len(ALLERGENS) :]
+
+    foods = [[allergen] for allergen in ALLERGENS] * FOODS_PER_ALLERGEN
+    while len(foods) < size:
+        foods.append(rng.sample(ALLERGENS, rng.randint(1, 3)))
+    rng.shuffle(foods)
+
+    for allergens in foods:
+        food = [allergen_ingredients[a] for a in allergens]
+        food += rng.sample(safe_ingredients, rng.randint(5, 15))
+        rng.shuffle(food)
+        yield f"{' '.join(food)} (contains {', '.join(sorted(allergens))})\n"
@@ -0,0 +1,18 @@
+"""Two decks of `size` cards each."""
+
+import random
+from typing import Iterator
+
+SCALE_START = 5
+
+
+def generate(size: int, rng: random.Random) -> Iterator[str]:
+    cards = list(range(1, 2 * size + 1))
+    rng.shuffle(cards)
+
+    for player, deck in ((1, cards[:size]), (2, cards[size:])):
+        if player > 1:
+            yield "\n"
+        yield f"Player {player}:\n"
+        for card in deck:
+            yield f"{card}\n"
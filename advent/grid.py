@@ -0,0 +1,150 @@
+"""
+A compact grid of cells backed by a NumPy uint8 array, for the days that work on
+grids, so that they can process the whole grid with vectorized operations rather
+than one cell at a time.
+
+A grid is parsed from lines of characters, either keeping the ASCII code of each
+character, or translating them with a mapping of characters to small integers:
+
+    >>> grid = Grid.from_lines(["#..", ".#."], {".": 0, "#": 1})
+    >>> grid.cells
+    array([[1, 0, 0],
+           [0, 1, 0]], dtype=uint8)
+
+Rotations and flips are views of the same cells, they don't copy anything. The
+neighbor counts also work for arrays with more than 2 dimensions.
+"""
+
+import itertools as its
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+Codes = Mapping[str, int]
+
+
+def translation_table(codes: Codes) -> np.ndarray:
+    """A lookup table from ASCII codes to cell values."""
+    table = np.zeros(256, dtype=np.uint8)
+    for char, code in codes.items():
+        table[ord(char)] = code
+    return table
+
+
+def count_neighbors(mask: np.ndarray) -> np.ndarray:
+    """
+    Count, for every cell, the neighbors that are set in the mask, diagonals
+    included. Cells outside of the array count as unset.
+
+    This works in any number of dimensions, a cell has 3^d - 1 neighbors.
+    """
+    mask = mask.astype(np.uint8)
+    padded = np.pad(mask, 1)
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for offset in its.product(range(3), repeat=mask.ndim):
+        if all(o == 1 for o in offset):
+            # This is the cell itself
+            continue
+        counts += padded[tuple(slice(o, o + n) for o, n in zip(offset, mask.shape))]
+    return counts
+
+
+class Grid:
+    """A grid of uint8 cells, cells[row, column] with 0, 0 in the top left corner."""
+
+    __slots__ = ("cells",)
+
+    def __init__(self, cells: Any):
+        self.cells = np.asarray(cells, dtype=np.uint8)
+
+    @classmethod
+    def from_lines(
+        cls, lines: Iterable[str], codes: Optional[Codes] = None, strict: bool = False
+    ) -> "Grid":
+        """
+        Parse a grid from lines of equal length, blank lines are ignored.
+
+        Without codes the cells are the ASCII codes of the characters, otherwise
+        the characters are translated, and unknown ones become 0, or raise a
+        ValueError if strict.
+        """
+        rows = [line.rstrip("\r\n") for line in lines]
+        rows = [row for row in rows if row]
+
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("All the rows of a grid must have the same length")
+
+        cells = np.frombuffer(bytearray("".join(rows), "ascii"), dtype=np.uint8)
+        cells = cells.reshape(len(rows), width)
+        if codes is not None:
+            if strict:
+                known = np.zeros(256, dtype=bool)
+                known[[ord(char) for char in codes]] = True
+                unknown = cells[~known[cells]]
+                if unknown.size:
+                    raise ValueError(f"Unknown cell {chr(unknown[0])!r}")
+            cells = translation_table(codes)[cells]
+        return cls(cells)
+
+    def to_lines(self, codes: Optional[Codes] = None) -> List[str]:
+        """The opposite of from_lines(), with the same codes."""
+        cells = self.cells
+        if codes is not None:
+            table = np.zeros(256, dtype=np.uint8)
+            for char, code in codes.items():
+                table[code] = ord(char)
+            cells = table[cells]
+        return [row.tobytes().decode("ascii") for row in cells]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.cells.shape
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def __getitem__(self, key: Any) -> Any:
+        """Index or slice the cells, slices are returned as grids."""
+        value = self.cells[key]
+        if isinstance(value, np.ndarray):
+            return Grid(value)
+        return int(value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return np.array_equal(self.cells, other.cells)
+
+    def __repr__(self) -> str:
+        return f"Grid({self.cells!r})"
+
+    def wrap(self, row: Any, column: Any) -> Any:
+        """Index the cells with a grid repeating itself in every direction."""
+        return self.cells[np.mod(row, self.height), np.mod(column, self.width)]
+
+    def rotate(self, times: int = 1) -> "Grid":
+        """Rotate clockwise, as a view."""
+        return Grid(np.rot90(self.cells, -times))
+
+    def flip(self) -> "Grid":
+        """Flip left to right, as a view."""
+        return Grid(self.cells[:, ::-1])
+
+    def orientations(self) -> Iterator["Grid"]:
+        """The 8 rotations and flips of the grid, starting with the grid itself."""
+        for grid in (self, self.flip()):
+            for times in range(4):
+                yield grid.rotate(times)
+
+    def count(self, value: int) -> int:
+        return int(np.count_nonzero(self.cells == value))
+
+    def count_neighbors(self, value: int) -> np.ndarray:
+        """Count the neighbors of every cell that have the given value."""
+        return count_neighbors(self.cells == value)
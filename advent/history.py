@@ -0,0 +1,163 @@
+"""
+Benchmark history, stored in a local SQLite database so that runs can be compared
+across revisions.
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from advent.bench import Summary
+from advent.cache import default_cache_dir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    revision TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    part TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    min_us REAL NOT NULL,
+    median_us REAL NOT NULL,
+    p95_us REAL NOT NULL,
+    stddev_us REAL NOT NULL,
+    samples_us TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_lookup
+    ON runs (day, part, strategy, input_hash, revision);
+"""
+
+
+def default_db_path() -> Path:
+    """The history database, can be overridden with ADVENT_HISTORY_DB."""
+    if "ADVENT_HISTORY_DB" in os.environ:
+        return Path(os.environ["ADVENT_HISTORY_DB"])
+    return Path(default_cache_dir(), "history.sqlite")
+
+
+def hash_input(lines: Union[bytes, Iterable[str]]) -> str:
+    """Hash an input given as bytes or as lines, both give the same hash."""
+    if isinstance(lines, bytes):
+        return hashlib.sha256(lines).hexdigest()
+    h = hashlib.sha256()
+    for line in lines:
+        h.update(line.encode())
+    return h.hexdigest()
+
+
+def git_revision(rev: str = "HEAD") -> str:
+    """Resolve a git revision to a full commit hash."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--verify", f"{rev}^{{commit}}"],
+            cwd=Path(__file__).parent,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError) as ex:
+        raise ValueError(f"Unable to resolve git revision '{rev}'") from ex
+
+
+class History:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else default_db_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def record(
+        self, summary: Summary, strategy: str, input_hash: str, revision: str
+    ) -> None:
+        with self.connection:
+            self.connection.execute(
+                """
+                INSERT INTO runs (
+                    created_at, revision, day, part, strategy, input_hash,
+                    min_us, median_us, p95_us, stddev_us, samples_us
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    datetime.now(timezone.utc).isoformat(),
+                    revision,
+                    summary.day_num,
+                    summary.part,
+                    strategy,
+                    input_hash,
+                    summary.min_us,
+                    summary.median_us,
+                    summary.p95_us,
+                    summary.stddev_us,
+                    json.dumps(summary.samples_us),
+                ),
+            )
+
+    def samples(
+        self, day_num: int, part: str, strategy: str, input_hash: str, revision: str
+    ) -> List[float]:
+        """Return the samples of the latest matching run, or an empty list."""
+        row = self.connection.execute(
+            """
+            SELECT samples_us FROM runs
+            WHERE day = ? AND part = ? AND strategy = ? AND input_hash = ?
+                AND revision = ?
+            ORDER BY id DESC LIMIT 1
+            """,
+            (day_num, part, strategy, input_hash, revision),
+        ).fetchone()
+        return json.loads(row[0]) if row else []
+
+
+def mann_whitney_u(
+    baseline: Sequence[float], current: Sequence[float]
+) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test that `current` tends to be larger (slower)
+    than `baseline`.
+
+    Returns the U statistic of `current` and the p-value, using the normal
+    approximation with a correction for ties. It's rough for very few samples,
+    with 5 repeats on each side the smallest possible p-value is about 0.005.
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        raise ValueError("Both samples need at least one value")
+
+    # Rank all the values together, ties get the average of their ranks
+    values = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(values)
+    tie_correction = 0.0
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_count = j - i + 1
+        tie_correction += tie_count**3 - tie_count
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, values) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+
+    n = n1 + n2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_correction / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+
+    # Continuity correction, then the upper tail of the standard normal
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
@@ -0,0 +1,161 @@
+"""
+Read the puzzle inputs lazily, so that memory stays flat however large they are.
+
+Several days have inputs made of records separated by blank lines (passports, groups
+of answers, tiles, decks). `records` yields them one at a time as lists of lines,
+without concatenating strings or loading the whole input:
+
+    for record in records(puzzle_input):
+        ...
+
+The input can be any iterable of lines, such as an open file, or a memory map of a
+file, which is read a line at a time too.
+
+The runners hand the days a `MappedInput`, a memory mapped input file that iterates
+over its lines like an open file does, but also gives access to its bytes. Inputs
+with one integer per line are then parsed in bulk by `ints`, rather than decoding
+and stripping each line in Python:
+
+    numbers = ints(puzzle_input)
+
+which still works with any other iterable of lines, one line at a time.
+"""
+
+import io
+import mmap
+import os
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class MappedInput:
+    """
+    An input file mapped in memory, it's an iterator over the lines of the file
+    like a file opened in text mode.
+    """
+
+    def __init__(self, data: Union[mmap.mmap, bytes], path: Optional[str] = None):
+        self.data = data
+        # The file that is mapped, if any
+        self.path = path
+        self._reader = data if isinstance(data, mmap.mmap) else io.BytesIO(data)
+
+    @classmethod
+    def open(cls, path: Union[str, "os.PathLike[str]"]) -> "MappedInput":
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files can't be mapped
+                return cls(b"", os.fspath(path))
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls(data, os.fspath(path))
+
+    def __iter__(self) -> "MappedInput":
+        return self
+
+    def __next__(self) -> str:
+        line = self._reader.readline()
+        if not line:
+            raise StopIteration
+        return line.decode()
+
+    def tell(self) -> int:
+        """The offset of the current line in the input."""
+        return self._reader.tell()
+
+    def read_bytes(self) -> bytes:
+        """The rest of the input, from the current line."""
+        return self._reader.read()
+
+    def close(self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+Source = Union[Iterable[str], mmap.mmap]
+
+
+def lines(source: Source) -> Iterator[str]:
+    """The lines of a reader or of a memory map."""
+    if isinstance(source, mmap.mmap):
+        for line in iter(source.readline, b""):
+            yield line.decode()
+    else:
+        yield from source
+
+
+def ints(source: Source) -> List[int]:
+    """
+    The integers of an input with one integer per line, blank lines are ignored.
+
+    A mapped input is split and converted in bulk, without decoding its lines.
+    """
+    if isinstance(source, MappedInput):
+        return list(map(int, source.read_bytes().split()))
+    if isinstance(source, mmap.mmap):
+        return list(map(int, source.read().split()))
+    return [int(line) for line in source if line.strip()]
+
+
+def records(source: Source) -> Iterator[List[str]]:
+    """
+    Yield the records separated by blank lines, as lists of stripped lines.
+
+    Consecutive blank lines and blank lines at the start or end are ignored, so
+    records are never empty.
+    """
+    record: List[str] = []
+    for line in lines(source):
+        line = line.strip()
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+
+    if record:
+        yield record
+
+
+def split_lines(
+    path: Union[str, "os.PathLike[str]"], chunks: int, start: int = 0
+) -> List[Tuple[int, int]]:
+    """
+    Split a file, from the line at offset `start`, into at most `chunks` byte ranges
+    of about the same size, as (start, end) offsets. The ranges start and end on line
+    boundaries, so that they can be processed independently, by different processes
+    for instance.
+    """
+    size = os.path.getsize(path)
+    if size <= start:
+        return []
+
+    bounds = [start]
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for i in range(1, chunks):
+                offset = start + i * (size - start) // chunks
+                newline = data.find(b"\n", max(offset, bounds[-1]))
+                if newline == -1:
+                    break
+                if newline + 1 < size:
+                    bounds.append(newline + 1)
+    bounds.append(size)
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def map_range(f: Any, start: int, end: int) -> Tuple[mmap.mmap, int]:
+    """
+    Map the bytes start to end of an open file, rather than the whole file.
+
+    Mappings have to start on a multiple of the allocation granularity, returns the
+    mapping and the offset of `start` in it.
+    """
+    offset = start - start % mmap.ALLOCATIONGRANULARITY
+    data = mmap.mmap(f.fileno(), end - offset, access=mmap.ACCESS_READ, offset=offset)
+    return data, start - offset
@@ -0,0 +1,164 @@
+"""
+Run a function in a child process with limits on its run time and memory, so that
+a pathological input can neither stall nor take down the caller.
+
+This is POSIX only: the child is forked, limited with resource.setrlimit, and killed
+when it runs out of time. Forking rather than using multiprocessing means the
+function doesn't need to be picklable (only its result does), and that it also
+works from the daemonic workers of a process pool.
+"""
+
+import math
+import os
+import pickle
+import resource
+import select
+import signal
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_MEMORY = "memory"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class LimitedResult:
+    """The outcome of a run with limits, the result is only set if it succeeded."""
+
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+
+def set_limits(timeout: Optional[float], max_memory: Optional[int]) -> None:
+    if max_memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+    if timeout is not None:
+        # Only a backstop, the parent kills the child on time, unless it went away
+        cpu_seconds = math.ceil(timeout) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+
+
+def _run_child(
+    write_fd: int,
+    fn: Callable[..., Any],
+    args: Any,
+    timeout: Optional[float],
+    max_memory: Optional[int],
+) -> None:
+    """Run fn(*args) in the forked child and send the outcome to the parent."""
+    exit_code = 0
+    try:
+        try:
+            set_limits(timeout, max_memory)
+            outcome = (STATUS_OK, fn(*args))
+        except MemoryError:
+            outcome = (STATUS_MEMORY, None)
+        except Exception as ex:  # pylint: disable=broad-except
+            outcome = (STATUS_ERROR, repr(ex))
+
+        try:
+            payload = pickle.dumps(outcome)
+        except Exception as ex:  # pylint: disable=broad-except
+            payload = pickle.dumps((STATUS_ERROR, f"Unable to send the result: {ex!r}"))
+
+        with os.fdopen(write_fd, "wb") as writer:
+            writer.write(payload)
+    except BaseException:  # pylint: disable=broad-except
+        exit_code = 1
+    finally:
+        # os._exit() skips the interpreter cleanup, which belongs to the parent
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)  # pylint: disable=protected-access
+
+
+def _read_until(read_fd: int, deadline: Optional[float]) -> Optional[bytes]:
+    """Read everything from the child, or return None if the deadline passes."""
+    chunks = []
+    while True:
+        remaining = None
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.perf_counter())
+        ready, _, _ = select.select([read_fd], [], [], remaining)
+        if not ready:
+            return None
+        chunk = os.read(read_fd, 1 << 16)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def run_limited(
+    fn: Callable[..., Any],
+    *args: Any,
+    timeout: Optional[float] = None,
+    max_memory: Optional[int] = None,
+) -> LimitedResult:
+    """
+    Run fn(*args) in a child process, with a timeout in seconds and a limit on its
+    address space in bytes.
+    """
+    # Anything still buffered would be written twice, once by each process
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    read_fd, write_fd = os.pipe()
+    start_t = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        _run_child(write_fd, fn, args, timeout, max_memory)
+    os.close(write_fd)
+
+    deadline = None if timeout is None else start_t + timeout
+    try:
+        payload = _read_until(read_fd, deadline)
+    except BaseException:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise
+    finally:
+        os.close(read_fd)
+
+    if payload is None:
+        os.kill(pid, signal.SIGKILL)
+    _, wait_status = os.waitpid(pid, 0)
+    duration = time.perf_counter() - start_t
+
+    if payload is None:
+        return LimitedResult(
+            STATUS_TIMEOUT, error=f"Timed out after {timeout}s", duration=duration
+        )
+
+    if payload:
+        status, value = pickle.loads(payload)
+        if status == STATUS_OK:
+            return LimitedResult(status, result=value, duration=duration)
+        if status == STATUS_MEMORY:
+            error = "Out of memory"
+            if max_memory is not None:
+                error = f"Exceeded the memory limit of {max_memory / 2 ** 20:.0f} MiB"
+            return LimitedResult(status, error=error, duration=duration)
+        return LimitedResult(status, error=value, duration=duration)
+
+    # The child died before sending anything
+    if os.WIFSIGNALED(wait_status):
+        sig = os.WTERMSIG(wait_status)
+        if sig == signal.SIGXCPU:
+            return LimitedResult(
+                STATUS_TIMEOUT, error="Exceeded the CPU time limit", duration=duration
+            )
+        error = f"Killed by {signal.Signals(sig).name}"
+    else:
+        error = f"Exited with code {os.WEXITSTATUS(wait_status)}"
+    return LimitedResult(STATUS_ERROR, error=error, duration=duration)
@@ -0,0 +1,43 @@
+"""
+Opt-in operation counters for the hot loops of the solutions, to reason about the
+work done and not only about the wall time.
+
+Counting is disabled by default. The instrumented code checks the flag of this
+module before counting:
+
+    from advent import metrics
+
+    if metrics.ENABLED:
+        metrics.incr("day08.instructions")
+
+so that when it's disabled the cost is an attribute lookup and a branch.
+"""
+
+import contextlib
+from collections import Counter
+from typing import Iterator
+
+ENABLED = False
+
+counters: "Counter[str]" = Counter()
+
+
+def incr(name: str, n: int = 1) -> None:
+    counters[name] += n
+
+
+@contextlib.contextmanager
+def collect() -> Iterator["Counter[str]"]:
+    """Count from scratch within the block, yields the counters."""
+    global ENABLED  # pylint: disable=global-statement
+    previous, ENABLED = ENABLED, True
+    counters.clear()
+    try:
+        yield counters
+    finally:
+        ENABLED = previous
+
+
+def format_counters(values: "Counter[str]") -> str:
+    width = max((len(name) for name in values), default=0)
+    return "\n".join(f"{name:<{width}}  {n:>14,}" for name, n in sorted(values.items()))
@@ -0,0 +1,119 @@
+"""
+Profiling helpers to find out where time and memory go when running a day.
+"""
+
+import cProfile
+import fnmatch
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+# How often the memory sampler checks for a new peak, in seconds
+SAMPLE_INTERVAL = 0.05
+
+# Snapshots get slower as memory grows, a new one is only taken once the traced
+# memory grew by this fraction since the last one, and after waiting for at least
+# this long, and this many times as long as the last snapshot took
+PEAK_GROWTH = 0.25
+MIN_SNAPSHOT_INTERVAL = 1.0
+SNAPSHOT_COST_RATIO = 10
+
+# The allocations of the profiling machinery, left out of the memory reports
+HIDDEN_FILES = (
+    tracemalloc.__file__,
+    __file__,
+    threading.__file__,
+    "<frozen importlib._bootstrap*>",
+)
+
+
+def profile_call(
+    fn: Callable[..., Any], *args: Any, pstats_path: Path, top: int
+) -> Tuple[Any, str]:
+    """
+    Call fn under cProfile, dump the stats to pstats_path and return the result
+    along with a report of the top functions by cumulative time.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args)
+    profiler.dump_stats(str(pstats_path))
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+    return result, report.getvalue()
+
+
+class _PeakSampler(threading.Thread):
+    """
+    Take a tracemalloc snapshot when the traced memory reaches a new high.
+
+    A snapshot taken once the function returned would only show what survived,
+    this gives an approximation of the allocation sites at the peak. A snapshot
+    walks all the traced blocks, so they are only taken when the memory grew by
+    PEAK_GROWTH, and far enough apart that they take a small fraction of the time:
+    the snapshot can be taken a bit before the actual peak.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.stopped = threading.Event()
+        self.highest = 0
+        self.next_snapshot_t = 0.0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def should_snapshot(self, current: int, now: float) -> bool:
+        return (
+            current > self.highest * (1 + PEAK_GROWTH) and now >= self.next_snapshot_t
+        )
+
+    def run(self):
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            now = time.perf_counter()
+            if self.should_snapshot(current, now):
+                self.highest = current
+                self.snapshot = tracemalloc.take_snapshot()
+                cost = time.perf_counter() - now
+                self.next_snapshot_t = now + max(
+                    MIN_SNAPSHOT_INTERVAL, SNAPSHOT_COST_RATIO * cost
+                )
+
+
+def trace_memory(fn: Callable[..., Any], *args: Any, top: int) -> Tuple[Any, str]:
+    """
+    Call fn with tracemalloc enabled and return the result along with a report of
+    the peak memory usage and the top allocation sites.
+    """
+    tracemalloc.start()
+    sampler = _PeakSampler()
+    sampler.start()
+    try:
+        result = fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        sampler.stopped.set()
+        sampler.join()
+        snapshot = sampler.snapshot or tracemalloc.take_snapshot()
+    finally:
+        sampler.stopped.set()
+        tracemalloc.stop()
+
+    # Filtering the statistics by line is much faster than filtering the traces
+    stats = [
+        stat
+        for stat in snapshot.statistics("lineno")
+        if not any(
+            fnmatch.fnmatch(stat.traceback[0].filename, pattern)
+            for pattern in HIDDEN_FILES
+        )
+    ]
+
+    lines = [f"Peak memory: {peak / 1024 / 1024:.2f} MiB"]
+    lines += [f"  {stat}" for stat in stats[:top]]
+
+    return result, "\n".join(lines)
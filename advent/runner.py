@@ -0,0 +1,81 @@
+"""
+Helpers to locate, load and run the solutions for a given day.
+
+Every day module exposes `first(reader)` and `second(reader)`. A day module can
+also implement the optional parse-once protocol:
+
+    parse(reader) -> parsed
+    solve_first(parsed)
+    solve_second(parsed)
+
+in which case the input is only parsed once and shared by both parts, so the
+solve functions must not mutate it.
+"""
+
+import importlib
+import pkgutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, List, Optional
+
+from advent import days
+
+PARTS = ("first", "second")
+
+
+@dataclass
+class PartResult:
+    """The outcome of running one part of a day."""
+
+    day_num: int
+    part: str
+    result: Any
+    duration: float
+
+
+def get_input_filename_for_day(day_num: int) -> Path:
+    """Return the Path to the input file for a given day."""
+    return Path(Path(__file__).parent.parent.absolute(), "data", f"day{day_num:02}.txt")
+
+
+def get_day_module(day_num: int) -> ModuleType:
+    """Import the module with the solutions for a given day."""
+    return importlib.import_module(f"advent.days.day{day_num:02}")
+
+
+def get_parse_hook(day_module: ModuleType) -> Optional[Callable[..., Any]]:
+    """Return the `parse` hook of a day module, or None if it doesn't implement it."""
+    return getattr(day_module, "parse", None)
+
+
+def available_days() -> List[int]:
+    """
+    List the days that have a solution.
+
+    The days package is scanned without importing the day modules.
+    """
+    return sorted(
+        int(m.name[3:])
+        for m in pkgutil.iter_modules(days.__path__)
+        if m.name.startswith("day") and m.name[3:].isdigit()
+    )
+
+
+def run_part(day_num: int, part: str) -> PartResult:
+    """
+    Run one part of a day against its input file.
+
+    This is a top-level function so it can be dispatched to worker processes.
+    """
+    # Not imported at the top, `advent --list` only needs to scan the days
+    from advent.io import MappedInput  # pylint: disable=import-outside-toplevel
+
+    day_module = get_day_module(day_num)
+
+    start_t = time.perf_counter()
+    with MappedInput.open(get_input_filename_for_day(day_num)) as reader:
+        result = getattr(day_module, part)(reader)
+
+    return PartResult(day_num, part, result, time.perf_counter() - start_t)
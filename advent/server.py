@@ -0,0 +1,213 @@
+"""
+A long lived solver service, so that requests don't pay for the interpreter
+startup and the imports of the day modules.
+
+The server listens on a Unix socket (or a local TCP port) and solves the requests
+in a pool of worker processes which preload every day module. A connection can
+carry any number of requests, each one being a JSON header line followed by the
+input bytes:
+
+    {"day": 1, "part": "first", "length": 1234}\\n<1234 bytes of input>
+
+and the server replies to each request with a JSON line, either
+`{"result": ..., "duration": ...}` or `{"error": "..."}`.
+"""
+
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Union
+
+from advent.cache import default_cache_dir
+from advent.io import MappedInput
+from advent.runner import PARTS, available_days, get_day_module
+
+# The preloaded day modules of a worker process
+_day_modules: Dict[int, ModuleType] = {}
+
+
+class SolverError(Exception):
+    """The server could not solve a request."""
+
+
+def default_socket_path() -> Path:
+    """The server socket, can be overridden with ADVENT_SOCKET."""
+    if "ADVENT_SOCKET" in os.environ:
+        return Path(os.environ["ADVENT_SOCKET"])
+    return Path(default_cache_dir(), "serve.sock")
+
+
+def preload_days() -> None:
+    for day_num in available_days():
+        _day_modules[day_num] = get_day_module(day_num)
+
+
+def solve(day_num: int, part: str, data: bytes) -> Dict[str, Any]:
+    """Solve one request in a worker, errors are returned rather than raised."""
+    try:
+        day_module = _day_modules[day_num]
+    except KeyError:
+        return {"error": f"No solution for day {day_num}"}
+
+    start_t = time.perf_counter()
+    try:
+        # Some solutions print progress, which must not end up in the replies
+        with contextlib.redirect_stdout(sys.stderr):
+            result = getattr(day_module, part)(MappedInput(data))
+    except Exception as ex:  # pylint: disable=broad-except
+        return {"error": repr(ex)}
+    return {"result": result, "duration": time.perf_counter() - start_t}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: Union["UnixSolverServer", "TCPSolverServer"]
+
+    def reply(self, response: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        for header in self.rfile:
+            try:
+                request = json.loads(header)
+                day_num, part = int(request["day"]), request["part"]
+                data = self.rfile.read(int(request["length"]))
+            except (ValueError, KeyError, TypeError) as ex:
+                # Without a valid length the rest of the stream can't be framed
+                self.reply({"error": f"Invalid request: {ex!r}"})
+                return
+
+            if part not in PARTS:
+                self.reply({"error": f"Invalid part '{part}'"})
+            else:
+                self.reply(self.server.solve_request(day_num, part, data))
+
+
+class SolverMixIn:
+    """
+    Solve the requests of a server in an executor, which is replaced with a new
+    one from make_executor if a worker dies and breaks the process pool.
+    """
+
+    def __init__(
+        self,
+        server_address: Any,
+        executor: Executor,
+        make_executor: Optional[Callable[[], Executor]] = None,
+    ):
+        self.executor = executor
+        self.make_executor = make_executor
+        self.executor_lock = threading.Lock()
+        super().__init__(server_address, RequestHandler)  # type: ignore[call-arg]
+
+    def solve_request(self, day_num: int, part: str, data: bytes) -> Dict[str, Any]:
+        """Solve a request in the executor, errors are returned rather than raised."""
+        executor = self.executor
+        try:
+            return executor.submit(solve, day_num, part, data).result()
+        except BrokenProcessPool as ex:
+            self.replace_executor(executor)
+            return {"error": repr(ex)}
+        except Exception as ex:  # pylint: disable=broad-except
+            return {"error": repr(ex)}
+
+    def replace_executor(self, broken: Executor) -> None:
+        # The requests that were running in the broken pool all end up here, only
+        # the first one replaces it
+        with self.executor_lock:
+            if self.executor is not broken or self.make_executor is None:
+                return
+            self.executor = self.make_executor()
+        broken.shutdown(wait=False)
+
+
+class UnixSolverServer(
+    SolverMixIn, socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: Path,
+        executor: Executor,
+        make_executor: Optional[Callable[[], Executor]] = None,
+    ):
+        if Path(path).is_socket():
+            # Left behind by a server that didn't shut down cleanly
+            Path(path).unlink()
+        super().__init__(str(path), executor, make_executor)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.server_address)
+
+
+class TCPSolverServer(SolverMixIn, socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        port: int,
+        executor: Executor,
+        make_executor: Optional[Callable[[], Executor]] = None,
+    ):
+        super().__init__(("127.0.0.1", port), executor, make_executor)
+
+
+def make_pool(jobs: Optional[int] = None) -> ProcessPoolExecutor:
+    """A process pool with the day modules preloaded and its workers started."""
+    # Forked workers inherit the modules, the initializer covers the other start methods
+    preload_days()
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=preload_days)
+    for future in [
+        executor.submit(os.getpid) for _ in range(jobs or os.cpu_count() or 1)
+    ]:
+        future.result()
+    return executor
+
+
+class Client:
+    """A connection to a solver server, on a Unix socket unless a port is given."""
+
+    def __init__(self, socket_path: Optional[Path] = None, port: Optional[int] = None):
+        if port is not None:
+            self.socket = socket.create_connection(("127.0.0.1", port))
+        else:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(str(socket_path or default_socket_path()))
+        self.reader = self.socket.makefile("rb")
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.reader.close()
+        self.socket.close()
+
+    def request(self, day_num: int, part: str, data: bytes) -> Dict[str, Any]:
+        header = json.dumps({"day": day_num, "part": part, "length": len(data)})
+        self.socket.sendall(header.encode() + b"\n" + data)
+        line = self.reader.readline()
+        if not line:
+            raise SolverError("The server closed the connection")
+        return json.loads(line)
+
+    def solve(self, day_num: int, part: str, data: bytes) -> Any:
+        response = self.request(day_num, part, data)
+        if "error" in response:
+            raise SolverError(response["error"])
+        return response["result"]
@@ -0,0 +1,65 @@
+"""
+Registry of the alternative implementations (strategies) of the parts of a day.
+
+A day module registers its implementations with the `strategy` decorator:
+
+    @strategy("first", "combinations")
+    def first_combinations(reader): ...
+
+Strategies take a reader, just like `first` and `second`. The default strategy of a
+part is whatever the module exposes as `first` or `second`, listed under its
+registered name when it is a registered strategy, and as "default" otherwise.
+"""
+
+from collections import defaultdict
+from types import ModuleType
+from typing import Any, Callable, DefaultDict, Dict
+
+from advent.runner import PARTS
+
+DEFAULT = "default"
+
+Solver = Callable[..., Any]
+
+# module name -> part -> strategy name -> implementation
+_REGISTRY: DefaultDict[str, DefaultDict[str, Dict[str, Solver]]] = defaultdict(
+    lambda: defaultdict(dict)
+)
+
+
+def strategy(part: str, name: str) -> Callable[[Solver], Solver]:
+    """Register the decorated function as the `name` strategy of a part."""
+    if part not in PARTS:
+        raise ValueError(f"Unknown part '{part}', expected one of {PARTS}")
+
+    def decorator(fn: Solver) -> Solver:
+        _REGISTRY[fn.__module__][part][name] = fn
+        return fn
+
+    return decorator
+
+
+def default_strategy_name(day_module: ModuleType, part: str) -> str:
+    """Return the name of the strategy used by the `first`/`second` of a module."""
+    default = getattr(day_module, part)
+    for name, fn in _REGISTRY[day_module.__name__][part].items():
+        if fn is default:
+            return name
+    return DEFAULT
+
+
+def get_strategies(day_module: ModuleType, part: str) -> Dict[str, Solver]:
+    """Return all the strategies of a part, the default one first."""
+    strategies = {default_strategy_name(day_module, part): getattr(day_module, part)}
+    strategies.update(_REGISTRY[day_module.__name__][part])
+    return strategies
+
+
+def get_strategy(day_module: ModuleType, part: str, name: str) -> Solver:
+    strategies = get_strategies(day_module, part)
+    if name not in strategies:
+        raise ValueError(
+            f"Unknown strategy '{name}' for {day_module.__name__}.{part}, "
+            f"expected one of {', '.join(strategies)}"
+        )
+    return strategies[name]
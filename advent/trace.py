@@ -0,0 +1,110 @@
+"""
+Record spans of the work done by the solutions, to export as a Chrome trace that
+can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+Tracing is disabled by default, like the counters in advent.metrics. Code is traced
+with the `span` context manager or the `traced` decorator, which both cost close
+to nothing when tracing is disabled:
+
+    @trace.traced("day20.parse_input")
+    def parse_input(puzzle_input): ...
+
+    with trace.span("solve", part="first"):
+        ...
+
+Spans are recorded as "complete" events of the Trace Event Format, nested spans
+show up as nested since they run on the same thread.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+ENABLED = False
+
+events: List[Dict[str, Any]] = []
+
+_NO_SPAN: ContextManager[None] = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: Dict[str, Any]):
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        end = time.perf_counter()
+        event = {
+            "name": self.name,
+            "cat": self.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": self.start * 1e6,
+            "dur": (end - self.start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if self.args:
+            event["args"] = self.args
+        events.append(event)
+
+
+def span(name: str, **args: Any) -> ContextManager[None]:
+    """A span of work, the keyword arguments are shown with it in the viewer."""
+    if not ENABLED:
+        return _NO_SPAN
+    return _Span(name, args)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorate a function to record a span for each of its calls."""
+
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with _Span(span_name, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def collect() -> Iterator[List[Dict[str, Any]]]:
+    """Trace from scratch within the block, yields the recorded events."""
+    global ENABLED  # pylint: disable=global-statement
+    previous, ENABLED = ENABLED, True
+    events.clear()
+    try:
+        yield events
+    finally:
+        ENABLED = previous
+
+
+def write_trace(file, trace_events: List[Dict[str, Any]], process_name: str) -> None:
+    """Write the events as a Chrome trace JSON file."""
+    metadata = {
+        "name": "process_name",
+        "ph": "M",
+        "pid": os.getpid(),
+        "args": {"name": process_name},
+    }
+    json.dump(
+        {"traceEvents": [metadata] + trace_events, "displayTimeUnit": "ms"},
+        file,
+        default=str,
+    )
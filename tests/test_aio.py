@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from advent.aio import Solver
+from advent.days import day09
+from advent.gen import generate
+from advent.server import SolverError
+
+EXAMPLE = "1721\n979\n366\n299\n675\n1456\n"
+
+# Takes about a second for the second part of day 9
+SLOW_INPUT = "".join(generate(9, 10000, 0))
+
+
+@pytest.fixture(name="solver")
+def fixture_solver():
+    solver = Solver(max_workers=2)
+    yield solver
+    solver.close()
+
+
+def test_solve(solver):
+    async def main():
+        return await asyncio.gather(
+            solver.solve(1, "first", EXAMPLE),
+            solver.solve(1, "second", EXAMPLE.encode()),
+        )
+
+    assert asyncio.run(main()) == [514579, 241861950]
+
+
+def test_solve_error(solver):
+    with pytest.raises(SolverError, match="ValueError"):
+        asyncio.run(solver.solve(1, "first", "1\n2\n"))
+
+
+def test_timeout(solver):
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(solver.solve(9, "second", SLOW_INPUT, timeout=0.01))
+
+
+def test_cancel_waiting_request():
+    solver = Solver(max_workers=1)
+
+    async def main():
+        slow = asyncio.ensure_future(solver.solve(9, "second", SLOW_INPUT))
+        waiting = asyncio.ensure_future(solver.solve(1, "first", EXAMPLE))
+        await asyncio.sleep(0.1)
+
+        # Only one request is in flight, the other one never reached the pool
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        assert await slow == day09.second(SLOW_INPUT.splitlines(True))
+        return await solver.solve(1, "first", EXAMPLE)
+
+    try:
+        assert asyncio.run(main()) == 514579
+    finally:
+        solver.close()
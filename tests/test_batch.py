@@ -0,0 +1,72 @@
+from advent.batch import default_chunksize, find_inputs, run_batch, solve_input
+from advent.days import day02, day22
+from advent.gen import generate
+
+
+def write_inputs(directory, day_num, count):
+    paths = []
+    for seed in range(count):
+        path = directory / f"input{seed:02}.txt"
+        path.write_text("".join(generate(day_num, 20, seed)))
+        paths.append(path)
+    return paths
+
+
+def test_find_inputs(tmp_path):
+    paths = write_inputs(tmp_path, 2, 3)
+    (tmp_path / "notes.md").write_text("")
+    (tmp_path / "sub").mkdir()
+
+    assert find_inputs([str(tmp_path)]) == sorted(paths + [tmp_path / "notes.md"])
+    assert find_inputs([str(tmp_path / "*.txt")]) == paths
+    assert find_inputs([str(paths[0]), str(paths[0])]) == paths[:1]
+    assert find_inputs([str(tmp_path / "missing*")]) == []
+
+
+def test_solve_input(tmp_path):
+    (path,) = write_inputs(tmp_path, 22, 1)
+    record = solve_input(day22, path)
+
+    with open(path) as reader:
+        assert record["first"] == day22.first(reader)
+    assert "second" in record and record["status"] == "ok"
+
+
+def test_solve_input_error(tmp_path):
+    path = tmp_path / "bad.txt"
+    path.write_text("garbage\n")
+    record = solve_input(day02, path, ["first"])
+    assert "first" not in record
+    assert record["status"] == "error"
+    assert record["error"].startswith("ValueError")
+
+
+def test_run_batch(tmp_path):
+    paths = write_inputs(tmp_path, 2, 10)
+
+    records = list(run_batch(2, paths, ["first"], jobs=2, chunksize=3))
+
+    assert sorted(r["input"] for r in records) == [str(p) for p in paths]
+    for record in records:
+        with open(record["input"]) as reader:
+            assert record["first"] == day02.first(reader)
+
+
+def test_default_chunksize():
+    assert default_chunksize(1, 8) == 1
+    assert default_chunksize(1000, 4) == 62
+    assert default_chunksize(10**6, 4) == 64
+
+
+def test_solve_input_limits(tmp_path):
+    (path,) = write_inputs(tmp_path, 2, 1)
+    record = solve_input(day02, path, limits={"timeout": 10})
+    with open(path) as reader:
+        assert record["first"] == day02.first(reader)
+    assert record["status"] == "ok"
+
+    path = tmp_path / "bad.txt"
+    path.write_text("garbage\n")
+    record = solve_input(day02, path, limits={"timeout": 10})
+    assert record["status"] == "error"
+    assert record["error"].startswith("ValueError")
@@ -0,0 +1,90 @@
+import pytest
+
+from advent.bench import (
+    ImportTime,
+    fit_power_law,
+    parse_importtime,
+    percentile,
+    summarize,
+    time_part,
+)
+from advent.io import MappedInput, ints
+
+
+@pytest.mark.parametrize(
+    "samples, pct, expected",
+    [
+        ([1, 2, 3, 4, 5], 0, 1),
+        ([1, 2, 3, 4, 5], 50, 3),
+        ([1, 2, 3, 4, 5], 100, 5),
+        ([1, 2, 3, 4], 50, 2.5),
+        ([5, 1, 4, 2, 3], 95, 4.8),
+        ([7], 95, 7),
+    ],
+)
+def test_percentile(samples, pct, expected):
+    assert percentile(samples, pct) == pytest.approx(expected)
+
+
+def test_summarize():
+    s = summarize(1, "first", 42, [3.0, 1.0, 2.0])
+    assert s.min_us == 1.0
+    assert s.median_us == 2.0
+    assert s.stddev_us == pytest.approx(1.0)
+    assert s.to_dict()["result"] == 42
+
+
+def test_time_part():
+    calls = []
+
+    def part_fn(lines):
+        calls.append(list(lines))
+        return len(calls)
+
+    result, samples = time_part(part_fn, ["1\n", "2\n"], warmup=2, repeat=3)
+
+    assert result == 5
+    assert len(samples) == 3
+    # Every run sees the full input
+    assert calls == [["1\n", "2\n"]] * 5
+
+
+def test_time_part_bytes():
+    readers = []
+
+    def part_fn(reader):
+        readers.append(reader)
+        return ints(reader)
+
+    result, _ = time_part(part_fn, b"1\n2\n", warmup=1, repeat=2)
+
+    assert result == [1, 2]
+    # Like the CLI, the parts get a mapped input, a new one for every run
+    assert all(isinstance(reader, MappedInput) for reader in readers)
+    assert len({id(reader) for reader in readers}) == 3
+
+
+@pytest.mark.parametrize("exponent", [1, 2, 3, 0.5])
+def test_fit_power_law(exponent):
+    sizes = [10, 20, 40, 80, 160]
+    timings = [3 * size ** exponent for size in sizes]
+    assert fit_power_law(sizes, timings) == pytest.approx(exponent)
+
+
+def test_fit_power_law_needs_two_sizes():
+    with pytest.raises(ValueError):
+        fit_power_law([10], [1.0])
+
+
+def test_parse_importtime():
+    output = """import time: self [us] | cumulative | imported package
+import time:       163 |        163 |   _io
+import time:       458 |        621 | io
+First: 42
+import time:      1038 |       1038 |     advent.runner
+"""
+    assert parse_importtime(output) == [
+        ImportTime("_io", 163, 163, 1),
+        ImportTime("io", 458, 621, 0),
+        ImportTime("advent.runner", 1038, 1038, 2),
+    ]
@@ -0,0 +1,109 @@
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from advent.cache import MISSING, ResultCache, helper_modules, make_key
+from advent.days import day01, day03
+
+
+def test_get_put(tmp_path):
+    cache = ResultCache(tmp_path)
+
+    assert cache.get("abc", "first") is MISSING
+
+    cache.put("abc", "first", 42)
+    cache.put("abc", "second", "a,b,c")
+
+    assert cache.get("abc", "first") == 42
+    assert cache.get("abc", "second") == "a,b,c"
+
+
+def test_put_skips_non_json_results(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put("abc", "first", object())
+    assert cache.get("abc", "first") is MISSING
+
+
+@pytest.mark.parametrize("data", ["", "{", "[42]", "null", '{"value": 42}'])
+def test_get_invalid_entry(tmp_path, data):
+    cache = ResultCache(tmp_path)
+    cache.put("abc", "first", 42)
+    Path(tmp_path, "abc-first.json").write_text(data)
+    assert cache.get("abc", "first") is MISSING
+
+
+def test_get_evicted_entry(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path)
+    cache.put("abc", "first", 42)
+
+    def evicted(path):
+        raise FileNotFoundError(path)
+
+    # Evicted by another process between the read and the time bump
+    monkeypatch.setattr(os, "utime", evicted)
+    assert cache.get("abc", "first") is MISSING
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path)
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, "first", i)
+        os.utime(tmp_path / f"{key}-first.json", (i, i))
+
+    # Reading "a" makes it the most recently used
+    cache.get("a", "first")
+
+    entry_size = (tmp_path / "a-first.json").stat().st_size
+    cache.max_bytes = 2 * entry_size
+    cache.evict()
+
+    assert cache.get("a", "first") == 0
+    assert cache.get("b", "first") is MISSING
+    assert cache.get("c", "first") == 2
+
+
+def test_make_key(tmp_path):
+    input_filename = tmp_path / "input.txt"
+    input_filename.write_text("1721\n299\n")
+    key = make_key(day01, input_filename)
+
+    assert make_key(day01, input_filename) == key
+
+    input_filename.write_text("1721\n300\n")
+    assert make_key(day01, input_filename) != key
+
+
+def test_helper_modules():
+    assert [m.__name__ for m in helper_modules(day01)] == [
+        "advent.io",
+        "advent.strategies",
+    ]
+    assert [m.__name__ for m in helper_modules(day03)] == ["advent.grid"]
+
+
+def test_make_key_helper_changed(tmp_path, monkeypatch):
+    helper_file = tmp_path / "helper.py"
+    helper_file.write_text("def parse(): pass\n")
+    helper = types.ModuleType("advent._helper")
+    helper.__file__ = str(helper_file)
+    monkeypatch.setitem(sys.modules, "advent._helper", helper)
+
+    def parse():
+        pass
+
+    parse.__module__ = "advent._helper"
+    day_file = tmp_path / "day.py"
+    day_file.write_text("from advent._helper import parse\n")
+    day_module = types.ModuleType("advent.days._day")
+    day_module.__file__ = str(day_file)
+    day_module.parse = parse
+
+    input_filename = tmp_path / "input.txt"
+    input_filename.write_text("1721\n299\n")
+    key = make_key(day_module, input_filename)
+
+    helper_file.write_text("def parse(): return 1\n")
+    assert make_key(day_module, input_filename) != key
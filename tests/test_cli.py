@@ -0,0 +1,226 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from advent import runner
+from advent.cli import cli
+from advent.runner import available_days, run_part
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv("ADVENT_CACHE_DIR", str(path))
+    return path
+
+
+def test_list():
+    result = CliRunner().invoke(cli, ["--list"])
+    assert result.exit_code == 0
+    assert result.output.split() == [str(day_num) for day_num in available_days()]
+
+
+def imported_modules(args, env=None):
+    """The advent modules imported by running the CLI with args, in a new process."""
+    code = f"""
+import sys
+from advent.cli import cli
+try:
+    cli({args!r})
+except SystemExit:
+    pass
+print(",".join(sorted(m for m in sys.modules if m.startswith("advent."))))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return output.splitlines()[-1].split(",")
+
+
+def test_list_is_lazy():
+    assert imported_modules(["--list"]) == [
+        "advent.cli",
+        "advent.days",
+        "advent.runner",
+    ]
+
+
+def test_day_is_lazy(tmp_path):
+    env = dict(os.environ, ADVENT_CACHE_DIR=str(tmp_path))
+    helpers = {
+        "advent.limits",
+        "advent.metrics",
+        "advent.profiling",
+        "advent.strategies",
+        "advent.trace",
+    }
+
+    modules = set(imported_modules(["5"], env))
+    assert "advent.days.day05" in modules
+    assert not modules & helpers
+
+    modules = set(imported_modules(["5", "--no-cache"], env))
+    assert not modules & (helpers | {"advent.cache"})
+
+
+def test_bench_parse_only():
+    result = CliRunner().invoke(
+        cli, ["bench", "14", "--parse-only", "--repeat", "1", "--no-record"]
+    )
+    assert result.exit_code == 0, result.output
+    rows = result.output.splitlines()[1:]
+    assert [row.split()[:2] for row in rows] == [["14", "parse"]]
+
+
+def test_bench_parse_only_needs_a_parse_hook():
+    result = CliRunner().invoke(cli, ["bench", "1", "--parse-only", "--no-record"])
+    assert result.exit_code == 2
+    assert "--parse-only" in result.output
+
+
+def test_bench_strategy_timeout():
+    args = "bench 13 --all-strategies --timeout 0.5 --repeat 1 --no-record".split()
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    rows = {tuple(row.split()[1:3]): row for row in result.output.splitlines()[1:]}
+    assert "TIMEOUT" in rows["second", "brute"]
+    assert "TIMEOUT" not in rows["second", "crt"]
+
+
+def test_day1_queries():
+    args = "day1-queries --targets 100 --size 50 --repeat 1 -k 3".split()
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert "100 targets" in result.output
+
+
+def test_day_input(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1-3 a: abcde\n1-3 b: cdefg\n2-9 c: ccccccccc\n")
+
+    result = CliRunner().invoke(cli, ["2", "--input", str(path), "--no-cache"])
+    assert result.exit_code == 0, result.output
+    assert "First: 2 " in result.output
+    assert "Second: 1 " in result.output
+
+
+def test_bare_day_number(cache_dir):
+    bare = CliRunner().invoke(cli, ["1", "--no-cache"])
+    explicit = CliRunner().invoke(cli, ["day", "1", "--no-cache"])
+    assert bare.exit_code == explicit.exit_code == 0, bare.output
+    assert "First: 974304 " in bare.output
+    assert bare.output.splitlines()[:3] == explicit.output.splitlines()[:3]
+
+
+def test_day_cache(cache_dir):
+    result = CliRunner().invoke(cli, ["1"])
+    assert result.exit_code == 0, result.output
+    assert "(cached)" not in result.output
+
+    result = CliRunner().invoke(cli, ["1"])
+    assert result.exit_code == 0, result.output
+    assert "First: 974304 (cached)" in result.output
+    assert "Second: 236430480 (cached)" in result.output
+
+    result = CliRunner().invoke(cli, ["1", "--refresh"])
+    assert "(cached)" not in result.output
+
+
+def test_day_parse_hook(cache_dir):
+    result = CliRunner().invoke(cli, ["2", "--no-cache"])
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[2].startswith("Parse: ")
+    assert lines[3].startswith("First: 465 ")
+    assert lines[4].startswith("Second: 294 ")
+
+
+def test_day_strategy(cache_dir):
+    result = CliRunner().invoke(cli, ["1", "--strategy", "streaming"])
+    assert result.exit_code == 0, result.output
+    assert "First [streaming]: 974304 " in result.output
+    # Strategies don't use the cache
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+
+def test_day_unknown_strategy(cache_dir):
+    result = CliRunner().invoke(cli, ["1", "--strategy", "nope"])
+    assert result.exit_code == 2
+    assert "nope" in result.output
+
+
+def test_day_limits(cache_dir):
+    result = CliRunner().invoke(cli, ["1", "--no-cache", "--timeout", "60"])
+    assert result.exit_code == 0, result.output
+    assert "First: 974304 " in result.output
+
+
+def test_day_over_limits(cache_dir):
+    result = CliRunner().invoke(cli, ["15", "--no-cache", "--timeout", "0.05"])
+    assert result.exit_code == 1
+    assert "Second: TIMEOUT" in result.output
+
+
+def test_run_part():
+    result = run_part(1, "first")
+    assert (result.day_num, result.part, result.result) == (1, "first", 974304)
+    assert result.duration >= 0
+
+
+def test_all(monkeypatch):
+    monkeypatch.setattr("advent.cli.available_days", lambda: [1, 2])
+    result = CliRunner().invoke(cli, ["all", "--jobs", "2"])
+    assert result.exit_code == 0, result.output
+
+    rows = result.output.splitlines()[2:7]
+    assert rows[0].split() == ["Day", "Part", "Time", "Result"]
+    assert [row.split()[:2] + row.split()[3:] for row in rows[1:]] == [
+        ["1", "first", "974304"],
+        ["1", "second", "236430480"],
+        ["2", "first", "465"],
+        ["2", "second", "294"],
+    ]
+
+
+def test_all_fails_when_a_day_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr("advent.cli.available_days", lambda: [1])
+    monkeypatch.setattr(
+        runner, "get_input_filename_for_day", lambda day_num: tmp_path / "missing.txt"
+    )
+    result = CliRunner().invoke(cli, ["all", "--jobs", "1"])
+    assert result.exit_code == 1
+    assert "Error: FileNotFoundError" in result.output
+
+
+def test_day_trace(tmp_path):
+    path = tmp_path / "trace.json"
+    result = CliRunner().invoke(cli, ["2", "--no-cache", "--trace", str(path)])
+    assert result.exit_code == 0, result.output
+
+    names = {event["name"] for event in json.loads(path.read_text())["traceEvents"]}
+    assert {"day02.open", "day02.parse", "day02.first", "day02.second"} <= names
+
+
+def test_scale_strategy():
+    args = "scale 1 --strategy streaming --start 10 --steps 2 --repeat 1".split()
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert "Day 1 first [streaming]" in result.output
+    assert "Day 1 second [streaming]" in result.output
+    assert result.output.count("Exponent: ") == 2
+
+
+def test_scale_unknown_strategy():
+    result = CliRunner().invoke(cli, ["scale", "1", "--strategy", "nope"])
+    assert result.exit_code == 2
+    assert "nope" in result.output
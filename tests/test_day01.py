@@ -0,0 +1,119 @@
+import pytest
+
+from advent.days import day01
+from advent.days.day01 import (
+    ExpenseIndex,
+    find_pair_streaming,
+    find_sum,
+    find_triple_streaming,
+)
+
+EXAMPLE = """1721
+979
+366
+299
+675
+1456""".splitlines(keepends=True)
+
+
+@pytest.mark.parametrize("strategy", ["ksum", "streaming", "combinations"])
+def test_first(strategy):
+    assert getattr(day01, f"first_{strategy}")(EXAMPLE) == 514579
+
+
+@pytest.mark.parametrize("strategy", ["ksum", "streaming", "combinations"])
+def test_second(strategy):
+    assert getattr(day01, f"second_{strategy}")(EXAMPLE) == 241861950
+
+
+def test_no_solution():
+    with pytest.raises(ValueError):
+        day01.first(["1\n", "2\n"])
+    with pytest.raises(ValueError):
+        day01.second(["1\n", "2\n", "3\n"])
+
+
+@pytest.mark.parametrize(
+    "expenses, target, k, expected",
+    [
+        ([1721, 979, 366, 299, 675, 1456], 2020, 2, (299, 1721)),
+        ([1721, 979, 366, 299, 675, 1456], 2020, 3, (366, 675, 979)),
+        ([1, 2, 3, 4], 10, 4, (1, 2, 3, 4)),
+        ([1, 2, 3, 4], 4, 1, (4,)),
+        ([-5, 3, 12, 7], 10, 3, (-5, 3, 12)),
+        ([1, 2, 3], 100, 2, None),
+        ([], 0, 2, None),
+    ],
+)
+def test_find_sum(expenses, target, k, expected):
+    assert find_sum(expenses, target, k) == expected
+
+
+def test_find_sum_duplicates():
+    # A value can only be used as many times as it appears
+    assert find_sum([1010, 5], 2020, 2) is None
+    assert find_sum([1010, 5, 1010], 2020, 2) == (1010, 1010)
+    assert find_sum([10, 10, 20], 30, 3) is None
+    assert find_sum([10, 10, 10, 20], 30, 3) == (10, 10, 10)
+    assert find_sum([10] * 1000 + [5], 25, 3) == (5, 10, 10)
+
+
+def test_find_sum_invalid_k():
+    with pytest.raises(ValueError):
+        find_sum([1, 2], 3, 0)
+
+
+def test_expense_index_combinations():
+    index = ExpenseIndex([5, 1, 4, 2, 3, 3])
+
+    assert list(index.combinations(6, 2)) == [(1, 5), (2, 4), (3, 3)]
+    assert list(index.combinations(9, 3)) == [(1, 3, 5), (2, 3, 4)]
+    assert list(index.combinations(100, 2)) == []
+    assert index.find(7, 3) == (1, 2, 4)
+
+
+def test_expense_index_query():
+    index = ExpenseIndex([1721, 979, 366, 299, 675, 1456])
+
+    assert list(index.query([2020, 1, 1345], k=2)) == [
+        (2020, (299, 1721)),
+        (1345, (366, 979)),
+    ]
+
+
+def test_expense_index_query_is_lazy():
+    index = ExpenseIndex(range(1000))
+
+    def targets():
+        yield 10
+        raise AssertionError("Read past the first target")
+
+    assert next(index.query(targets(), k=3)) == (10, (0, 1, 9))
+
+
+def test_find_pair_streaming():
+    assert find_pair_streaming([1721, 979, 366, 299, 675, 1456]) == (1721, 299)
+    assert find_pair_streaming([1010, 5]) is None
+    assert find_pair_streaming([1010, 5, 1010]) == (1010, 1010)
+
+
+def test_find_triple_streaming():
+    assert find_triple_streaming([1721, 979, 366, 299, 675, 1456]) == (979, 366, 675)
+    assert find_triple_streaming([10, 10, 20], 30) is None
+    assert find_triple_streaming([10, 10, 10, 20], 30) == (10, 10, 10)
+    assert find_triple_streaming([5, 10, 5], 20) == (5, 10, 5)
+
+
+@pytest.mark.parametrize(
+    "find, head",
+    [
+        (find_pair_streaming, [5, 1010, 1010]),
+        (find_triple_streaming, [1000, 20, 1000]),
+    ],
+)
+def test_streaming_stops_at_the_match(find, head):
+    def expenses():
+        yield from head
+        raise AssertionError("Read past the match")
+
+    assert sum(find(expenses())) == 2020
@@ -2,6 +2,7 @@ import pytest
 
 from advent.days import day02
 from advent.days.day02 import PasswordPolicy
+from advent.io import MappedInput
 
 EXAMPLE = """1-3 a: abcde
 1-3 b: cdefg
@@ -38,3 +39,102 @@ def test_parse_policy(policy_str, expected):
 )
 def test_is_entry_valid_second(entry, expected):
     assert day02.is_entry_valid_second(entry) == expected
+
+
+def test_count_valid():
+    assert day02.count_valid(EXAMPLE) == (2, 1)
+    assert day02.count_valid(["\n", "1-20 x: xxxx\r\n", "  \n"]) == (1, 1)
+
+
+def test_count_valid_mapped_input():
+    data = "\n".join(EXAMPLE).encode()
+    assert day02.count_valid(MappedInput(data)) == (2, 1)
+
+
+@pytest.mark.parametrize(
+    "entry", ["1-3 a: abcde ", " 1-3 a: abcde", "\t1-3 a: abcde \r\n"]
+)
+def test_entry_with_blanks_around(entry):
+    assert day02.parse_entry(entry) == (PasswordPolicy(1, 3, "a"), "abcde")
+    assert day02.is_entry_valid_first(entry)
+    assert day02.count_valid([entry]) == (1, 1)
+    assert day02.count_valid(MappedInput(f"{entry}\n{entry}".encode())) == (2, 2)
+
+
+def test_password_with_a_space():
+    entry = "1-3 a: abc de"
+    with pytest.raises(ValueError, match="Unable to parse entry"):
+        day02.parse_entry(entry)
+    with pytest.raises(ValueError, match="Unable to parse entry"):
+        day02.count_valid([entry])
+    with pytest.raises(ValueError, match="Unable to parse entry"):
+        day02.count_valid(MappedInput(entry.encode()))
+
+
+@pytest.mark.parametrize(
+    "entries", [["1-3 a abcde"], MappedInput(b"1-3 a: abcde\nnope\n")]
+)
+def test_count_valid_invalid_entry(entries):
+    with pytest.raises(ValueError, match="Unable to parse entry"):
+        day02.count_valid(entries)
+
+
+@pytest.mark.parametrize("jobs, chunks", [(1, None), (2, 3), (3, 50)])
+def test_count_valid_parallel(tmp_path, jobs, chunks):
+    path = tmp_path / "input.txt"
+    entries = EXAMPLE + ["1-20 x: xxxx", "", "2-3 c: ccc"]
+    path.write_text("\n".join(entries * 20))
+
+    assert day02.count_valid_parallel(path, jobs, chunks) == day02.count_valid(
+        entries * 20
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_count_valid_parallel_invalid_entry(tmp_path, jobs):
+    path = tmp_path / "input.txt"
+    path.write_text("1-3 a: abcde\n" * 10 + "nope\n")
+
+    with pytest.raises(ValueError, match="Unable to parse entry"):
+        day02.count_valid_parallel(path, jobs, 4)
+
+
+def test_count_valid_chunked_from_the_current_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(day02, "PARALLEL_MIN_SIZE", 0)
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(EXAMPLE * 10))
+
+    with MappedInput.open(path) as reader:
+        assert day02.count_valid_chunked(reader) == (20, 10)
+    with MappedInput.open(path) as reader:
+        # The first entry is valid with both policies
+        next(reader)
+        assert day02.count_valid_chunked(reader) == (19, 9)
+
+
+def test_parallel_strategy(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(EXAMPLE))
+
+    with MappedInput.open(path) as reader:
+        assert day02.first_parallel(reader) == 2
+    assert day02.second_parallel(EXAMPLE) == 1
+
+
+def test_parse():
+    fields = [(1, 3, "a", "abcde"), (1, 3, "b", "cdefg"), (2, 9, "c", "ccccccccc")]
+    assert day02.parse(iter(EXAMPLE)) == fields
+    assert day02.parse(MappedInput("\n".join(EXAMPLE).encode())) == fields
+    with pytest.raises(ValueError, match="Unable to parse entry"):
+        day02.parse(MappedInput(b"1-3 a: abcde\nnope\n"))
+
+
+def test_parsed_input_is_shared():
+    entries = day02.parse(iter(EXAMPLE))
+    assert day02.solve_first(entries) == 2
+    assert day02.solve_second(entries) == 1
+
+
+def test_single_pass_strategy():
+    assert day02.first_single_pass(EXAMPLE) == 2
+    assert day02.second_single_pass(MappedInput("\n".join(EXAMPLE).encode())) == 1
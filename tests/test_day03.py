@@ -38,13 +38,13 @@ def test_get_grid() -> None:
     s = "...\nXXX\nX.X\n..XX".splitlines()
     g = get_grid(s)
 
-    assert g.data == list("...XXXX.X..XX")
+    assert g.to_lines() == ["...", "XXX", "X.X", "..X"]
     assert g.width == 3
     assert g.height == 4
 
 
 def test_get_cell() -> None:
     p = Position(1, 2)
-    g = Grid("..X.", 2, 2)
+    g = Grid.from_lines(["..", "X."])
 
     assert get_cell(g, p) == "X"
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from advent.days import day07
@@ -58,3 +60,11 @@ faded blue bags contain no other bags.""".splitlines(
 )
 def test_get_count_and_color(bag_match, expected):
     assert day07.get_count_and_color(bag_match) == expected
+
+
+def test_parsed_input_is_shared():
+    rules = day07.parse(iter(EXAMPLE))
+    snapshot = copy.deepcopy(rules)
+    assert day07.solve_first(rules) == 4
+    assert rules == snapshot
+    assert day07.solve_second(rules) == 32
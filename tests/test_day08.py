@@ -1,3 +1,5 @@
+import copy
+
 from advent.days import day08
 
 EXAMPLE = """nop +0
@@ -19,3 +21,11 @@ def test_first():
 
 def test_second():
     assert day08.second(EXAMPLE) == 8
+
+
+def test_parsed_input_is_shared():
+    instructions = day08.parse(iter(EXAMPLE))
+    snapshot = copy.deepcopy(instructions)
+    assert day08.solve_first(instructions) == 5
+    assert instructions == snapshot
+    assert day08.solve_second(instructions) == 8
@@ -35,3 +35,13 @@ def test_find_contiguous_sum_to():
         47,
         40,
     ]
+
+
+def test_parsed_input_is_shared():
+    # The real preamble is 25 numbers long, 100 is not the sum of two of them
+    numbers = day09.parse(f"{n}\n" for n in list(range(1, 26)) + [100])
+    snapshot = list(numbers)
+    assert day09.solve_first(numbers) == 100
+    assert numbers == snapshot
+    # 9 + 10 + ... + 16 == 100
+    assert day09.solve_second(numbers) == 9 + 16
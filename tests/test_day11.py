@@ -1,3 +1,5 @@
+import pytest
+
 from advent.days import day11
 
 EXAMPLE = """L.LL.LL.LL
@@ -22,11 +24,24 @@ def test_second():
     assert day11.second(EXAMPLE) == 26
 
 
-def test_get_first_seat_in_direction():
+def test_find_neighbors():
     puzzle_input = """.............
 .L.L.#.#.#.#.
 .............""".splitlines(
         keepends=True
     )
     waiting_area = day11.WaitingArea.from_input(puzzle_input, False, 5)
-    assert waiting_area.get_first_seat_in_direction(13, 0, 1) == day11.Cell.EMPTY
+    neighbor = waiting_area.neighbors[day11.DIRECTIONS.index((0, 1)), 13]
+    assert neighbor == 14
+    assert waiting_area.grid.cells.reshape(-1)[neighbor] == day11.Cell.EMPTY.value
+
+    # Only the next cell is seen in the first part
+    waiting_area = day11.WaitingArea.from_input(puzzle_input, True, 4)
+    assert waiting_area.neighbors[day11.DIRECTIONS.index((1, 1)), 13] == 27
+    # Past the last cell
+    assert waiting_area.neighbors[day11.DIRECTIONS.index((0, -1)), 13] == 39
+
+
+def test_from_input_unknown_cell():
+    with pytest.raises(ValueError, match="Unknown cell 'X'"):
+        day11.WaitingArea.from_input(["L.L", "LXL"], False, 5)
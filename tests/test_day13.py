@@ -1,6 +1,7 @@
 import pytest
 
 from advent.days import day13
+from advent.strategies import get_strategies
 
 EXAMPLE = """939
 7,13,x,x,59,x,31,19""".splitlines(
@@ -36,8 +37,17 @@ def test_second(busses: str, expected: int):
         ("7,13,5", 168),
         ("17,x,13,19", 3417),
         ("67,7,59,61", 754018),
+        ("x,17,x,13,19", 3416),
     ],
 )
 def test_second_brute(busses: str, expected: int):
     puzzle_input = ["1234", busses]
     assert day13.second_brute(puzzle_input) == expected
+
+
+def test_second_strategies_agree():
+    strategies = get_strategies(day13, "second")
+    assert list(strategies) == ["crt", "brute"]
+
+    puzzle_input = ["1234", "x,x,19,x,17,x,13"]
+    assert len({fn(puzzle_input) for fn in strategies.values()}) == 1
@@ -65,3 +65,17 @@ def test_overwrite_bit(num_str, bit_value, bit_position, expected):
     assert str(bin(day14.overwrite_bit(num, bit_value, bit_position))) == str(
         bin(day14.binstr_to_int(expected))
     )
+
+
+def test_parse_program():
+    assert day14.parse_program(EXAMPLE) == [
+        ("mask", "XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X"),
+        ("mem", 8, 11),
+        ("mem", 7, 101),
+        ("mem", 8, 0),
+    ]
+
+
+def test_parse_program_invalid():
+    with pytest.raises(ValueError):
+        day14.parse_program(["mem[8] = -1"])
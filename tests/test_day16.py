@@ -1,3 +1,5 @@
+import copy
+
 from advent.days import day16
 from advent.days.day16 import FieldRule
 
@@ -67,3 +69,11 @@ nearby tickets:
 
 def test_second():
     assert day16.second(iter(EXAMPLE_2)) == 1
+
+
+def test_parsed_input_is_shared():
+    parsed = day16.parse(iter(EXAMPLE))
+    snapshot = copy.deepcopy(parsed)
+    assert day16.solve_first(parsed) == 71
+    assert parsed == snapshot
+    assert day16.solve_second(parsed) == 1
@@ -1,16 +1,19 @@
 import pytest
 
 from advent.days.day20 import (
+    PIXELS,
     find_corners,
     first,
-    flip,
     is_there_a_monster,
     make_image,
+    parse,
     parse_input,
-    rotate,
     second,
+    solve_first,
     solve_image,
+    solve_second,
 )
+from advent.grid import Grid
 
 EXAMPLE = """Tile 2311:
 ..##.#..#.
@@ -118,17 +121,17 @@ Tile 3079:
 #.#####.##
 ..#.###...
 ..#.......
-..#.###...""".splitlines(
-    keepends=True
-)
+..#.###...""".splitlines(keepends=True)
 
 
 def test_rotate():
-    assert rotate(["ABC", "DEF", "GHI"]) == ["GDA", "HEB", "IFC"]
+    grid = Grid.from_lines(["ABC", "DEF", "GHI"])
+    assert grid.rotate().to_lines() == ["GDA", "HEB", "IFC"]
 
 
 def test_flip():
-    assert flip(["ABC", "DEF", "GHI"]) == ["CBA", "FED", "IHG"]
+    grid = Grid.from_lines(["ABC", "DEF", "GHI"])
+    assert grid.flip().to_lines() == ["CBA", "FED", "IHG"]
 
 
 def test_parse_input():
@@ -173,7 +176,7 @@ EXPECTED_IMAGE = """.#.#..#.##...#.##..#####
 def test_make_image():
     tiles = parse_input(EXAMPLE)
     solution = solve_image(tiles)
-    assert make_image(solution) == flip(EXPECTED_IMAGE)
+    assert make_image(solution) == Grid.from_lines(EXPECTED_IMAGE, PIXELS).flip()
 
 
 @pytest.mark.parametrize(
@@ -186,10 +189,21 @@ def test_make_image():
 )
 def test_is_there_a_monster(row, column, expected):
     # This matches the image in the example where the monster is found
-    image_with_monsters = flip(rotate(EXPECTED_IMAGE))
+    image_with_monsters = Grid.from_lines(EXPECTED_IMAGE, PIXELS).rotate().flip()
 
     assert is_there_a_monster(image_with_monsters, row, column) == expected
 
 
 def test_second():
     assert second(EXAMPLE) == 273
+
+
+def test_parsed_input_is_shared():
+    def snapshot(tiles):
+        return [(t.id, t.data.to_lines(), sorted(t.states)) for t in tiles]
+
+    tiles = parse(iter(EXAMPLE))
+    before = snapshot(tiles)
+    assert solve_first(tiles) == 20899048083289
+    assert snapshot(tiles) == before
+    assert solve_second(tiles) == 273
@@ -8,6 +8,9 @@ from advent.days.day22 import (
     score,
     play_recursive_combat,
     hash_round,
+    parse,
+    solve_first,
+    solve_second,
 )
 
 EXAMPLE = """Player 1:
@@ -60,3 +63,9 @@ def test_play_recursive_combat_previous_rounds():
 
 def test_second():
     assert second(EXAMPLE) == 291
+
+
+def test_parsed_input_is_shared():
+    decks = parse(iter(EXAMPLE))
+    assert solve_first(decks) == 306
+    assert solve_second(decks) == 291
@@ -0,0 +1,63 @@
+import pytest
+
+from advent.days import day01, day05, day08
+from advent.gen import generate, make_word
+from advent.runner import PARTS, available_days, get_day_module
+
+SIZES = {5: 100, 11: 10, 13: 8, 15: 5, 17: 8, 20: 3, 21: 30, 22: 10}
+
+# 30 million turns, whatever the input
+SLOW = {(15, "second")}
+
+
+@pytest.mark.parametrize(
+    "day_num, part",
+    [(day_num, part) for day_num in available_days() for part in PARTS],
+)
+def test_generated_input_is_solvable(day_num, part):
+    if (day_num, part) in SLOW:
+        pytest.skip("Too slow")
+
+    lines = list(generate(day_num, SIZES.get(day_num, 50), seed=1))
+    assert all(line.endswith("\n") for line in lines)
+
+    getattr(get_day_module(day_num), part)(iter(lines))
+
+
+@pytest.mark.parametrize("day_num", available_days())
+def test_generate_is_deterministic(day_num):
+    size = SIZES.get(day_num, 50)
+    assert list(generate(day_num, size, seed=3)) == list(generate(day_num, size, 3))
+    assert list(generate(day_num, size, seed=3)) != list(generate(day_num, size, 4))
+
+
+def test_day01_unique_answer():
+    lines = list(generate(1, 1000, seed=1))
+    expenses = [int(line) for line in lines]
+    pairs = [
+        (a, b)
+        for i, a in enumerate(expenses)
+        for b in expenses[i + 1 :]
+        if a + b == 2020
+    ]
+    assert len(pairs) == 1
+    assert day01.first(lines) == pairs[0][0] * pairs[0][1]
+
+
+def test_day05_missing_seat():
+    lines = list(generate(5, 500, seed=1))
+    assert len(lines) == 500
+    assert day05.second(lines) not in {
+        day05.Seat.parse_boarding_pass(l.strip()).seat_id for l in lines
+    }
+
+
+def test_day08_only_the_last_instruction_is_fixable():
+    lines = list(generate(8, 200, seed=1))
+    assert day08.second(lines) == day08.first(lines)
+
+
+def test_make_word():
+    words = [make_word(n) for n in range(1000)]
+    assert len(set(words)) == 1000
+    assert all(len(w) >= 3 and w.isalpha() for w in words)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from advent.grid import Grid, count_neighbors
+
+CODES = {".": 0, "#": 1}
+
+
+def test_from_lines():
+    grid = Grid.from_lines(["#..\n", ".#.\n", "\n"], CODES)
+
+    assert grid.cells.dtype == np.uint8
+    assert grid.cells.tolist() == [[1, 0, 0], [0, 1, 0]]
+    assert grid.height == 2
+    assert grid.width == 3
+
+
+def test_from_lines_ascii():
+    grid = Grid.from_lines(["AB", "CD"])
+
+    assert grid[1, 0] == ord("C")
+    assert grid.to_lines() == ["AB", "CD"]
+
+
+def test_from_lines_uneven():
+    with pytest.raises(ValueError):
+        Grid.from_lines(["...", ".."])
+
+
+def test_from_lines_strict():
+    assert Grid.from_lines(["#?"], CODES).cells.tolist() == [[1, 0]]
+    with pytest.raises(ValueError, match="Unknown cell '\\?'"):
+        Grid.from_lines(["#?"], CODES, strict=True)
+
+
+def test_to_lines():
+    lines = ["#..", ".##"]
+    assert Grid.from_lines(lines, CODES).to_lines(CODES) == lines
+
+
+def test_slicing():
+    grid = Grid.from_lines(["ABC", "DEF", "GHI"])
+
+    assert grid[1:, :2] == Grid.from_lines(["DE", "GH"])
+
+
+def test_wrap():
+    grid = Grid.from_lines(["AB", "CD"])
+
+    assert chr(grid.wrap(1, 4)) == "C"
+    assert chr(grid.wrap(-1, -1)) == "D"
+    assert grid.wrap(np.arange(3), np.arange(3)).tolist() == [ord(c) for c in "ADA"]
+
+
+def test_rotate():
+    grid = Grid.from_lines(["ABC", "DEF", "GHI"])
+
+    assert grid.rotate().to_lines() == ["GDA", "HEB", "IFC"]
+    assert grid.rotate(4) == grid
+    assert np.shares_memory(grid.rotate().cells, grid.cells)
+
+
+def test_flip():
+    grid = Grid.from_lines(["ABC", "DEF", "GHI"])
+
+    assert grid.flip().to_lines() == ["CBA", "FED", "IHG"]
+    assert np.shares_memory(grid.flip().cells, grid.cells)
+
+
+def test_orientations():
+    grid = Grid.from_lines(["AB", "CD"])
+    orientations = {"".join(g.to_lines()) for g in grid.orientations()}
+
+    assert len(orientations) == 8
+
+
+def test_count_neighbors():
+    grid = Grid.from_lines(["##.", "...", "..#"], CODES)
+
+    assert grid.count_neighbors(1).tolist() == [[1, 1, 1], [2, 3, 2], [0, 1, 0]]
+
+
+def test_count_neighbors_3d():
+    cubes = np.ones((3, 3, 3), dtype=np.uint8)
+    counts = count_neighbors(cubes)
+
+    assert counts[1, 1, 1] == 26
+    assert counts[0, 0, 0] == 7
@@ -0,0 +1,46 @@
+import pytest
+
+from advent.bench import summarize
+from advent.history import History, hash_input, mann_whitney_u
+
+
+def test_mann_whitney_u_clearly_slower():
+    u, p = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+    assert u == 25
+    assert p < 0.01
+
+
+def test_mann_whitney_u_clearly_faster():
+    u, p = mann_whitney_u([6, 7, 8, 9, 10], [1, 2, 3, 4, 5])
+    assert u == 0
+    assert p > 0.99
+
+
+def test_mann_whitney_u_identical():
+    u, p = mann_whitney_u([3, 3, 3], [3, 3, 3])
+    assert u == 4.5
+    assert p == 1.0
+
+
+def test_mann_whitney_u_empty():
+    with pytest.raises(ValueError):
+        mann_whitney_u([], [1])
+
+
+def test_hash_input():
+    assert hash_input(["a\n", "b\n"]) == hash_input(iter(["a\n", "b\n"]))
+    assert hash_input(["a\n", "b\n"]) != hash_input(["a\n", "c\n"])
+    assert hash_input(b"a\nb\n") == hash_input(["a\n", "b\n"])
+
+
+def test_record_and_samples(tmp_path):
+    history = History(tmp_path / "history.sqlite")
+    history.record(summarize(1, "first", 42, [1.0, 2.0]), "default", "abc", "rev1")
+    history.record(summarize(1, "first", 42, [3.0, 4.0]), "default", "abc", "rev1")
+    history.record(summarize(1, "first", 42, [5.0]), "default", "abc", "rev2")
+
+    assert history.samples(1, "first", "default", "abc", "rev1") == [3.0, 4.0]
+    assert history.samples(1, "first", "default", "abc", "rev2") == [5.0]
+    assert history.samples(1, "first", "default", "other", "rev1") == []
+    assert history.samples(1, "second", "default", "abc", "rev1") == []
+    history.close()
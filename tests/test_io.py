@@ -0,0 +1,123 @@
+import mmap
+
+from advent.io import MappedInput, ints, map_range, records, split_lines
+
+EXAMPLE = "\na b\nc\n\n\nd\n\ne f\n"
+
+
+def test_records():
+    assert list(records(EXAMPLE.splitlines(keepends=True))) == [
+        ["a b", "c"],
+        ["d"],
+        ["e f"],
+    ]
+
+
+def test_records_without_trailing_newline():
+    assert list(records(["a\n", "\n", "b"])) == [["a"], ["b"]]
+
+
+def test_records_empty():
+    assert not list(records([]))
+    assert not list(records(["\n", "\n"]))
+
+
+def test_records_is_lazy():
+    def lines():
+        yield "a\n"
+        yield "\n"
+        raise AssertionError("Read past the first record")
+
+    assert next(records(lines())) == ["a"]
+
+
+def test_records_mmap(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(EXAMPLE)
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert list(records(m)) == [["a b", "c"], ["d"], ["e f"]]
+
+
+def test_mapped_input(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(EXAMPLE)
+
+    with MappedInput.open(path) as reader:
+        assert next(reader) == "\n"
+        assert list(reader) == EXAMPLE.splitlines(keepends=True)[1:]
+
+
+def test_mapped_input_empty(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("")
+
+    with MappedInput.open(path) as reader:
+        assert not list(reader)
+
+
+def test_ints(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1721\n-979\n\n366\n")
+
+    with MappedInput.open(path) as reader:
+        assert ints(reader) == [1721, -979, 366]
+    assert ints(MappedInput(b"12\n34")) == [12, 34]
+    assert ints(["1721\n", "-979\n", "\n", "366"]) == [1721, -979, 366]
+
+
+def test_ints_after_a_line():
+    reader = MappedInput(b"header\n1\n2\n")
+    assert next(reader) == "header\n"
+    assert ints(reader) == [1, 2]
+
+
+def test_split_lines(tmp_path):
+    path = tmp_path / "input.txt"
+    data = b"aaaa\nbb\nc\n\ndddddddd\ne"
+    path.write_bytes(data)
+
+    for chunks in range(1, 12):
+        ranges = split_lines(path, chunks)
+        assert 1 <= len(ranges) <= chunks
+        assert b"".join(data[start:end] for start, end in ranges) == data
+        assert all(data[start - 1 : start] == b"\n" for start, _ in ranges[1:])
+
+
+def test_split_lines_from_an_offset(tmp_path):
+    path = tmp_path / "input.txt"
+    data = b"aaaa\nbb\nc\n\ndddddddd\ne"
+    path.write_bytes(data)
+
+    assert split_lines(path, 1, 5) == [(5, len(data))]
+    for chunks in range(1, 6):
+        ranges = split_lines(path, chunks, 8)
+        assert ranges[0][0] == 8
+        assert b"".join(data[start:end] for start, end in ranges) == data[8:]
+    assert split_lines(path, 2, len(data)) == []
+
+
+def test_split_lines_empty(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+    assert split_lines(path, 4) == []
+
+
+def test_map_range(tmp_path):
+    path = tmp_path / "input.txt"
+    data = bytes(range(256)) * 1000
+    path.write_bytes(data)
+
+    with open(path, "rb") as f:
+        mapped, offset = map_range(f, 100000, 150000)
+        with mapped:
+            assert mapped[offset : offset + 50000] == data[100000:150000]
+
+
+def test_mapped_input_path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(EXAMPLE)
+
+    with MappedInput.open(path) as reader:
+        assert reader.path == str(path)
+    assert MappedInput(b"").path is None
@@ -0,0 +1,55 @@
+import os
+import signal
+import time
+
+from advent.limits import (
+    STATUS_ERROR,
+    STATUS_MEMORY,
+    STATUS_OK,
+    STATUS_TIMEOUT,
+    run_limited,
+)
+
+
+def test_ok():
+    outcome = run_limited(sum, [1, 2, 3], timeout=5, max_memory=2**30)
+    assert outcome.ok
+    assert outcome.status == STATUS_OK
+    assert outcome.result == 6
+    assert outcome.error is None
+
+
+def test_error():
+    outcome = run_limited(int, "abc")
+    assert outcome.status == STATUS_ERROR
+    assert outcome.error.startswith("ValueError")
+
+
+def test_timeout():
+    start_t = time.perf_counter()
+    outcome = run_limited(time.sleep, 10, timeout=0.2)
+    assert outcome.status == STATUS_TIMEOUT
+    assert outcome.error == "Timed out after 0.2s"
+    assert time.perf_counter() - start_t < 5
+
+
+def test_memory():
+    outcome = run_limited(bytearray, 2**30, max_memory=256 * 2**20)
+    assert outcome.status == STATUS_MEMORY
+    assert outcome.error == "Exceeded the memory limit of 256 MiB"
+
+
+def kill_self():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def test_killed():
+    outcome = run_limited(kill_self)
+    assert outcome.status == STATUS_ERROR
+    assert outcome.error == "Killed by SIGKILL"
+
+
+def test_unpicklable_result():
+    outcome = run_limited(lambda: lambda: None)
+    assert outcome.status == STATUS_ERROR
+    assert outcome.error.startswith("Unable to send the result")
@@ -0,0 +1,61 @@
+from advent import metrics
+from advent.days import day08, day22
+
+DAY08_EXAMPLE = """nop +0
+acc +1
+jmp +4
+acc +3
+jmp -3
+acc -99
+acc +1
+jmp -4
+acc +6""".splitlines(keepends=True)
+
+DAY22_EXAMPLE = """Player 1:
+9
+2
+6
+3
+1
+
+Player 2:
+5
+8
+4
+7
+10""".splitlines(keepends=True)
+
+
+def test_disabled_by_default():
+    assert not metrics.ENABLED
+    metrics.counters.clear()
+    day08.first(DAY08_EXAMPLE)
+    assert not metrics.counters
+
+
+def test_collect():
+    with metrics.collect() as counters:
+        assert metrics.ENABLED
+        assert day08.first(DAY08_EXAMPLE) == 5
+
+    assert not metrics.ENABLED
+    # Instructions 0, 1, 2, 6, 7, 3, 4 are run before looping back to 1
+    assert counters == {"day08.instructions": 7}
+
+
+def test_collect_resets_counters():
+    with metrics.collect():
+        day22.second(DAY22_EXAMPLE)
+    with metrics.collect() as counters:
+        day22.second(DAY22_EXAMPLE)
+    # The puzzle example plays 5 games, the fast mode skips some of the sub-game rounds
+    assert counters["day22.games"] == 5
+    assert counters["day22.rounds"] == 29
+
+
+def test_format_counters():
+    assert metrics.format_counters({"b": 1234, "aa": 5}).splitlines() == [
+        "aa               5",
+        "b            1,234",
+    ]
+    assert metrics.format_counters({}) == ""
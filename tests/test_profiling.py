@@ -0,0 +1,40 @@
+import pstats
+
+from advent.profiling import _PeakSampler, profile_call, trace_memory
+
+
+def allocate(n):
+    return sum(len(list(range(i))) for i in range(n))
+
+
+def test_profile_call(tmp_path):
+    pstats_path = tmp_path / "allocate.pstats"
+    result, report = profile_call(allocate, 100, pstats_path=pstats_path, top=5)
+
+    assert result == allocate(100)
+    assert "allocate" in report
+    assert pstats.Stats(str(pstats_path)).total_calls > 0
+
+
+def test_trace_memory():
+    result, report = trace_memory(allocate, 100, top=5)
+
+    assert result == allocate(100)
+    assert report.startswith("Peak memory: ")
+
+
+def test_trace_memory_hides_the_profiler():
+    _, report = trace_memory(allocate, 1000, top=50)
+    assert "advent/profiling.py" not in report
+
+
+def test_peak_sampler_throttles_snapshots():
+    sampler = _PeakSampler()
+    assert sampler.should_snapshot(1000, 0.0)
+
+    sampler.highest, sampler.next_snapshot_t = 1000, 5.0
+    # Not enough growth
+    assert not sampler.should_snapshot(1100, 10.0)
+    # Too soon
+    assert not sampler.should_snapshot(2000, 4.0)
+    assert sampler.should_snapshot(2000, 5.0)
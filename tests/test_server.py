@@ -0,0 +1,96 @@
+import json
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+import pytest
+
+from advent.days import day02
+from advent.server import (
+    Client,
+    SolverError,
+    UnixSolverServer,
+    make_pool,
+    preload_days,
+    solve,
+)
+
+EXAMPLE = b"1-3 a: abcde\n1-3 b: cdefg\n2-9 c: ccccccccc\n"
+
+
+@pytest.fixture(name="socket_path")
+def fixture_socket_path(tmp_path):
+    preload_days()
+    path = tmp_path / "serve.sock"
+    with ThreadPoolExecutor(2) as executor:
+        server = UnixSolverServer(path, executor)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield path
+        server.shutdown()
+        server.server_close()
+        thread.join()
+    assert not path.exists()
+
+
+def test_solve():
+    preload_days()
+    response = solve(2, "first", EXAMPLE)
+    assert response["result"] == day02.first(EXAMPLE.decode().splitlines(True))
+    assert response["duration"] >= 0
+
+    assert solve(99, "first", EXAMPLE) == {"error": "No solution for day 99"}
+    assert solve(2, "first", b"garbage\n")["error"].startswith("ValueError")
+
+
+def test_client(socket_path):
+    with Client(socket_path) as client:
+        # Several requests on the same connection
+        assert client.solve(2, "first", EXAMPLE) == 2
+        assert client.solve(2, "second", EXAMPLE) == 1
+
+        with pytest.raises(SolverError, match="Invalid part"):
+            client.solve(2, "third", EXAMPLE)
+        with pytest.raises(SolverError, match="ValueError"):
+            client.solve(2, "first", b"garbage\n")
+        assert client.solve(2, "first", EXAMPLE) == 2
+
+
+def test_invalid_header_closes_connection(socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(socket_path))
+        conn.sendall(b"not json\n")
+        reader = conn.makefile("rb")
+        assert "Invalid request" in json.loads(reader.readline())["error"]
+        assert reader.readline() == b""
+
+
+def test_executor_error_is_replied(tmp_path):
+    executor = ThreadPoolExecutor(1)
+    executor.shutdown()
+    server = UnixSolverServer(tmp_path / "serve.sock", executor)
+    try:
+        assert "RuntimeError" in server.solve_request(2, "first", EXAMPLE)["error"]
+    finally:
+        server.server_close()
+
+
+def test_broken_pool_is_replaced(tmp_path):
+    server = UnixSolverServer(
+        tmp_path / "serve.sock", make_pool(1), partial(make_pool, 1)
+    )
+    broken = server.executor
+    try:
+        # A worker dying breaks the pool
+        with pytest.raises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result()
+
+        assert "BrokenProcessPool" in server.solve_request(2, "first", EXAMPLE)["error"]
+        assert server.executor is not broken
+        assert server.solve_request(2, "first", EXAMPLE)["result"] == 2
+    finally:
+        server.server_close()
+        server.executor.shutdown()
@@ -0,0 +1,54 @@
+import types
+
+import pytest
+
+from advent.days import day01
+from advent.strategies import (
+    default_strategy_name,
+    get_strategies,
+    get_strategy,
+    strategy,
+)
+
+
+@strategy("first", "slow")
+def first_slow(reader):
+    return sum(int(line) for line in list(reader))
+
+
+@strategy("first", "fast")
+def first_fast(reader):
+    return sum(map(int, reader))
+
+
+# A day module made of the strategies registered in this module
+day_module = types.ModuleType(__name__)
+day_module.first = first_fast
+day_module.second = lambda reader: 0
+
+
+def test_get_strategies():
+    assert get_strategies(day_module, "first") == {
+        "fast": first_fast,
+        "slow": first_slow,
+    }
+    assert get_strategies(day_module, "second") == {"default": day_module.second}
+
+
+def test_default_strategy_name():
+    assert default_strategy_name(day_module, "first") == "fast"
+    assert default_strategy_name(day_module, "second") == "default"
+    assert default_strategy_name(day01, "first") == "ksum"
+
+
+def test_get_strategy():
+    assert get_strategy(day01, "second", "combinations") is day01.second_combinations
+    with pytest.raises(
+        ValueError, match="expected one of ksum, streaming, combinations"
+    ):
+        get_strategy(day01, "first", "nope")
+
+
+def test_unknown_part():
+    with pytest.raises(ValueError):
+        strategy("third", "fast")
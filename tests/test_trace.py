@@ -0,0 +1,70 @@
+import io
+import json
+
+from advent import trace
+from advent.days import day22
+
+DAY22_EXAMPLE = """Player 1:
+9
+2
+6
+3
+1
+
+Player 2:
+5
+8
+4
+7
+10""".splitlines(keepends=True)
+
+
+def test_disabled_by_default():
+    assert not trace.ENABLED
+    trace.events.clear()
+    with trace.span("nothing"):
+        day22.second(DAY22_EXAMPLE)
+    assert not trace.events
+
+
+def test_span():
+    with trace.collect() as events:
+        with trace.span("day01.outer", part="first"):
+            with trace.span("day01.inner"):
+                pass
+
+    assert not trace.ENABLED
+    inner, outer = events
+    assert (inner["name"], outer["name"]) == ("day01.inner", "day01.outer")
+    assert outer["cat"] == "day01" and outer["ph"] == "X"
+    assert outer["args"] == {"part": "first"}
+    assert "args" not in inner
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_traced_recursion():
+    with trace.collect() as events:
+        assert day22.second(DAY22_EXAMPLE) == 291
+
+    games = [e for e in events if e["name"] == "day22.play_recursive_combat"]
+    assert len(games) == 5
+    # The main game is the last to finish and contains all the sub-games
+    main_game = games[-1]
+    for game in games[:-1]:
+        assert main_game["ts"] <= game["ts"]
+        assert game["ts"] + game["dur"] <= main_game["ts"] + main_game["dur"]
+
+
+def test_write_trace():
+    with trace.collect() as events:
+        with trace.span("day01.first"):
+            pass
+
+    output = io.StringIO()
+    trace.write_trace(output, events, "advent 1")
+    trace_events = json.loads(output.getvalue())["traceEvents"]
+
+    assert trace_events[0]["ph"] == "M"
+    assert trace_events[0]["args"] == {"name": "advent 1"}
+    assert trace_events[1]["name"] == "day01.first"